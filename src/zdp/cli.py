@@ -8,6 +8,7 @@ from pathlib import Path
 from typing import Callable, Mapping, Sequence, TextIO
 
 import numpy as np
+import pandas as pd
 
 from .data import FailureSeriesType, load_failure_data
 from .models import (
@@ -24,13 +25,31 @@ from .models import (
     GM11Model,
     load_plugin_model_factories,
 )
+from .models.fitting import LIKELIHOODS
 from .reporting import ReportBuilder
-from .services import AnalysisService, WalkForwardConfig
+from .services import (
+    AnalysisService,
+    FitCache,
+    RankedModelResult,
+    WalkForwardConfig,
+    default_cache_dir,
+)
 from .services.experiments import default_experiment_config, export_experiment_zip
 from .services import load_experiment_zip
 
 ModelFactory = Callable[[], ReliabilityModel]
 
+_EXCEL_SUFFIXES = (".xls", ".xlsx")
+
+
+def _resolve_sheet(path: str, sheet: str) -> str | int:
+    """A sheet name as given; digits select a 0-based index unless a sheet has that name."""
+
+    if not sheet.isdigit():
+        return sheet
+    with pd.ExcelFile(path) as book:
+        return sheet if sheet in book.sheet_names else int(sheet)
+
 
 def _build_model_registry(args: argparse.Namespace) -> Mapping[str, tuple[str, ModelFactory]]:
     bp_config = BPConfig(
@@ -39,6 +58,8 @@ def _build_model_registry(args: argparse.Namespace) -> Mapping[str, tuple[str, M
         learning_rate=args.bp_lr,
         momentum=args.bp_momentum,
         train_split=args.bp_split,
+        patience=max(0, args.bp_patience),
+        min_delta=max(0.0, args.bp_min_delta),
     )
     svr_config = SVRConfig(
         kernel=args.svr_kernel,
@@ -49,15 +70,17 @@ def _build_model_registry(args: argparse.Namespace) -> Mapping[str, tuple[str, M
         svr_kernel=args.svr_kernel,
         svr_c=args.hybrid_svr_c,
         svr_epsilon=args.hybrid_svr_epsilon,
+        max_workers=args.hybrid_workers,
     )
+    nhpp = {"fit_method": args.nhpp_fit, "likelihood": args.nhpp_likelihood}
     return {
         "jm": (JelinskiMorandaModel.name, JelinskiMorandaModel),
         "jelinski-moranda": (JelinskiMorandaModel.name, JelinskiMorandaModel),
-        "go": (GoelOkumotoModel.name, GoelOkumotoModel),
-        "goel-okumoto": (GoelOkumotoModel.name, GoelOkumotoModel),
+        "go": (GoelOkumotoModel.name, lambda: GoelOkumotoModel(**nhpp)),
+        "goel-okumoto": (GoelOkumotoModel.name, lambda: GoelOkumotoModel(**nhpp)),
         "gm": (GM11Model.name, GM11Model),
-        "s-shaped": (SShapedModel.name, SShapedModel),
-        "s": (SShapedModel.name, SShapedModel),
+        "s-shaped": (SShapedModel.name, lambda: SShapedModel(**nhpp)),
+        "s": (SShapedModel.name, lambda: SShapedModel(**nhpp)),
         "bp": (BPNeuralNetworkModel.name, lambda: BPNeuralNetworkModel(bp_config)),
         "svr": (SupportVectorRegressionModel.name, lambda: SupportVectorRegressionModel(svr_config)),
         "hybrid": (EMDHybridModel.name, lambda: EMDHybridModel(hybrid_config)),
@@ -86,6 +109,13 @@ def build_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument("--time-column", help="Name of the column containing time values.")
     parser.add_argument("--value-column", help="Name of the column containing failure values.")
+    parser.add_argument(
+        "--sheet",
+        help=(
+            "Worksheet for Excel input: a sheet name, or a 0-based index when no sheet has "
+            "that name (default: first sheet that fits)."
+        ),
+    )
     parser.add_argument(
         "--model",
         dest="models",
@@ -112,6 +142,11 @@ def build_parser() -> argparse.ArgumentParser:
         default=1,
         help="Forecast horizon per split for walk-forward validation.",
     )
+    parser.add_argument(
+        "--cv-warm-start",
+        action="store_true",
+        help="Seed each walk-forward split from the previous split's fitted parameters.",
+    )
     parser.add_argument(
         "--rank-by",
         default="",
@@ -134,6 +169,26 @@ def build_parser() -> argparse.ArgumentParser:
         help="Export a reproducible experiment bundle zip (dataset.csv/config.json/results.json).",
     )
 
+    parser.add_argument(
+        "--nhpp-fit",
+        choices=["lsq", "mle"],
+        default="lsq",
+        help="Fitting method for Goel-Okumoto / S-shaped (least squares or profile MLE).",
+    )
+    parser.add_argument(
+        "--nhpp-likelihood",
+        choices=list(LIKELIHOODS),
+        default="auto",
+        help=(
+            "Likelihood for --nhpp-fit mle: grouped counts, exact failure times, or auto "
+            "(exact only with --exact-times and one failure per row)."
+        ),
+    )
+    parser.add_argument(
+        "--exact-times",
+        action="store_true",
+        help="The time column holds exact failure times rather than observation times.",
+    )
     parser.add_argument("--bp-hidden", type=int, default=16, help="Hidden nodes for BP model.")
     parser.add_argument("--bp-epochs", type=int, default=800, help="Epochs for BP model training.")
     parser.add_argument("--bp-lr", type=float, default=0.01, help="Learning rate for BP model.")
@@ -144,11 +199,23 @@ def build_parser() -> argparse.ArgumentParser:
         default=0.8,
         help="Train split ratio for BP model (0-1).",
     )
+    parser.add_argument(
+        "--bp-patience",
+        type=int,
+        default=0,
+        help="Stop BP training after this many checks without improvement (0=disabled).",
+    )
+    parser.add_argument(
+        "--bp-min-delta",
+        type=float,
+        default=0.0,
+        help="Minimum loss improvement that resets BP early-stopping patience.",
+    )
     parser.add_argument(
         "--svr-kernel",
-        choices=["rbf", "poly", "linear", "sigmoid"],
+        choices=["rbf", "poly", "linear", "sigmoid", "precomputed"],
         default="rbf",
-        help="Kernel for the SVR model.",
+        help="Kernel for the SVR model (precomputed = RBF via an explicit Gram matrix).",
     )
     parser.add_argument("--svr-c", type=float, default=10.0, help="Penalty term for SVR.")
     parser.add_argument("--svr-epsilon", type=float, default=0.01, help="Epsilon-insensitive loss width.")
@@ -159,6 +226,59 @@ def build_parser() -> argparse.ArgumentParser:
         default=0.01,
         help="SVR epsilon for hybrid model.",
     )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Print progress to stderr as each model finishes.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Fit models in parallel on this many worker processes (1 = sequential).",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse fits from the on-disk cache (~/.cache/zdp unless --cache-dir is given).",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help="Directory for the on-disk fit cache (implies --cache).",
+    )
+    parser.add_argument(
+        "--data-cache",
+        action="store_true",
+        help=(
+            "Keep a binary copy of the parsed dataset under datasets/ in the cache directory "
+            "and memory-map it on later runs while the file is unchanged."
+        ),
+    )
+    parser.add_argument(
+        "--model-timeout",
+        type=float,
+        default=None,
+        help="Per-model time budget in seconds; models over budget are skipped.",
+    )
+    parser.add_argument(
+        "--run-timeout",
+        type=float,
+        default=None,
+        help="Time budget in seconds for the whole run.",
+    )
+    parser.add_argument(
+        "--cv-workers",
+        type=int,
+        default=1,
+        help="Fit walk-forward splits on this many worker processes (ignored with --cv-warm-start).",
+    )
+    parser.add_argument(
+        "--hybrid-workers",
+        type=int,
+        default=1,
+        help="Threads used to fit hybrid IMF components and the GM residue concurrently.",
+    )
     return parser
 
 
@@ -231,6 +351,9 @@ def run_cli(
     if not args.path:
         print("[ZDP] Missing dataset path (or use --load-experiment).", file=stderr)
         return 2
+    if args.sheet is not None and Path(args.path).suffix.lower() not in _EXCEL_SUFFIXES:
+        print("[ZDP] --sheet only applies to Excel input (.xls/.xlsx).", file=stderr)
+        return 2
 
     try:
         dataset = load_failure_data(
@@ -238,10 +361,18 @@ def run_cli(
             series_type=series_type,
             time_column=args.time_column,
             value_column=args.value_column,
+            read_kwargs=(
+                None if args.sheet is None else {"sheet_name": _resolve_sheet(args.path, args.sheet)}
+            ),
+            sidecar=(
+                Path(args.cache_dir or default_cache_dir()) / "datasets" if args.data_cache else False
+            ),
         )
     except Exception as exc:  # pragma: no cover - argparse ensures usage
         print(f"[ZDP] Failed to load dataset: {exc}", file=stderr)
         return 1
+    if args.exact_times:
+        dataset = dataset.with_metadata(exact_failure_times=True)
 
     registry = _build_model_registry(args)
     default_models = ["jm", "go", "gm", "s-shaped", "svr", "bp", "hybrid"]
@@ -284,24 +415,55 @@ def run_cli(
             if plugin_model.supports(dataset.series_type):
                 selected_models.append(plugin_model)
 
-    service = AnalysisService(selected_models)
+    service = AnalysisService(
+        selected_models,
+        max_workers=max(1, int(args.workers)),
+        model_budget=args.model_timeout if args.model_timeout and args.model_timeout > 0 else None,
+        run_budget=args.run_timeout if args.run_timeout and args.run_timeout > 0 else None,
+        cache=FitCache(args.cache_dir) if args.cache or args.cache_dir else None,
+    )
 
     validation = WalkForwardConfig(
         enabled=bool(args.walk_forward),
         min_train_size=(args.cv_min_train if args.cv_min_train and args.cv_min_train > 0 else None),
         horizon=max(1, int(args.cv_horizon)),
+        warm_start=bool(args.cv_warm_start),
+        workers=max(1, int(args.cv_workers)),
     )
     rank_by = args.rank_by.strip() or None
     pi_alpha = None
     if args.prediction_interval_alpha is not None and args.prediction_interval_alpha > 0:
         pi_alpha = float(args.prediction_interval_alpha)
 
-    ranked = service.run(
+    stream = service.iter_run(
         dataset,
         validation=validation,
         rank_by=rank_by,
         prediction_interval_alpha=pi_alpha,
     )
+    done = 0
+    while True:
+        try:
+            item = next(stream)
+        except StopIteration as stop:
+            ranked: list[RankedModelResult] = stop.value
+            break
+        if args.verbose:
+            done += 1
+            print(
+                f"[ZDP] {item.result.model_name} finished in {item.seconds:.2f}s ({done}/{item.total})",
+                file=stderr,
+            )
+    if args.verbose and service.cache is not None:
+        print(
+            f"[ZDP] Fit cache {service.cache.directory}: "
+            f"{service.cache.hits} hits, {service.cache.misses} misses",
+            file=stderr,
+        )
+    for entry in service.diagnostics["skipped"]:
+        if entry["reason"] != "unsupported":
+            detail = f" ({entry['detail']})" if entry["detail"] and entry["reason"] == "error" else ""
+            print(f"[ZDP] Skipped {entry['model']}: {entry['reason']}{detail}", file=stderr)
     if not ranked:
         print("[ZDP] No model results generated.", file=stderr)
         return 4
@@ -356,6 +518,7 @@ def run_cli(
                     "enabled": bool(validation.enabled),
                     "min_train_size": validation.min_train_size,
                     "horizon": validation.horizon,
+                    "warm_start": validation.warm_start,
                 },
                 prediction_interval_alpha=pi_alpha,
             )
@@ -1,12 +1,19 @@
 """Data ingestion and preparation helpers for ZDP."""
 
 from .dataset import FailureDataset
+from .events import aggregate_failure_events, group_failure_events, load_failure_events
+from .grouped import FailureDatasetGroups, load_failure_datasets
 from .loader import load_failure_data, load_failure_dataframe
 from .types import FailureSeriesType
 
 __all__ = [
     "FailureDataset",
+    "FailureDatasetGroups",
     "FailureSeriesType",
+    "aggregate_failure_events",
+    "group_failure_events",
     "load_failure_data",
     "load_failure_dataframe",
+    "load_failure_datasets",
+    "load_failure_events",
 ]
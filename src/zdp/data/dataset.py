@@ -3,25 +3,51 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Mapping
+from typing import Any, Callable, Mapping
 
 import numpy as np
 
 from .types import FailureSeriesType
 
 
-@dataclass(frozen=True)
+def _frozen(data: Any) -> np.ndarray:
+    """``data`` as a read-only float array no other writable array can change."""
+
+    array = np.asarray(data, dtype=float)
+    base = array
+    while isinstance(base, np.ndarray) and not base.flags.writeable:
+        base = base.base
+    # Read-only all the way down (e.g. a read-only memory map): share it.
+    array = array.view() if not isinstance(base, np.ndarray) else array.copy()
+    array.setflags(write=False)
+    return array
+
+
+@dataclass(frozen=True, slots=True)
 class FailureDataset:
-    """Wraps a time series of failure measurements with minimal semantics."""
+    """Wraps a time series of failure measurements with minimal semantics.
+
+    ``time_axis`` and ``values`` are held as read-only float arrays, copied at
+    construction unless the input is already read-only all the way down (as
+    memory-mapped sidecars and grouped loader blocks are). Derived
+    series (:meth:`cumulative_failures`, :meth:`failure_intervals`,
+    :meth:`interval_prefix_sums`) are computed once per underlying dataset and
+    cached; :meth:`slice` and :meth:`with_metadata` return views that skip
+    validation, share the arrays without copying and reuse those caches (each
+    derived series of a prefix is the prefix of the full one).
+    """
 
     time_axis: np.ndarray
     values: np.ndarray
     series_type: FailureSeriesType
     metadata: Mapping[str, Any] = field(default_factory=dict)
+    _cache: dict[str, np.ndarray] = field(default_factory=dict, init=False, repr=False, compare=False)
+    # Dataset whose full-length arrays the cache entries were computed from.
+    _root: FailureDataset | None = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        time_axis = np.asarray(self.time_axis, dtype=float)
-        values = np.asarray(self.values, dtype=float)
+        time_axis = _frozen(self.time_axis)
+        values = _frozen(self.values)
         if time_axis.shape != values.shape:
             if values.ndim != 1:
                 raise ValueError("Values must be a 1-D array")
@@ -33,6 +59,33 @@ class FailureDataset:
         object.__setattr__(self, "time_axis", time_axis)
         object.__setattr__(self, "values", values)
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Caches are rebuilt on demand rather than pickled into worker processes.
+        return (FailureDataset, (self.time_axis, self.values, self.series_type, self.metadata))
+
+    def _view(self, stop: int, metadata: Mapping[str, Any]) -> "FailureDataset":
+        """Prefix view on already-validated arrays, sharing this dataset's caches."""
+
+        view = object.__new__(FailureDataset)
+        object.__setattr__(view, "time_axis", self.time_axis[:stop])
+        object.__setattr__(view, "values", self.values[:stop])
+        object.__setattr__(view, "series_type", self.series_type)
+        object.__setattr__(view, "metadata", metadata)
+        object.__setattr__(view, "_cache", self._cache)
+        object.__setattr__(view, "_root", self._root or self)
+        return view
+
+    def _derived(self, name: str, compute: Callable[["FailureDataset"], np.ndarray]) -> np.ndarray:
+        """Cached ``compute(root)`` for the full dataset, cut to this view's length."""
+
+        root = self._root or self
+        array = self._cache.get(name)
+        if array is None:
+            array = compute(root)
+            array.setflags(write=False)
+            self._cache[name] = array
+        return array if root is self else array[: self.size]
+
     @property
     def size(self) -> int:
         return self.values.size
@@ -62,14 +115,28 @@ class FailureDataset:
 
         if self.series_type == FailureSeriesType.CUMULATIVE_FAILURES:
             return self.values
-        return np.cumsum(self.values)
+        return self._derived("cumulative", lambda root: np.cumsum(root.values))
 
     def failure_intervals(self) -> np.ndarray:
         """Return the failure intervals regardless of representation."""
 
         if self.series_type == FailureSeriesType.TIME_BETWEEN_FAILURES:
             return self.values
-        return np.diff(np.insert(self.values, 0, 0.0))
+        return self._derived("intervals", lambda root: np.diff(np.insert(root.values, 0, 0.0)))
+
+    def interval_prefix_sums(self) -> tuple[np.ndarray, np.ndarray]:
+        """Running sums of the failure intervals ``x``: ``(sum x_i, sum i * x_i)``.
+
+        Entry ``k`` covers intervals ``0..k`` with 0-based ``i``, so the totals
+        for any prefix of length ``m`` are entry ``m - 1`` of either array.
+        """
+
+        def weighted(root: FailureDataset) -> np.ndarray:
+            intervals = root.failure_intervals()
+            return np.cumsum(np.arange(intervals.size, dtype=float) * intervals)
+
+        totals = self._derived("interval_sums", lambda root: np.cumsum(root.failure_intervals()))
+        return totals, self._derived("interval_weighted_sums", weighted)
 
     def detect_outliers(self, z_threshold: float = 3.0) -> np.ndarray:
         """Simple z-score based outlier detection mask."""
@@ -86,15 +153,10 @@ class FailureDataset:
 
         new_meta = dict(self.metadata)
         new_meta.update(extra)
-        return FailureDataset(
-            time_axis=self.time_axis,
-            values=self.values,
-            series_type=self.series_type,
-            metadata=new_meta,
-        )
+        return self._view(self.size, new_meta)
 
     def slice(self, stop: int) -> "FailureDataset":
-        """Return a prefix of this dataset.
+        """Return a zero-copy, read-only prefix of this dataset.
 
         Args:
             stop: Number of samples to keep from the start (like ``values[:stop]``).
@@ -102,12 +164,7 @@ class FailureDataset:
 
         if stop <= 0:
             raise ValueError("stop must be >= 1")
-        return FailureDataset(
-            time_axis=self.time_axis[:stop],
-            values=self.values[:stop],
-            series_type=self.series_type,
-            metadata=self.metadata,
-        )
+        return self._view(stop, self.metadata)
 
 
 __all__ = ["FailureDataset"]
@@ -0,0 +1,168 @@
+"""Many failure series from one table, grouped by a key column."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Hashable, Iterator, Mapping, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .dataset import FailureDataset
+from .loader import (
+    _EXCEL_EXTENSIONS,
+    DataFormatError,
+    _excel_kwargs,
+    _read_projected,
+    _resolve_series_type,
+    _resolve_time_column,
+    _sniff_columns,
+)
+from .types import FailureSeriesType
+
+
+class FailureDatasetGroups(Mapping[Hashable, FailureDataset]):
+    """Lazy ``key -> FailureDataset`` mapping over one sorted, read-only block.
+
+    Row 0 of ``block`` is the time axis and row ``1 + i`` holds
+    ``value_columns[i]``; rows are sorted by group and then by time, so every
+    dataset is a zero-copy view of a contiguous slice. Datasets are built on
+    first access and kept.
+    """
+
+    def __init__(
+        self,
+        block: np.ndarray,
+        bounds: np.ndarray,
+        groups: Sequence[Hashable],
+        value_columns: Sequence[str],
+        *,
+        has_time: bool,
+        series_type: FailureSeriesType | None,
+        metadata: Mapping[str, Any],
+    ) -> None:
+        self.block = block
+        self.bounds = bounds
+        self.groups = list(groups)
+        self.value_columns = list(value_columns)
+        self.has_time = has_time
+        self.series_type = series_type
+        self.metadata = dict(metadata)
+        single = len(self.value_columns) == 1
+        self._index: dict[Hashable, tuple[int, int]] = {}
+        for group_index, group in enumerate(self.groups):
+            for value_index, column in enumerate(self.value_columns):
+                key = group if single else (group, column)
+                self._index[key] = (group_index, value_index)
+        self._datasets: dict[Hashable, FailureDataset] = {}
+
+    def __getitem__(self, key: Hashable) -> FailureDataset:
+        cached = self._datasets.get(key)
+        if cached is not None:
+            return cached
+        group_index, value_index = self._index[key]
+        start, stop = int(self.bounds[group_index]), int(self.bounds[group_index + 1])
+        column = self.value_columns[value_index]
+        values = self.block[1 + value_index, start:stop]
+        time_axis = (
+            self.block[0, start:stop] if self.has_time else np.arange(1, stop - start + 1, dtype=float)
+        )
+        dataset = FailureDataset(
+            time_axis=time_axis,
+            values=values,
+            series_type=_resolve_series_type(column, values, self.series_type),
+            metadata={**self.metadata, "group": self.groups[group_index], "value_column": column},
+        )
+        self._datasets[key] = dataset
+        return dataset
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+
+def load_failure_datasets(
+    path: str | Path,
+    *,
+    group_by: str,
+    value_columns: Sequence[str] | None = None,
+    time_column: str | None = None,
+    series_type: FailureSeriesType | None = None,
+    read_kwargs: Mapping[str, object] | None = None,
+) -> FailureDatasetGroups:
+    """Read a table once and split it into one dataset per ``group_by`` key.
+
+    Only the group, time and value columns are read. ``value_columns`` defaults
+    to every numeric column except the group and time columns. With a single
+    value column the mapping is keyed by group; with several, by
+    ``(group, value_column)``. Keys are sorted, rows within a group are ordered
+    by time (file order without a time column), and rows with a missing group
+    key are dropped. Series types are inferred per dataset as in
+    :func:`~zdp.data.load_failure_data` unless ``series_type`` is given.
+    """
+
+    read_kwargs = dict(read_kwargs or {})
+    path = Path(path)
+    metadata: dict[str, Any] = {"path": str(path), "group_by": group_by}
+    if path.suffix.lower() in _EXCEL_EXTENSIONS:
+        required = [group_by, *(value_columns or []), *([time_column] if time_column else [])]
+        read_kwargs = _excel_kwargs(path, read_kwargs, required=required)
+        metadata["sheet"] = read_kwargs["sheet_name"]
+    columns, numeric_columns = _sniff_columns(path, read_kwargs)
+    metadata["columns"] = columns
+    if group_by not in columns:
+        raise DataFormatError(f"Group column '{group_by}' not present in file")
+    excluded = {group_by} if value_columns is None else {group_by, *value_columns}
+    resolved_time = _resolve_time_column(
+        [col for col in columns if col not in excluded], time_column, exclude=group_by
+    )
+    if value_columns is None:
+        value_columns = [col for col in numeric_columns if col not in (group_by, resolved_time)]
+        if not value_columns:
+            raise DataFormatError("No numeric columns detected for failure values")
+    else:
+        value_columns = list(value_columns)
+        for column in value_columns:
+            if column not in columns:
+                raise DataFormatError(f"Value column '{column}' not present in file")
+    wanted = [group_by, *([] if resolved_time is None else [resolved_time]), *value_columns]
+    frame = _read_projected(path, list(dict.fromkeys(wanted)), read_kwargs)
+
+    codes, groups = pd.factorize(frame[group_by].to_numpy(), sort=True)
+    keep = np.flatnonzero(codes >= 0)
+    codes = codes[keep]
+    if resolved_time is not None:
+        time_axis = frame[resolved_time].to_numpy(dtype=float)[keep]
+        order = np.argsort(time_axis, kind="stable")
+    else:
+        order = np.arange(keep.size)
+    code_dtype = np.uint16 if len(groups) <= np.iinfo(np.uint16).max else np.int64
+    order = order[np.argsort(codes.astype(code_dtype)[order], kind="stable")]
+    rows = keep[order]
+
+    block = np.empty((1 + len(value_columns), rows.size), dtype=float)
+    if resolved_time is not None:
+        block[0] = time_axis[order]
+    else:
+        block[0] = np.nan
+    for index, column in enumerate(value_columns):
+        try:
+            block[1 + index] = frame[column].to_numpy(dtype=float)[rows]
+        except (TypeError, ValueError) as exc:
+            raise DataFormatError(f"Non-numeric data in column '{column}': {exc}") from exc
+    block.setflags(write=False)
+    bounds = np.searchsorted(codes[order], np.arange(len(groups) + 1), side="left")
+    return FailureDatasetGroups(
+        block,
+        bounds,
+        groups.tolist(),
+        value_columns,
+        has_time=resolved_time is not None,
+        series_type=series_type,
+        metadata=metadata,
+    )
+
+
+__all__ = ["FailureDatasetGroups", "load_failure_datasets"]
@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Mapping
+from typing import Any, Mapping, Sequence
 
 import numpy as np
 import pandas as pd
 
 from .dataset import FailureDataset
+from .sidecar import read_sidecar, write_sidecar
 from .types import FailureSeriesType
 
 
@@ -34,23 +35,29 @@ _CUM_VALUE_CANDIDATES = {
     "nt",
     "mt",
 }
-SUPPORTED_EXTENSIONS = {".csv", ".txt", ".tsv", ".xls", ".xlsx"}
+_ARROW_EXTENSIONS = {".parquet", ".feather", ".arrow"}
+_CSV_EXTENSIONS = {".csv", ".txt", ".tsv"}
+_EXCEL_EXTENSIONS = {".xls", ".xlsx"}
+SUPPORTED_EXTENSIONS = {*_CSV_EXTENSIONS, *_EXCEL_EXTENSIONS, *_ARROW_EXTENSIONS}
+# Rows per chunk for streaming CSV reads; the first chunk also drives column inference.
+CSV_CHUNK_ROWS = 65_536
+# Rows parsed per worksheet to sniff its header and dtypes.
+EXCEL_SNIFF_ROWS = 256
 
 
 def load_failure_dataframe(path: str | Path, **read_kwargs: Mapping[str, object]) -> pd.DataFrame:
-    """Load a raw dataframe from CSV/Excel based on file extension."""
+    """Load a raw dataframe from CSV/Excel/Parquet/Feather based on file extension."""
 
     path = Path(path)
     suffix = path.suffix.lower()
     if suffix not in SUPPORTED_EXTENSIONS:
         raise DataFormatError(f"Unsupported file extension: {suffix}")
-    if suffix in {".xls", ".xlsx"}:
-        frame = pd.read_excel(path, **read_kwargs)
+    if suffix in _ARROW_EXTENSIONS:
+        frame = _read_arrow_table(path, **read_kwargs).to_pandas()
+    elif suffix in _EXCEL_EXTENSIONS:
+        frame = pd.read_excel(path, **_excel_kwargs(path, read_kwargs))
     else:
-        csv_kwargs = dict(read_kwargs)
-        if suffix == ".tsv":
-            csv_kwargs.setdefault("sep", "\t")
-        frame = pd.read_csv(path, **csv_kwargs)
+        frame = pd.read_csv(path, **_csv_kwargs(path, read_kwargs))
     if frame.empty:
         raise DataFormatError("Input file contains no rows")
     return frame
@@ -63,59 +70,335 @@ def load_failure_data(
     time_column: str | None = None,
     value_column: str | None = None,
     read_kwargs: Mapping[str, object] | None = None,
+    sidecar: bool | str | Path = False,
 ) -> FailureDataset:
-    """Load a failure dataset from disk with lightweight column inference."""
+    """Load a failure dataset from disk with lightweight column inference.
 
-    read_kwargs = dict(read_kwargs or {})
-    frame = load_failure_dataframe(path, **read_kwargs)
-    resolved_value = _resolve_value_column(frame, value_column)
-    resolved_time = _resolve_time_column(frame, time_column, exclude=resolved_value)
-
-    values = frame[resolved_value].to_numpy(dtype=float)
-    time_axis = (
-        frame[resolved_time].to_numpy(dtype=float)
-        if resolved_time is not None
-        else np.arange(1, values.size + 1, dtype=float)
-    )
+    Columns are resolved before the bulk read, so only the time/value columns
+    are materialized: Parquet/Feather/Arrow files from their schema (memory-mapped
+    where the format allows), CSV/TSV/TXT from a first chunk of
+    :data:`CSV_CHUNK_ROWS` rows, after which the rest is streamed in chunks into
+    preallocated float arrays. Excel workbooks use the calamine engine when
+    ``python-calamine`` is installed, else stream just the needed cell range
+    through openpyxl's read-only reader; without a ``sheet_name`` in
+    ``read_kwargs`` the first worksheet whose header fits is used (recorded as
+    ``metadata["sheet"]``).
 
-    # Prefer explicit series_type; else infer from column name, finally fallback to value monotonicity
-    if series_type is not None:
-        inferred_type = series_type
+    With ``sidecar`` set, the parsed arrays are also saved as a binary sidecar
+    (hidden files next to the input for ``True``, or in the given directory),
+    and later loads with the same arguments memory-map it read-only instead of
+    parsing, as long as the file's mtime and size are unchanged. A sidecar
+    directory is kept under :data:`~zdp.data.sidecar.SIDECAR_DIR_MAX_BYTES` by
+    evicting the least recently used sidecars.
+    """
+
+    read_kwargs = dict(read_kwargs or {})
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix not in SUPPORTED_EXTENSIONS:
+        raise DataFormatError(f"Unsupported file extension: {suffix}")
+    if sidecar is not False:
+        sidecar_dir = None if sidecar is True else Path(sidecar)
+        sidecar_args = {
+            "time_column": time_column,
+            "value_column": value_column,
+            "series_type": None if series_type is None else series_type.value,
+            "read_kwargs": read_kwargs,
+        }
+        cached = read_sidecar(path, sidecar_dir, sidecar_args)
+        if cached is not None:
+            return cached
+        stat = path.stat()
+    metadata: dict[str, Any] = {"path": str(path)}
+    if suffix in _ARROW_EXTENSIONS:
+        reader = _read_arrow_columns
+    elif suffix in _CSV_EXTENSIONS:
+        reader = _read_csv_columns
     else:
-        col_lower = resolved_value.lower().strip()
-        if col_lower in _TBF_VALUE_CANDIDATES:
-            inferred_type = FailureSeriesType.TIME_BETWEEN_FAILURES
-        elif col_lower in _CUM_VALUE_CANDIDATES:
-            inferred_type = FailureSeriesType.CUMULATIVE_FAILURES
-        else:
-            inferred_type = _infer_series_type(values)
+        reader = _read_excel_columns
+        read_kwargs = _excel_kwargs(path, read_kwargs, required=[c for c in (value_column, time_column) if c])
+        metadata["sheet"] = read_kwargs["sheet_name"]
+    columns, resolved_value, values, time_axis = reader(path, value_column, time_column, read_kwargs)
+    metadata["columns"] = columns
+    if time_axis is None:
+        time_axis = np.arange(1, values.size + 1, dtype=float)
+
     dataset = FailureDataset(
         time_axis=time_axis,
         values=values,
-        series_type=inferred_type,
-        metadata={"path": str(path), "columns": list(frame.columns)},
+        series_type=_resolve_series_type(resolved_value, values, series_type),
+        metadata=metadata,
     )
+    if sidecar is not False:
+        write_sidecar(path, sidecar_dir, sidecar_args, dataset, stat)
     return dataset
 
 
-def _resolve_time_column(frame: pd.DataFrame, explicit: str | None, *, exclude: str) -> str | None:
+def _sniff_columns(path: Path, read_kwargs: Mapping[str, Any]) -> tuple[list[str], list[str]]:
+    """Column names and the numeric subset, from the schema or a first chunk of rows."""
+
+    suffix = path.suffix.lower()
+    if suffix not in SUPPORTED_EXTENSIONS:
+        raise DataFormatError(f"Unsupported file extension: {suffix}")
+    if suffix in _ARROW_EXTENSIONS:
+        return _arrow_columns(path)
+    if suffix in _CSV_EXTENSIONS:
+        head_rows = min(CSV_CHUNK_ROWS, int(read_kwargs.get("nrows") or CSV_CHUNK_ROWS))
+        head = pd.read_csv(path, **{**_csv_kwargs(path, read_kwargs), "nrows": head_rows})
+    else:
+        head_rows = min(EXCEL_SNIFF_ROWS, int(read_kwargs.get("nrows") or EXCEL_SNIFF_ROWS))
+        head = pd.read_excel(path, **{**_excel_kwargs(path, read_kwargs), "nrows": head_rows})
+    if head.empty:
+        raise DataFormatError("Input file contains no rows")
+    columns = list(head.columns)
+    return columns, [col for col in columns if pd.api.types.is_numeric_dtype(head[col])]
+
+
+def _read_projected(path: Path, columns: Sequence[str], read_kwargs: Mapping[str, Any]) -> pd.DataFrame:
+    """Read only ``columns`` (in file order) through the format's own projection."""
+
+    key = "columns" if path.suffix.lower() in _ARROW_EXTENSIONS else "usecols"
+    return load_failure_dataframe(path, **{**read_kwargs, key: list(columns)})
+
+
+def _fast_excel_engine() -> str | None:
+    try:
+        import python_calamine  # noqa: F401
+    except ImportError:
+        return None  # pandas' default: openpyxl for .xlsx, xlrd for .xls
+    return "calamine"
+
+
+def _excel_kwargs(
+    path: Path, read_kwargs: Mapping[str, Any], *, required: Sequence[str] = ()
+) -> dict[str, Any]:
+    """``read_kwargs`` with an ``engine`` and a ``sheet_name`` filled in.
+
+    Without an explicit sheet, pandas' first-sheet default is kept for
+    single-sheet workbooks; otherwise the first sheet whose header holds every
+    ``required`` column and at least one numeric column is picked.
+    """
+
+    kwargs = dict(read_kwargs)
+    kwargs.setdefault("engine", _fast_excel_engine())
+    if "sheet_name" in kwargs:
+        return kwargs
+    parse_kwargs = {key: value for key, value in kwargs.items() if key != "engine"}
+    parse_kwargs["nrows"] = min(EXCEL_SNIFF_ROWS, int(kwargs.get("nrows") or EXCEL_SNIFF_ROWS))
+    with pd.ExcelFile(path, engine=kwargs["engine"]) as book:
+        sheets = book.sheet_names
+        kwargs["sheet_name"] = sheets[0] if sheets else 0
+        if len(sheets) > 1:
+            for sheet in sheets:
+                head = book.parse(sheet, **parse_kwargs)
+                if all(column in head.columns for column in required) and any(
+                    pd.api.types.is_numeric_dtype(head[column]) for column in head.columns
+                ):
+                    kwargs["sheet_name"] = sheet
+                    break
+    return kwargs
+
+
+def _stream_openpyxl_columns(
+    workbook: Any, sheet: str | int, wanted: Sequence[str]
+) -> list[np.ndarray] | None:
+    """Read ``wanted`` columns cell range only; ``None`` if the header is not a plain first row."""
+
+    worksheet = workbook[sheet] if isinstance(sheet, str) else workbook.worksheets[sheet]
+    header = next(worksheet.iter_rows(max_row=1, values_only=True), None)
+    if header is None:
+        return None
+    try:
+        positions = [list(header).index(column) for column in wanted]
+    except ValueError:
+        return None  # pandas renamed or synthesized a header; let it parse
+    first = min(positions)
+    rows = list(
+        worksheet.iter_rows(min_row=2, min_col=first + 1, max_col=max(positions) + 1, values_only=True)
+    )
+    arrays = []
+    for position in positions:
+        offset = position - first
+        arrays.append(
+            np.array([row[offset] if offset < len(row) else None for row in rows], dtype=float)
+        )
+    # Trailing rows left empty (formatting only) are not data.
+    filled = np.flatnonzero(~np.all(np.isnan(np.vstack(arrays)), axis=0))
+    stop = int(filled[-1]) + 1 if filled.size else 0
+    return [array[:stop] for array in arrays]
+
+
+def _read_excel_columns(
+    path: Path, value_column: str | None, time_column: str | None, read_kwargs: dict[str, Any]
+) -> tuple[list[str], str, np.ndarray, np.ndarray | None]:
+    """Sniff the header, then read only the time/value columns of one worksheet."""
+
+    kwargs = dict(read_kwargs)
+    sheet = kwargs.pop("sheet_name")
+    engine = kwargs.pop("engine", None)
+    with pd.ExcelFile(path, engine=engine) as book:
+        head_rows = min(EXCEL_SNIFF_ROWS, int(kwargs.get("nrows") or EXCEL_SNIFF_ROWS))
+        head = book.parse(sheet, **{**kwargs, "nrows": head_rows})
+        if head.empty:
+            raise DataFormatError("Input file contains no rows")
+        columns = list(head.columns)
+        numeric_columns = [col for col in columns if pd.api.types.is_numeric_dtype(head[col])]
+        resolved_value = _resolve_value_column(columns, numeric_columns, value_column)
+        resolved_time = _resolve_time_column(columns, time_column, exclude=resolved_value)
+        wanted = [resolved_value] if resolved_time is None else [resolved_value, resolved_time]
+        try:
+            arrays = None
+            if book.engine == "openpyxl" and not kwargs:
+                arrays = _stream_openpyxl_columns(book.book, sheet, wanted)
+            if arrays is None:
+                frame = book.parse(sheet, usecols=wanted, **kwargs)
+                arrays = [frame[column].to_numpy(dtype=float) for column in wanted]
+        except (TypeError, ValueError) as exc:
+            raise DataFormatError(f"Non-numeric data in column(s) {wanted}: {exc}") from exc
+    if arrays[0].size == 0:
+        raise DataFormatError("Input file contains no rows")
+    return columns, resolved_value, arrays[0], arrays[1] if resolved_time is not None else None
+
+
+def _csv_kwargs(path: Path, read_kwargs: Mapping[str, Any]) -> dict[str, Any]:
+    csv_kwargs = dict(read_kwargs)
+    if path.suffix.lower() == ".tsv":
+        csv_kwargs.setdefault("sep", "\t")
+    return csv_kwargs
+
+
+def _count_lines(path: Path, block_size: int = 1 << 20) -> int:
+    """Upper bound on the number of rows, from a constant-memory newline scan."""
+
+    count = 0
+    last = b""
+    with path.open("rb") as handle:
+        while block := handle.read(block_size):
+            count += block.count(b"\n")
+            last = block
+    return count + (1 if last and not last.endswith(b"\n") else 0)
+
+
+def _read_csv_columns(
+    path: Path, value_column: str | None, time_column: str | None, read_kwargs: dict[str, Any]
+) -> tuple[list[str], str, np.ndarray, np.ndarray | None]:
+    """Stream the resolved columns of a delimited file into preallocated arrays.
+
+    Peak memory is the output arrays plus one chunk of the selected columns.
+    """
+
+    columns, numeric_columns = _sniff_columns(path, read_kwargs)
+    resolved_value = _resolve_value_column(columns, numeric_columns, value_column)
+    resolved_time = _resolve_time_column(columns, time_column, exclude=resolved_value)
+    wanted = [resolved_value] if resolved_time is None else [resolved_value, resolved_time]
+
+    capacity = max(1, _count_lines(path))
+    buffers = {name: np.empty(capacity, dtype=float) for name in wanted}
+    filled = 0
+    csv_kwargs = _csv_kwargs(path, read_kwargs)
+    csv_kwargs.update(usecols=wanted, chunksize=CSV_CHUNK_ROWS)
+    try:
+        with pd.read_csv(path, **csv_kwargs) as chunks:
+            for chunk in chunks:
+                stop = filled + len(chunk)
+                if stop > capacity:  # only for exotic line endings the scan missed
+                    capacity = max(stop, 2 * capacity)
+                    for buffer in buffers.values():
+                        buffer.resize(capacity, refcheck=False)
+                for name, buffer in buffers.items():
+                    buffer[filled:stop] = chunk[name].to_numpy(dtype=float)
+                filled = stop
+    except (TypeError, ValueError) as exc:
+        raise DataFormatError(f"Non-numeric data in column(s) {wanted}: {exc}") from exc
+    if filled == 0:
+        raise DataFormatError("Input file contains no rows")
+    for buffer in buffers.values():
+        buffer.resize(filled, refcheck=False)
+    return columns, resolved_value, buffers[resolved_value], buffers.get(resolved_time)
+
+
+def _read_arrow_columns(
+    path: Path, value_column: str | None, time_column: str | None, read_kwargs: dict[str, Any]
+) -> tuple[list[str], str, np.ndarray, np.ndarray | None]:
+    columns, numeric_columns = _arrow_columns(path)
+    resolved_value = _resolve_value_column(columns, numeric_columns, value_column)
+    resolved_time = _resolve_time_column(columns, time_column, exclude=resolved_value)
+    projected = [resolved_value] if resolved_time is None else [resolved_value, resolved_time]
+    table = _read_arrow_table(path, columns=projected, **read_kwargs)
+    if table.num_rows == 0:
+        raise DataFormatError("Input file contains no rows")
+    values = _arrow_to_float(table.column(resolved_value))
+    time_axis = _arrow_to_float(table.column(resolved_time)) if resolved_time is not None else None
+    return columns, resolved_value, values, time_axis
+
+
+def _require_pyarrow() -> Any:
+    try:
+        import pyarrow
+    except ImportError as exc:  # pragma: no cover - optional dependency
+        raise RuntimeError("Parquet/Feather input requires the 'pyarrow' package") from exc
+    return pyarrow
+
+
+def _arrow_columns(path: Path) -> tuple[list[str], list[str]]:
+    """Column names and the numeric subset, read from the file schema only."""
+
+    pa = _require_pyarrow()
+    if path.suffix.lower() == ".parquet":
+        import pyarrow.parquet as pq
+
+        schema = pq.read_schema(path, memory_map=True)
+    else:
+        with pa.memory_map(str(path)) as source:
+            schema = pa.ipc.open_file(source).schema
+    numeric = [
+        field.name
+        for field in schema
+        if pa.types.is_integer(field.type)
+        or pa.types.is_floating(field.type)
+        or pa.types.is_boolean(field.type)
+        or pa.types.is_decimal(field.type)
+    ]
+    return list(schema.names), numeric
+
+
+def _read_arrow_table(path: Path, **read_kwargs: Any) -> Any:
+    """Read a Parquet/Feather/Arrow IPC file, memory-mapped, with optional ``columns``."""
+
+    _require_pyarrow()
+    if path.suffix.lower() == ".parquet":
+        import pyarrow.parquet as pq
+
+        return pq.read_table(path, memory_map=True, **read_kwargs)
+    import pyarrow.feather as feather
+
+    return feather.read_table(path, memory_map=True, **read_kwargs)
+
+
+def _arrow_to_float(column: Any) -> np.ndarray:
+    # Zero-copy for a single null-free float64 chunk; nulls become NaN as in pandas.
+    return np.asarray(column.to_numpy(), dtype=float)
+
+
+def _resolve_time_column(columns: Sequence[str], explicit: str | None, *, exclude: str) -> str | None:
     if explicit:
-        if explicit not in frame.columns:
+        if explicit not in columns:
             raise DataFormatError(f"Time column '{explicit}' not present in file")
         return explicit
-    lowercase_map = {col.lower().strip(): col for col in frame.columns if col != exclude}
+    lowercase_map = {col.lower().strip(): col for col in columns if col != exclude}
     for candidate in _TIME_CANDIDATES:
         if candidate in lowercase_map:
             return lowercase_map[candidate]
     return None
 
 
-def _resolve_value_column(frame: pd.DataFrame, explicit: str | None) -> str:
+def _resolve_value_column(
+    columns: Sequence[str], numeric_columns: Sequence[str], explicit: str | None
+) -> str:
     if explicit:
-        if explicit not in frame.columns:
+        if explicit not in columns:
             raise DataFormatError(f"Value column '{explicit}' not present in file")
         return explicit
-    numeric_columns = [col for col in frame.columns if pd.api.types.is_numeric_dtype(frame[col])]
     if not numeric_columns:
         raise DataFormatError("No numeric columns detected for failure values")
     lowercase_map = {col.lower().strip(): col for col in numeric_columns}
@@ -127,6 +410,20 @@ def _resolve_value_column(frame: pd.DataFrame, explicit: str | None) -> str:
     return numeric_columns[0]
 
 
+def _resolve_series_type(
+    column: str, values: np.ndarray, explicit: FailureSeriesType | None
+) -> FailureSeriesType:
+    # Prefer explicit series_type; else infer from column name, finally fallback to value monotonicity
+    if explicit is not None:
+        return explicit
+    col_lower = column.lower().strip()
+    if col_lower in _TBF_VALUE_CANDIDATES:
+        return FailureSeriesType.TIME_BETWEEN_FAILURES
+    if col_lower in _CUM_VALUE_CANDIDATES:
+        return FailureSeriesType.CUMULATIVE_FAILURES
+    return _infer_series_type(values)
+
+
 def _infer_series_type(values: np.ndarray) -> FailureSeriesType:
     if values.ndim != 1:
         raise DataFormatError("Failure values must be a 1-D array")
@@ -0,0 +1,145 @@
+"""Binary sidecars that let repeat loads of an unchanged file skip parsing."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Mapping
+
+import numpy as np
+
+from ..fileio import atomic_write
+from .dataset import FailureDataset
+from .types import FailureSeriesType
+
+_SIDECAR_VERSION = 2
+# Size cap of a sidecar directory; least recently used sidecars are evicted past it.
+SIDECAR_DIR_MAX_BYTES = 256 * 1024 * 1024
+
+
+def _sidecar_paths(path: Path, directory: Path | None, arguments: Mapping[str, Any]) -> tuple[Path, Path]:
+    """``(.npy, .json)`` locations: hidden files beside ``path``, or in ``directory``."""
+
+    payload: dict[str, Any] = {"version": _SIDECAR_VERSION, **arguments}
+    if directory is not None:
+        payload["path"] = str(path.resolve())
+    key = hashlib.sha256(json.dumps(payload, sort_keys=True, default=repr).encode()).hexdigest()
+    if directory is None:
+        stem = path.parent / f".{path.name}.{key[:16]}"
+    else:
+        stem = directory / key[:32]
+    return stem.with_name(stem.name + ".npy"), stem.with_name(stem.name + ".json")
+
+
+def _source_stamp(stat: os.stat_result) -> dict[str, int]:
+    return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+
+def read_sidecar(
+    path: Path, directory: Path | None, arguments: Mapping[str, Any]
+) -> FailureDataset | None:
+    """Memory-map a sidecar if it matches the file's current mtime and size."""
+
+    array_path, meta_path = _sidecar_paths(path, directory, arguments)
+    try:
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        if meta.get("version") != _SIDECAR_VERSION or meta.get("source") != _source_stamp(path.stat()):
+            return None
+        block = np.load(array_path, mmap_mode="r", allow_pickle=False)
+    except (OSError, ValueError):
+        return None
+    if block.shape != (2, meta.get("size")):
+        return None
+    if directory is not None:
+        _touch(meta_path)
+    return FailureDataset(
+        time_axis=block[0],
+        values=block[1],
+        series_type=FailureSeriesType(meta["series_type"]),
+        metadata={"path": str(path), **meta["metadata"]},
+    )
+
+
+def write_sidecar(
+    path: Path,
+    directory: Path | None,
+    arguments: Mapping[str, Any],
+    dataset: FailureDataset,
+    stat: os.stat_result,
+) -> bool:
+    """Store ``dataset`` for ``path`` as parsed at ``stat``; False if that is not possible.
+
+    ``stat`` must be taken before parsing, so a file modified mid-parse leaves
+    a sidecar that no longer matches.
+    """
+
+    array_path, meta_path = _sidecar_paths(path, directory, arguments)
+    meta = {
+        "version": _SIDECAR_VERSION,
+        "source": _source_stamp(stat),
+        "size": dataset.size,
+        "series_type": dataset.series_type.value,
+        "metadata": {key: value for key, value in dataset.metadata.items() if key != "path"},
+    }
+    try:
+        encoded = json.dumps(meta).encode("utf-8")
+        array_path.parent.mkdir(parents=True, exist_ok=True)
+        # Array first, then metadata: a reader never pairs new metadata with an old array.
+        block = np.vstack((dataset.time_axis, dataset.values))
+        atomic_write(array_path, lambda handle: np.save(handle, block))
+        atomic_write(meta_path, lambda handle: handle.write(encoded))
+    except (OSError, TypeError, ValueError):
+        return False
+    if directory is not None:
+        _touch(meta_path)
+        _evict(directory, SIDECAR_DIR_MAX_BYTES)
+    return True
+
+
+def _touch(path: Path) -> None:
+    # An explicit stamp: file system clocks can be coarser than the uses they order.
+    now = time.time_ns()
+    try:
+        os.utime(path, ns=(now, now))
+    except OSError:
+        pass
+
+
+def _evict(directory: Path, max_bytes: int) -> None:
+    """Drop the least recently used sidecars until ``directory`` fits in ``max_bytes``.
+
+    Recency is the metadata file's mtime, which :func:`read_sidecar` refreshes.
+    """
+
+    entries: dict[str, list[Any]] = {}
+    total = 0
+    try:
+        paths = [*directory.glob("*.npy"), *directory.glob("*.json")]
+    except OSError:
+        return
+    for path in paths:
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        entry = entries.setdefault(path.stem, [0, 0, []])
+        if path.suffix == ".json":
+            entry[0] = stat.st_mtime_ns
+        entry[1] += stat.st_size
+        entry[2].append(path)
+        total += stat.st_size
+    for _, size, files in sorted(entries.values(), key=lambda entry: entry[0]):
+        if total <= max_bytes:
+            break
+        try:
+            for path in files:
+                path.unlink(missing_ok=True)
+        except OSError:
+            continue
+        total -= size
+
+
+__all__ = ["SIDECAR_DIR_MAX_BYTES", "read_sidecar", "write_sidecar"]
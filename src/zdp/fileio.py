@@ -0,0 +1,28 @@
+"""Small file helpers shared by the on-disk caches."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from pathlib import Path
+from typing import IO, Any, Callable
+
+
+def atomic_write(target: Path, write: Callable[[IO[bytes]], Any]) -> None:
+    """Write ``target`` through ``write(handle)`` on a temporary file, then rename it.
+
+    Readers see either the old file or the complete new one; the temporary file
+    is removed if ``write`` or the rename fails.
+    """
+
+    fd, tmp_name = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            write(handle)
+        os.replace(tmp_name, target)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+__all__ = ["atomic_write"]
@@ -40,6 +40,7 @@ from zdp.models import (
     GoelOkumotoModel,
     HybridConfig,
     JelinskiMorandaModel,
+    ModelResult,
     ReliabilityModel,
     SShapedModel,
     SVRConfig,
@@ -47,7 +48,15 @@ from zdp.models import (
     GM11Model,
 )
 from zdp.reporting import ReportBuilder
-from zdp.services import AnalysisService, RankedModelResult, WalkForwardConfig
+from zdp.services import (
+    AnalysisService,
+    FitMemo,
+    ModelCompletion,
+    RankedModelResult,
+    WalkForwardConfig,
+    default_cache_dir,
+    rank_results,
+)
 from zdp.visualization import (
     MatplotlibCanvas,
     plot_prediction_overview,
@@ -67,6 +76,7 @@ class AnalysisWorker(QObject):
     """Background worker executing the AnalysisService."""
 
     completed = Signal(object)
+    model_completed = Signal(object)
     failed = Signal(str)
     finished = Signal()
 
@@ -78,6 +88,7 @@ class AnalysisWorker(QObject):
         validation: WalkForwardConfig,
         prediction_interval_alpha: float | None,
         rank_by: str | None,
+        memo: FitMemo | None = None,
     ) -> None:
         super().__init__()
         self._dataset = dataset
@@ -85,18 +96,25 @@ class AnalysisWorker(QObject):
         self._validation = validation
         self._prediction_interval_alpha = prediction_interval_alpha
         self._rank_by = rank_by
+        self._memo = memo
 
     @Slot()
     def run(self) -> None:
         try:
             models = [factory() for factory in self._factories]
-            service = AnalysisService(models)
-            results = service.run(
+            service = AnalysisService(models, memo=self._memo)
+            stream = service.iter_run(
                 self._dataset,
                 validation=self._validation,
                 prediction_interval_alpha=self._prediction_interval_alpha,
                 rank_by=self._rank_by,
             )
+            while True:
+                try:
+                    self.model_completed.emit(next(stream))
+                except StopIteration as stop:
+                    results: list[RankedModelResult] = stop.value
+                    break
             self.completed.emit(results)
         except Exception as exc:  # pragma: no cover - GUI runtime
             self.failed.emit(str(exc))
@@ -122,6 +140,9 @@ class MainWindow(QMainWindow):
 
         self.dataset: FailureDataset | None = None
         self.analysis_results: list[RankedModelResult] = []
+        self._partial_results: list[ModelResult] = []
+        # Fits survive between runs, so re-ranking or a new PI alpha does not refit.
+        self._fit_memo = FitMemo()
         self._worker_thread: QThread | None = None
         self._model_checkboxes: dict[str, QCheckBox] = {}
         self._experiment_window: ExperimentReplayWindow | None = None
@@ -382,12 +403,12 @@ class MainWindow(QMainWindow):
     # Event handlers
     def _handle_import_clicked(self) -> None:
         file_path, _ = QFileDialog.getOpenFileName(
-            self, "选择故障数据集", str(Path.home()), "数据文件 (*.csv *.tsv *.txt *.xls *.xlsx)"
+            self, "选择故障数据集", str(Path.home()), "数据文件 (*.csv *.tsv *.txt *.xls *.xlsx *.parquet *.feather *.arrow)"
         )
         if not file_path:
             return
         try:
-            dataset = load_failure_data(file_path)
+            dataset = load_failure_data(file_path, sidecar=default_cache_dir() / "datasets")
         except Exception as exc:
             QMessageBox.critical(self, "导入失败", str(exc))
             return
@@ -425,9 +446,12 @@ class MainWindow(QMainWindow):
             validation=validation,
             prediction_interval_alpha=pi_alpha,
             rank_by=None,
+            memo=self._fit_memo,
         )
         thread = QThread(self)
         worker.moveToThread(thread)
+        self._partial_results = []
+        worker.model_completed.connect(self._handle_model_completed)
         worker.completed.connect(self._handle_analysis_completed)
         worker.failed.connect(self._handle_analysis_failed)
         worker.finished.connect(lambda: self._cleanup_thread(thread, worker))
@@ -443,6 +467,21 @@ class MainWindow(QMainWindow):
         self.progress_bar.hide()
         self.run_button.setEnabled(True)
 
+    @Slot(object)
+    def _handle_model_completed(self, completion: ModelCompletion) -> None:
+        # Show provisional rankings while the remaining models are still running.
+        self._partial_results.append(completion.result)
+        self._append_log(
+            f"模型 {completion.result.model_name} 完成（{len(self._partial_results)}/{completion.total}），"
+            f"耗时 {completion.seconds:.2f} 秒"
+        )
+        self.analysis_results = rank_results(
+            self._partial_results, validation_enabled=self._parameters_state.walk_forward_enabled
+        )
+        self._populate_metrics_table(self.analysis_results)
+        self._refresh_plot_model_choices(self.analysis_results)
+        self._update_plots()
+
     @Slot(object)
     def _handle_analysis_completed(self, results: Sequence[RankedModelResult]) -> None:
         self.analysis_results = list(results)
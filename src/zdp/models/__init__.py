@@ -1,6 +1,7 @@
 """Model registry for ZDP."""
 
 from .base import ModelResult, ReliabilityModel
+from .cancellation import CancelToken, FitCancelled
 from .bp_neural import BPConfig, BPNeuralNetworkModel
 from .goel_okumoto import GoelOkumotoModel
 from .hybrid import EMDHybridModel, HybridConfig
@@ -13,6 +14,8 @@ from .plugins import load_plugin_model_factories, iter_all_model_factories
 __all__ = [
     "ModelResult",
     "ReliabilityModel",
+    "CancelToken",
+    "FitCancelled",
     "GoelOkumotoModel",
     "JelinskiMorandaModel",
     "SShapedModel",
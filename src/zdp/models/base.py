@@ -3,14 +3,16 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Any, Mapping
+from dataclasses import asdict, dataclass, is_dataclass
+from typing import Any, Mapping, Sequence
 
 import numpy as np
 from scipy import stats
 
 from zdp.data import FailureDataset, FailureSeriesType
 
+from .cancellation import CancelToken
+
 
 @dataclass(frozen=True)
 class ModelResult:
@@ -30,6 +32,10 @@ class ReliabilityModel(ABC):
     name: str = "BaseModel"
     required_series_type: FailureSeriesType | None = None
     param_count: int = 2
+    # Reported as ``cv_fast_path`` when walk_forward_forecasts() takes over validation.
+    walk_forward_fast_path: str | None = None
+    # Checked by long-running fit loops; set by the service for time-budgeted runs.
+    cancel_token: CancelToken | None = None
 
     def supports(self, series_type: FailureSeriesType) -> bool:
         return self.required_series_type in (None, series_type)
@@ -47,6 +53,60 @@ class ReliabilityModel(ABC):
                 f"Model {self.name} does not support default cloning; override clone()."
             ) from exc
 
+    def config_fingerprint(self) -> Mapping[str, Any] | None:
+        """Settings that change this model's output, used to key cached fits.
+
+        Defaults to the fields of a ``config`` dataclass, else to the model's
+        public scalar attributes. ``None`` means the settings cannot be captured
+        and the model's fits are never cached; models configured through other
+        constructor arguments override this.
+        """
+
+        config = getattr(self, "config", None)
+        if is_dataclass(config) and not isinstance(config, type):
+            return asdict(config)
+        settings: dict[str, Any] = {}
+        for key, value in vars(self).items():
+            if key.startswith("_") or key == "cancel_token":
+                continue
+            if value is not None and not isinstance(value, (bool, int, float, str)):
+                return None
+            settings[key] = value
+        return settings
+
+    def warm_start(self, state: Mapping[str, Any] | None) -> None:
+        """Seed the next fit with ``warm_start_state()`` from a previous fit.
+
+        Used by walk-forward validation, where consecutive splits differ by a few
+        samples. Models without a warm-start path ignore the state.
+        """
+
+    def warm_start_state(self) -> Mapping[str, Any] | None:
+        """Return state a later fit on a longer prefix can start from, if any."""
+
+        return None
+
+    def walk_forward_forecasts(
+        self,
+        dataset: FailureDataset,
+        train_stops: Sequence[int],
+        horizon: int,
+        *,
+        warm_start: bool = False,
+    ) -> tuple[list[np.ndarray | None], list[int | None]] | None:
+        """Optionally produce every walk-forward split's forecast in one go.
+
+        ``forecasts[i]`` is what a fresh clone fitted on ``dataset.slice(train_stops[i])``
+        predicts for the next ``horizon`` points (``None`` for unusable splits);
+        implementations document any deviation from that. Return ``None`` to fall
+        back to per-split fits.
+
+        Returns:
+            (forecasts, per-split iteration counts) or None
+        """
+
+        return None
+
     def fit(
         self,
         dataset: FailureDataset,
@@ -81,55 +141,98 @@ class ReliabilityModel(ABC):
     ) -> Mapping[str, float]:
         if actual.shape != predicted.shape:
             raise ValueError("Actual and predicted arrays must align")
-        residuals = actual - predicted
-        mse = float(np.mean(residuals**2))
-        mae = float(np.mean(np.abs(residuals)))
-        rmse = float(np.sqrt(mse))
-        max_err = float(np.max(np.abs(residuals)))
-        medae = float(np.median(np.abs(residuals)))
-        safe_actual = np.clip(actual, 1e-8, None)
-        mape = float(np.mean(np.abs(residuals / safe_actual)))
-        ss_res = float(np.sum(residuals**2))
-        ss_tot = float(np.sum((actual - actual.mean()) ** 2))
-        r2 = 1.0 - ss_res / ss_tot if ss_tot > 0 else 1.0
-        dof = actual.size
+        metrics = _metric_rows(actual, predicted, param_count or self.param_count)
+        return {name: float(value) for name, value in metrics.items()}
+
+    def compute_metrics_many(
+        self,
+        actual: Sequence[np.ndarray],
+        predicted: Sequence[np.ndarray],
+        *,
+        param_count: int | None = None,
+    ) -> list[Mapping[str, float]]:
+        """:meth:`compute_metrics` for many series, vectorized over equal-length ones."""
+
+        if len(actual) != len(predicted):
+            raise ValueError("Actual and predicted series must align")
         param_count = param_count or self.param_count
-        if dof > param_count and mse > 0:
-            aic = float(dof * np.log(mse) + 2 * param_count)
-            bic = float(dof * np.log(mse) + param_count * np.log(dof))
-        else:
-            aic = float("nan")
-            bic = float("nan")
-        chi2_obs = np.clip(actual, 1e-8, None)
-        chi2_exp = np.clip(predicted, 1e-8, None)
-        if np.any(chi2_exp):
-            exp_sum = float(np.sum(chi2_exp))
-            obs_sum = float(np.sum(chi2_obs))
-            if exp_sum > 0 and not np.isclose(exp_sum, obs_sum):
-                chi2_exp = chi2_exp * (obs_sum / exp_sum)
-        try:
-            chi2_stat, chi2_p = stats.chisquare(f_obs=chi2_obs, f_exp=chi2_exp)
-        except ValueError:
-            chi2_stat, chi2_p = float("nan"), float("nan")
-        try:
-            ks_stat, ks_p = stats.ks_2samp(actual, predicted)
-        except ValueError:
-            ks_stat, ks_p = float("nan"), float("nan")
-        return {
-            "mae": mae,
-            "rmse": rmse,
-            "mse": mse,
-            "mape": mape,
-            "max_error": max_err,
-            "medae": medae,
-            "r2": r2,
-            "aic": aic,
-            "bic": bic,
-            "chi2": float(chi2_stat),
-            "chi2_p": float(chi2_p),
-            "ks": float(ks_stat),
-            "ks_p": float(ks_p),
-        }
+        by_length: dict[int, list[int]] = {}
+        for index, (obs, exp) in enumerate(zip(actual, predicted)):
+            if np.shape(obs) != np.shape(exp) or np.ndim(obs) != 1:
+                raise ValueError("Actual and predicted arrays must align")
+            by_length.setdefault(len(obs), []).append(index)
+        results: list[Mapping[str, float]] = [{} for _ in actual]
+        for indices in by_length.values():
+            rows = _metric_rows(
+                np.stack([actual[i] for i in indices]),
+                np.stack([predicted[i] for i in indices]),
+                param_count,
+            )
+            for position, index in enumerate(indices):
+                results[index] = {name: float(value[position]) for name, value in rows.items()}
+        return results
+
+
+def _metric_rows(
+    actual: np.ndarray, predicted: np.ndarray, param_count: int
+) -> dict[str, np.ndarray]:
+    """Goodness-of-fit metrics along the last axis (one value per series)."""
+
+    residuals = actual - predicted
+    mse = np.mean(residuals**2, axis=-1)
+    mae = np.mean(np.abs(residuals), axis=-1)
+    rmse = np.sqrt(mse)
+    max_err = np.max(np.abs(residuals), axis=-1)
+    medae = np.median(np.abs(residuals), axis=-1)
+    safe_actual = np.clip(actual, 1e-8, None)
+    mape = np.mean(np.abs(residuals / safe_actual), axis=-1)
+    ss_res = np.sum(residuals**2, axis=-1)
+    ss_tot = np.sum((actual - actual.mean(axis=-1, keepdims=True)) ** 2, axis=-1)
+    r2 = np.where(ss_tot > 0, 1.0 - ss_res / np.where(ss_tot > 0, ss_tot, 1.0), 1.0)
+    dof = actual.shape[-1]
+    informative = (dof > param_count) & (mse > 0)
+    log_mse = np.log(np.where(informative, mse, 1.0))
+    aic = np.where(informative, dof * log_mse + 2 * param_count, np.nan)
+    bic = np.where(informative, dof * log_mse + param_count * np.log(dof), np.nan)
+    chi2_obs = np.clip(actual, 1e-8, None)
+    chi2_exp = np.clip(predicted, 1e-8, None)
+    exp_sum = np.sum(chi2_exp, axis=-1, keepdims=True)
+    obs_sum = np.sum(chi2_obs, axis=-1, keepdims=True)
+    rescale = (exp_sum > 0) & ~np.isclose(exp_sum, obs_sum)
+    scale = obs_sum / np.where(exp_sum > 0, exp_sum, 1.0)
+    chi2_exp = np.where(rescale, chi2_exp * scale, chi2_exp)
+    chi2_stat, chi2_p = _chisquare_rows(chi2_obs, chi2_exp)
+    try:
+        ks_stat, ks_p = stats.ks_2samp(actual, predicted, axis=-1)
+    except ValueError:
+        ks_stat = ks_p = np.full(np.shape(mse), np.nan)
+    return {
+        "mae": mae,
+        "rmse": rmse,
+        "mse": mse,
+        "mape": mape,
+        "max_error": max_err,
+        "medae": medae,
+        "r2": r2,
+        "aic": aic,
+        "bic": bic,
+        "chi2": chi2_stat,
+        "chi2_p": chi2_p,
+        "ks": ks_stat,
+        "ks_p": ks_p,
+    }
+
+
+def _chisquare_rows(observed: np.ndarray, expected: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Row-wise chi-square test; NaN for rows scipy rejects (not the whole batch)."""
+
+    try:
+        return stats.chisquare(f_obs=observed, f_exp=expected, axis=-1)
+    except ValueError:
+        if observed.ndim == 1:
+            return np.asarray(np.nan), np.asarray(np.nan)
+    pairs = [_chisquare_rows(obs, exp) for obs, exp in zip(observed, expected)]
+    return np.array([stat for stat, _ in pairs]), np.array([p for _, p in pairs])
 
 
 __all__ = ["ModelResult", "ReliabilityModel"]
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Sequence
+from typing import Any, Mapping, Sequence
 
 import numpy as np
 import torch
@@ -12,6 +12,7 @@ from torch import Tensor, nn
 from zdp.data import FailureDataset, FailureSeriesType
 
 from .base import ModelResult, ReliabilityModel
+from .cancellation import CancelToken, check_cancelled
 
 
 def _normalize(values: np.ndarray) -> tuple[np.ndarray, float, float]:
@@ -36,26 +37,61 @@ class BPConfig:
     learning_rate: float = 0.01
     momentum: float = 0.9
     train_split: float = 0.8
+    # Early stopping: stop after ``patience`` checks (every ``check_every`` epochs)
+    # without the monitored loss improving by more than ``min_delta``. 0 disables it.
+    patience: int = 0
+    min_delta: float = 0.0
+    check_every: int = 10
+
+
+class _EarlyStopping:
+    """Track the monitored loss at each check and keep the best weights."""
+
+    def __init__(self, config: BPConfig) -> None:
+        self.patience = int(config.patience)
+        self.min_delta = float(config.min_delta)
+        self.best = float("inf")
+        self.best_state: dict[str, Tensor] | None = None
+        self._bad_checks = 0
+
+    def update(self, monitored: float, network: nn.Module) -> bool:
+        """Record a check; return True when training should stop."""
+
+        if monitored < self.best - self.min_delta:
+            self.best = monitored
+            self.best_state = {k: v.detach().clone() for k, v in network.state_dict().items()}
+            self._bad_checks = 0
+            return False
+        self._bad_checks += 1
+        return self._bad_checks >= self.patience
 
 
 class BPNeuralNetworkModel(ReliabilityModel):
     name = "BP Neural Network"
     required_series_type = FailureSeriesType.CUMULATIVE_FAILURES
+    walk_forward_fast_path = "bp_batched_splits"
 
     def __init__(self, config: BPConfig | None = None) -> None:
         self.config = config or BPConfig()
         self.loss_curve: list[float] = []
         self.param_count = 3 * self.config.hidden_size + 1
+        self._network: nn.Module | None = None
+        self._warm_weights: Mapping[str, Tensor] | None = None
+
+    def warm_start(self, state: Mapping[str, Any] | None) -> None:
+        self._warm_weights = None if not state else state["weights"]
+
+    def warm_start_state(self) -> Mapping[str, Any] | None:
+        if self._network is None:
+            return None
+        weights = {key: value.detach().clone() for key, value in self._network.state_dict().items()}
+        return {"weights": weights}
 
     def clone(self) -> "BPNeuralNetworkModel":
         return BPNeuralNetworkModel(self.config)
 
     def _build_network(self) -> nn.Module:
-        return nn.Sequential(
-            nn.Linear(1, self.config.hidden_size),
-            nn.Sigmoid(),
-            nn.Linear(self.config.hidden_size, 1),
-        )
+        return _build_network(self.config.hidden_size)
 
     def _fit(
         self,
@@ -63,39 +99,152 @@ class BPNeuralNetworkModel(ReliabilityModel):
         *,
         evaluation_times: np.ndarray | None = None,
     ) -> ModelResult:
-        time_axis = dataset.time_axis.astype(np.float32)
-        targets = dataset.cumulative_failures().astype(np.float32)
-        x_norm, x_min, x_span = _normalize(time_axis)
-        y_norm, y_min, y_span = _normalize(targets)
-        x_norm = x_norm.reshape(-1, 1)
-        y_norm = y_norm.reshape(-1, 1)
-
-        split_idx = max(2, int(len(x_norm) * self.config.train_split))
-        train_x = torch.tensor(x_norm[:split_idx], dtype=torch.float32)
-        train_y = torch.tensor(y_norm[:split_idx], dtype=torch.float32)
-        val_x = torch.tensor(x_norm, dtype=torch.float32)
+        prepared = _prepare_series(dataset, self.config, evaluation_times)
+        train_x = torch.tensor(prepared.train_x.reshape(-1, 1), dtype=torch.float32)
+        train_y = torch.tensor(prepared.train_y.reshape(-1, 1), dtype=torch.float32)
+        hold_x = torch.tensor(prepared.hold_x.reshape(-1, 1), dtype=torch.float32)
+        hold_y = torch.tensor(prepared.hold_y.reshape(-1, 1), dtype=torch.float32)
 
         network = self._build_network()
+        if self._warm_weights is not None:
+            network.load_state_dict(self._warm_weights)
         criterion = nn.MSELoss()
         optimizer = torch.optim.SGD(
             network.parameters(), lr=self.config.learning_rate, momentum=self.config.momentum
         )
 
-        self.loss_curve = []
-        for _ in range(self.config.epochs):
+        # Losses stay on-device; the host only syncs at early-stopping checks.
+        history = torch.zeros(self.config.epochs)
+        stopper = _EarlyStopping(self.config) if self.config.patience > 0 else None
+        check_every = max(1, int(self.config.check_every))
+        epochs_run = self.config.epochs
+        stop_reason = "max_epochs"
+        for epoch in range(self.config.epochs):
+            check_cancelled(self.cancel_token)
             optimizer.zero_grad()
             outputs = network(train_x)
             loss: Tensor = criterion(outputs, train_y)
             loss.backward()
             optimizer.step()
-            self.loss_curve.append(float(loss.detach().cpu().item()))
+            history[epoch] = loss.detach()
+            if stopper is not None and (epoch + 1) % check_every == 0:
+                if len(hold_x):
+                    with torch.no_grad():
+                        monitored = criterion(network(hold_x), hold_y)
+                else:
+                    monitored = loss
+                if stopper.update(float(monitored), network):
+                    epochs_run = epoch + 1
+                    stop_reason = "plateau"
+                    break
+        if stop_reason == "plateau" and stopper is not None and stopper.best_state is not None:
+            network.load_state_dict(stopper.best_state)
+        self.loss_curve = history[:epochs_run].tolist()
+        self._network = network
+        return self._build_result(prepared, network, self.loss_curve, epochs_run, stop_reason)
+
+    def fit_many(
+        self,
+        datasets: Sequence[FailureDataset],
+        *,
+        configs: Sequence[BPConfig] | None = None,
+        evaluation_times: Sequence[np.ndarray | None] | None = None,
+    ) -> list[ModelResult]:
+        """Train one network per dataset (or per config variant) in a single batched loop.
 
+        All networks share one set of stacked weight tensors driven by ``torch.bmm``;
+        differing training lengths and hidden sizes are handled with masks, and each
+        network gets its own learning rate, momentum and epoch budget. Weights are
+        initialised exactly like ``nn.Linear`` but the random draws differ from
+        sequential :meth:`fit` calls, so results agree statistically, not bitwise.
+        """
+
+        datasets = list(datasets)
+        configs = list(configs) if configs is not None else [self.config] * len(datasets)
+        if len(configs) != len(datasets):
+            raise ValueError("configs must align with datasets")
+        if evaluation_times is not None and len(evaluation_times) != len(datasets):
+            raise ValueError("evaluation_times must align with datasets")
+        for dataset in datasets:
+            self._validate_dataset(dataset)
+        if not datasets:
+            return []
+
+        prepared = [
+            _prepare_series(
+                dataset, config, None if evaluation_times is None else evaluation_times[idx]
+            )
+            for idx, (dataset, config) in enumerate(zip(datasets, configs))
+        ]
+        trained = train_networks_batched(
+            [item.train_x for item in prepared],
+            [item.train_y for item in prepared],
+            configs,
+            holdout_inputs=[item.hold_x for item in prepared],
+            holdout_targets=[item.hold_y for item in prepared],
+            cancel=self.cancel_token,
+        )
+        results: list[ModelResult] = []
+        for config, item, run in zip(configs, prepared, trained):
+            model = BPNeuralNetworkModel(config)
+            results.append(
+                model._build_result(item, run.network, run.loss_curve, run.epochs_run, run.stop_reason)
+            )
+        return results
+
+    def walk_forward_forecasts(
+        self,
+        dataset: FailureDataset,
+        train_stops: Sequence[int],
+        horizon: int,
+        *,
+        warm_start: bool = False,
+    ) -> tuple[list[np.ndarray | None], list[int | None]] | None:
+        if warm_start:
+            # Warm starts chain splits sequentially; the batched trainer cannot honour them.
+            return None
+        stops = [stop for stop in train_stops if stop >= 2]
+        fitted = self.fit_many(
+            [dataset.slice(stop) for stop in stops],
+            evaluation_times=[dataset.time_axis[: stop + horizon] for stop in stops],
+        )
+        by_stop = {stop: result for stop, result in zip(stops, fitted)}
+        forecasts: list[np.ndarray | None] = []
+        iterations: list[int | None] = []
+        for stop in train_stops:
+            result = by_stop.get(stop)
+            if result is None:
+                forecasts.append(None)
+                iterations.append(None)
+                continue
+            forecasts.append(np.asarray(result.predictions[stop : stop + horizon], dtype=float))
+            iterations.append(int(result.diagnostics["optimizer"]["iterations"]))
+        return forecasts, iterations
+
+    def _build_result(
+        self,
+        prepared: "_PreparedSeries",
+        network: nn.Module,
+        loss_curve: Sequence[float],
+        epochs_run: int,
+        stop_reason: str,
+    ) -> ModelResult:
         with torch.no_grad():
-            preds = network(val_x).cpu().numpy().reshape(-1)
-        predictions = _denormalize(preds, y_min, y_span)
-        eval_times = evaluation_times if evaluation_times is not None else time_axis
-        metrics = self.compute_metrics(targets, predictions)
-        diagnostics = {"loss_curve": self.loss_curve[-50:]}
+            fitted = network(torch.tensor(prepared.x_norm.reshape(-1, 1))).cpu().numpy().reshape(-1)
+            preds = network(torch.tensor(prepared.eval_norm.reshape(-1, 1))).cpu().numpy().reshape(-1)
+        predictions = _denormalize(preds, prepared.y_min, prepared.y_span)
+        metrics = self.compute_metrics(
+            prepared.targets, _denormalize(fitted, prepared.y_min, prepared.y_span)
+        )
+        diagnostics = {
+            "loss_curve": list(loss_curve[-50:]),
+            "optimizer": {
+                "method": "sgd",
+                "iterations": int(epochs_run),
+                "stop_reason": stop_reason,
+                "warm_start": self._warm_weights is not None,
+            },
+        }
         return ModelResult(
             model_name=self.name,
             parameters={
@@ -103,11 +252,216 @@ class BPNeuralNetworkModel(ReliabilityModel):
                 "epochs": float(self.config.epochs),
                 "lr": float(self.config.learning_rate),
             },
-            times=eval_times,
+            times=prepared.eval_times,
             predictions=predictions,
             metrics=metrics,
             diagnostics=diagnostics,
         )
 
 
-__all__ = ["BPNeuralNetworkModel", "BPConfig"]
+@dataclass
+class _PreparedSeries:
+    """Normalised training/evaluation inputs shared by the single and batched paths."""
+
+    targets: np.ndarray
+    x_norm: np.ndarray
+    train_x: np.ndarray
+    train_y: np.ndarray
+    hold_x: np.ndarray
+    hold_y: np.ndarray
+    eval_times: np.ndarray
+    eval_norm: np.ndarray
+    y_min: float
+    y_span: float
+
+
+def _prepare_series(
+    dataset: FailureDataset,
+    config: BPConfig,
+    evaluation_times: np.ndarray | None,
+) -> _PreparedSeries:
+    time_axis = dataset.time_axis.astype(np.float32)
+    targets = dataset.cumulative_failures().astype(np.float32)
+    x_norm, x_min, x_span = _normalize(time_axis)
+    y_norm, y_min, y_span = _normalize(targets)
+    split_idx = max(2, int(len(x_norm) * config.train_split))
+    eval_times = evaluation_times if evaluation_times is not None else time_axis
+    # Evaluation points reuse the training normalisation so forecasts extrapolate.
+    eval_norm = (
+        (np.asarray(eval_times, dtype=np.float32) - x_min) / x_span
+        if x_span != 0
+        else np.zeros(len(eval_times), dtype=np.float32)
+    )
+    return _PreparedSeries(
+        targets=targets,
+        x_norm=x_norm.astype(np.float32),
+        train_x=x_norm[:split_idx].astype(np.float32),
+        train_y=y_norm[:split_idx].astype(np.float32),
+        hold_x=x_norm[split_idx:].astype(np.float32),
+        hold_y=y_norm[split_idx:].astype(np.float32),
+        eval_times=eval_times,
+        eval_norm=eval_norm.astype(np.float32),
+        y_min=y_min,
+        y_span=y_span,
+    )
+
+
+def _build_network(hidden_size: int) -> nn.Module:
+    return nn.Sequential(
+        nn.Linear(1, hidden_size),
+        nn.Sigmoid(),
+        nn.Linear(hidden_size, 1),
+    )
+
+
+@dataclass
+class TrainedNetwork:
+    """Outcome of one network trained by :func:`train_networks_batched`."""
+
+    network: nn.Module
+    loss_curve: list[float]
+    epochs_run: int
+    stop_reason: str
+
+
+def train_networks_batched(
+    inputs: Sequence[np.ndarray],
+    targets: Sequence[np.ndarray],
+    configs: Sequence[BPConfig],
+    *,
+    holdout_inputs: Sequence[np.ndarray] | None = None,
+    holdout_targets: Sequence[np.ndarray] | None = None,
+    cancel: CancelToken | None = None,
+) -> list[TrainedNetwork]:
+    """Train independent 1-hidden-layer networks together with stacked weights.
+
+    Network ``i`` is trained on ``inputs[i] -> targets[i]`` with ``configs[i]``
+    using full-batch SGD with momentum, the same update ``torch.optim.SGD``
+    applies. Rows beyond each series' length and hidden units beyond each
+    config's ``hidden_size`` are masked out. A network stops updating once its
+    own epoch budget is spent or, with ``patience > 0``, once its held-out loss
+    (training loss if it has no held-out rows) plateaus; plateaued networks are
+    restored to their best checked weights. The loop ends when every network
+    has stopped, and losses are copied to the host only at checks and at the end.
+    ``cancel`` is checked once per epoch.
+    """
+
+    count = len(configs)
+    if holdout_inputs is None or holdout_targets is None:
+        holdout_inputs = [np.zeros(0, dtype=np.float32)] * count
+        holdout_targets = [np.zeros(0, dtype=np.float32)] * count
+    x, y, row_mask, lengths = _pad_rows(inputs, targets)
+    hold_x, hold_y, hold_mask, hold_lengths = _pad_rows(holdout_inputs, holdout_targets)
+    has_holdout = hold_lengths > 0
+
+    hidden = max(config.hidden_size for config in configs)
+    sizes = torch.tensor([config.hidden_size for config in configs])
+    hidden_mask = (torch.arange(hidden)[None, :] < sizes[:, None]).float().unsqueeze(1)
+    epochs = torch.tensor([config.epochs for config in configs])
+    patience = torch.tensor([config.patience for config in configs])
+    min_delta = torch.tensor([config.min_delta for config in configs])
+    check_every = torch.tensor([max(1, config.check_every) for config in configs])
+
+    # nn.Linear initialisation: U(-1/sqrt(fan_in), 1/sqrt(fan_in)) for weights and biases.
+    out_bound = (1.0 / sizes.float().sqrt()).view(count, 1, 1)
+    w1 = (torch.rand(count, 1, hidden) * 2 - 1) * hidden_mask
+    b1 = (torch.rand(count, 1, hidden) * 2 - 1) * hidden_mask
+    w2 = (torch.rand(count, hidden, 1) * 2 - 1) * out_bound * hidden_mask.transpose(1, 2)
+    b2 = (torch.rand(count, 1, 1) * 2 - 1) * out_bound
+    params = [w1, b1, w2, b2]
+    for param in params:
+        param.requires_grad_(True)
+    buffers = [torch.zeros_like(param) for param in params]
+    best_params = [param.detach().clone() for param in params]
+    lr = torch.tensor([config.learning_rate for config in configs]).view(count, 1, 1)
+    momentum = torch.tensor([config.momentum for config in configs]).view(count, 1, 1)
+
+    def forward(inputs_: Tensor) -> Tensor:
+        hidden_out = torch.sigmoid(torch.bmm(inputs_, w1) + b1) * hidden_mask
+        return torch.bmm(hidden_out, w2) + b2
+
+    def masked_mse(outputs: Tensor, expected: Tensor, mask: Tensor, rows: Tensor) -> Tensor:
+        return ((outputs - expected) ** 2 * mask).sum(dim=(1, 2)) / rows.clamp(min=1)
+
+    max_epochs = int(epochs.max())
+    losses = torch.zeros(max_epochs, count)
+    running = epochs > 0
+    epochs_run = epochs.clone()
+    plateaued = torch.zeros(count, dtype=torch.bool)
+    best = torch.full((count,), float("inf"))
+    bad_checks = torch.zeros(count, dtype=torch.long)
+    for epoch in range(max_epochs):
+        running &= epoch < epochs
+        if not bool(running.any()):
+            break
+        check_cancelled(cancel)
+        per_network = masked_mse(forward(x), y, row_mask, lengths)
+        grads = torch.autograd.grad(per_network.sum(), params)
+        active = running.float().view(count, 1, 1)
+        with torch.no_grad():
+            losses[epoch] = per_network.detach()
+            for param, buf, grad in zip(params, buffers, grads):
+                buf.mul_(momentum).add_(grad)
+                param.sub_(lr * buf * active)
+
+            checking = running & (patience > 0) & ((epoch + 1) % check_every == 0)
+            if bool(checking.any()):
+                monitored = torch.where(
+                    has_holdout, masked_mse(forward(hold_x), hold_y, hold_mask, hold_lengths), per_network
+                )
+                improved = checking & (monitored < best - min_delta)
+                best = torch.where(improved, monitored, best)
+                bad_checks = torch.where(improved, torch.zeros_like(bad_checks), bad_checks + checking.long())
+                keep = improved.view(count, 1, 1)
+                for stored, param in zip(best_params, params):
+                    stored.copy_(torch.where(keep, param, stored))
+                stopping = checking & (bad_checks >= patience)
+                epochs_run = torch.where(stopping, torch.full_like(epochs_run, epoch + 1), epochs_run)
+                plateaued |= stopping
+                running &= ~stopping
+
+    with torch.no_grad():
+        restore = (plateaued & torch.isfinite(best)).view(count, 1, 1)
+        for param, stored in zip(params, best_params):
+            param.copy_(torch.where(restore, stored, param))
+
+    history = losses.cpu().numpy()
+    trained: list[TrainedNetwork] = []
+    for idx, config in enumerate(configs):
+        size = config.hidden_size
+        network = _build_network(size)
+        with torch.no_grad():
+            network[0].weight.copy_(w1[idx, 0, :size].detach().view(size, 1))
+            network[0].bias.copy_(b1[idx, 0, :size].detach())
+            network[2].weight.copy_(w2[idx, :size, 0].detach().view(1, size))
+            network[2].bias.copy_(b2[idx, 0].detach())
+        used = int(epochs_run[idx])
+        trained.append(
+            TrainedNetwork(
+                network=network,
+                loss_curve=history[:used, idx].astype(float).tolist(),
+                epochs_run=used,
+                stop_reason="plateau" if bool(plateaued[idx]) else "max_epochs",
+            )
+        )
+    return trained
+
+
+def _pad_rows(
+    inputs: Sequence[np.ndarray],
+    targets: Sequence[np.ndarray],
+) -> tuple[Tensor, Tensor, Tensor, Tensor]:
+    """Stack variable-length 1-D series into ``(count, rows, 1)`` tensors plus a row mask."""
+
+    lengths = torch.tensor([len(values) for values in inputs])
+    rows = max(1, int(lengths.max()))
+    x = torch.zeros(len(inputs), rows, 1)
+    y = torch.zeros(len(inputs), rows, 1)
+    for idx, (xi, yi) in enumerate(zip(inputs, targets)):
+        x[idx, : len(xi), 0] = torch.as_tensor(xi, dtype=torch.float32)
+        y[idx, : len(yi), 0] = torch.as_tensor(yi, dtype=torch.float32)
+    mask = (torch.arange(rows)[None, :] < lengths[:, None]).float().unsqueeze(-1)
+    return x, y, mask, lengths
+
+
+__all__ = ["BPNeuralNetworkModel", "BPConfig", "TrainedNetwork", "train_networks_batched"]
@@ -0,0 +1,76 @@
+"""Cooperative cancellation for long-running model fits."""
+
+from __future__ import annotations
+
+import time
+
+
+class FitCancelled(RuntimeError):
+    """Raised from inside a fit whose :class:`CancelToken` fired."""
+
+    def __init__(self, reason: str) -> None:
+        super().__init__(f"fit {reason}")
+        self.reason = reason
+
+
+class CancelToken:
+    """Cancellation flag with an optional wall-clock deadline.
+
+    Fitting loops call :meth:`check`, which raises :class:`FitCancelled` once
+    :meth:`cancel` was called on this token or a parent, or once the deadline
+    passes. Deadlines use ``time.time()`` so a token pickled into a worker
+    process keeps its meaning; an explicit ``cancel()`` only reaches fits in the
+    same process.
+    """
+
+    def __init__(self, *, deadline: float | None = None, parent: "CancelToken | None" = None) -> None:
+        self.deadline = deadline
+        self.parent = parent
+        self._reason: str | None = None
+
+    @classmethod
+    def with_budget(
+        cls,
+        seconds: float | None,
+        *,
+        deadline: float | None = None,
+        parent: "CancelToken | None" = None,
+    ) -> "CancelToken":
+        """Token expiring ``seconds`` from now or at ``deadline``, whichever comes first."""
+
+        candidates = [] if deadline is None else [deadline]
+        if seconds is not None:
+            candidates.append(time.time() + float(seconds))
+        return cls(deadline=min(candidates) if candidates else None, parent=parent)
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        self._reason = reason
+
+    @property
+    def reason(self) -> str | None:
+        """``"cancelled"``/``"timeout"`` once the token has fired, otherwise ``None``."""
+
+        if self._reason is not None:
+            return self._reason
+        if self.deadline is not None and time.time() >= self.deadline:
+            return "timeout"
+        return None if self.parent is None else self.parent.reason
+
+    @property
+    def cancelled(self) -> bool:
+        return self.reason is not None
+
+    def check(self) -> None:
+        reason = self.reason
+        if reason is not None:
+            raise FitCancelled(reason)
+
+
+def check_cancelled(token: CancelToken | None) -> None:
+    """``token.check()`` for optional tokens."""
+
+    if token is not None:
+        token.check()
+
+
+__all__ = ["CancelToken", "FitCancelled", "check_cancelled"]
@@ -0,0 +1,258 @@
+"""Shared curve-fitting helpers for the NHPP mean-value models."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable
+
+import numpy as np
+from scipy import optimize, special
+
+from .cancellation import CancelToken, check_cancelled
+
+MeanValueFn = Callable[..., np.ndarray]
+ShapeFn = Callable[[np.ndarray, float], np.ndarray]
+
+FIT_METHODS = ("lsq", "mle")
+LIKELIHOODS = ("auto", "grouped", "exact")
+
+
+@dataclass(frozen=True)
+class MeanValueFamily:
+    """Shape ``G(t; b)`` of an NHPP mean-value function ``m(t) = a * G(t; b)``.
+
+    ``G(0; b) == 0`` and ``G(inf; b) == 1`` are assumed, so ``a`` is the expected
+    total number of failures and has a closed form given ``b``.
+    """
+
+    shape: ShapeFn
+    shape_db: ShapeFn
+    log_density: ShapeFn
+    log_density_db: ShapeFn
+
+
+def curve_fit_with_counts(
+    func: MeanValueFn,
+    jac: MeanValueFn | None,
+    xdata: np.ndarray,
+    ydata: np.ndarray,
+    *,
+    cancel: CancelToken | None = None,
+    **kwargs: Any,
+) -> tuple[np.ndarray, dict[str, Any]]:
+    """Run ``optimize.curve_fit`` and report how often the model was evaluated.
+
+    SciPy's ``nfev`` for bounded fits excludes the calls spent on finite-difference
+    Jacobians, so both callables are wrapped and counted directly. ``cancel`` is
+    checked on every model evaluation.
+
+    Returns:
+        (params, diagnostics) with ``nfev``/``njev`` and the optimizer status.
+    """
+
+    counts = {"nfev": 0, "njev": 0}
+
+    def counted_func(x: np.ndarray, *params: float) -> np.ndarray:
+        counts["nfev"] += 1
+        check_cancelled(cancel)
+        return func(x, *params)
+
+    counted_jac: MeanValueFn | None = None
+    if jac is not None:
+
+        def counted_jac(x: np.ndarray, *params: float) -> np.ndarray:
+            counts["njev"] += 1
+            return jac(x, *params)
+
+    params, _, _, message, status = optimize.curve_fit(
+        counted_func,
+        xdata,
+        ydata,
+        jac=counted_jac,
+        full_output=True,
+        **kwargs,
+    )
+    diagnostics: dict[str, Any] = {
+        "method": "least_squares",
+        "nfev": counts["nfev"],
+        "njev": counts["njev"],
+        "status": int(status),
+        "message": str(message),
+    }
+    return params, diagnostics
+
+
+def resolve_likelihood(
+    time_axis: np.ndarray, cumulative: np.ndarray, likelihood: str, *, exact_times: bool = False
+) -> str:
+    """Pick grouped vs exact-time likelihood.
+
+    ``auto`` is ``grouped`` unless the caller knows the time axis holds exact
+    failure times (``exact_times``) and the data has one failure per row: a
+    unit-increment series on increasing times may just as well be daily counts.
+    The NHPP models set ``exact_times`` from ``metadata["exact_failure_times"]``.
+    """
+
+    if likelihood != "auto":
+        return likelihood
+    increments = np.diff(np.concatenate([[0.0], cumulative]))
+    if exact_times and np.all(np.diff(time_axis) > 0) and np.allclose(increments, 1.0):
+        return "exact"
+    return "grouped"
+
+
+def profile_likelihood_fit(
+    family: MeanValueFamily,
+    time_axis: np.ndarray,
+    cumulative: np.ndarray,
+    *,
+    likelihood: str = "auto",
+    exact_times: bool = False,
+    grid_size: int = 97,
+    b_hint: float | None = None,
+) -> tuple[float, float, float, dict[str, Any]]:
+    """Maximum-likelihood fit of ``m(t) = a * G(t; b)`` via the profile in ``b``.
+
+    For both grouped counts and exact failure times the score in ``a`` gives
+    ``a = N / G(T; b)``, leaving a one-dimensional score equation in ``b``. The
+    score is scanned on a log grid of ``b * T`` to find the first +/- sign change,
+    which is then polished with Brent's method. With ``b_hint`` (a previous fit
+    on a shorter prefix) the bracket is first searched outward from the hint and
+    the grid scan is only used as a fallback. ``exact_times`` lets ``auto``
+    pick the exact-time likelihood (see :func:`resolve_likelihood`).
+
+    Returns:
+        (a, b, log_likelihood, diagnostics)
+    """
+
+    time_axis = np.asarray(time_axis, dtype=float)
+    cumulative = np.asarray(cumulative, dtype=float)
+    likelihood = resolve_likelihood(time_axis, cumulative, likelihood, exact_times=exact_times)
+    if likelihood not in LIKELIHOODS:
+        raise ValueError(f"Unsupported likelihood '{likelihood}'; expected one of {LIKELIHOODS}")
+
+    horizon = float(time_axis[-1])
+    total = float(cumulative[-1])
+    if horizon <= 0 or total <= 0:
+        raise RuntimeError("MLE fit requires positive time and failure totals")
+
+    if likelihood == "exact":
+        if np.any(time_axis <= 0):
+            raise RuntimeError("Exact-time MLE requires positive failure times")
+        failure_times = time_axis
+        count = float(failure_times.size)
+
+        def score(b: float) -> float:
+            ratio = family.shape_db(np.array([horizon]), b)[0] / family.shape(np.array([horizon]), b)[0]
+            return float(np.sum(family.log_density_db(failure_times, b)) - count * ratio)
+
+    else:
+        increments = np.diff(np.concatenate([[0.0], cumulative]))
+        if np.any(increments < 0):
+            raise RuntimeError("Grouped MLE requires non-decreasing cumulative counts")
+        starts = np.concatenate([[0.0], time_axis[:-1]])
+        observed = increments > 0
+        if np.any(time_axis[observed] <= starts[observed]):
+            raise RuntimeError("Grouped MLE requires increasing times where failures occur")
+        d = increments[observed]
+        lo, hi = starts[observed], time_axis[observed]
+
+        def score(b: float) -> float:
+            delta = family.shape(hi, b) - family.shape(lo, b)
+            delta_db = family.shape_db(hi, b) - family.shape_db(lo, b)
+            end = np.array([horizon])
+            ratio = family.shape_db(end, b)[0] / family.shape(end, b)[0]
+            return float(np.sum(d * delta_db / delta) - total * ratio)
+
+    bracket = None
+    scans = 0
+    if b_hint is not None and b_hint > 0:
+        bracket, scans = _bracket_from_hint(score, float(b_hint))
+    if bracket is None:
+        grid = np.logspace(-4, 3, grid_size) / horizon
+        with np.errstate(all="ignore"):
+            values = np.array([score(b) for b in grid])
+        scans += grid_size
+        crossing = np.flatnonzero(
+            np.isfinite(values[:-1]) & np.isfinite(values[1:]) & (values[:-1] > 0) & (values[1:] <= 0)
+        )
+        if crossing.size == 0:
+            raise RuntimeError("NHPP profile likelihood has no finite MLE for this dataset")
+        idx = int(crossing[0])
+        bracket = (float(grid[idx]), float(grid[idx + 1]))
+    with np.errstate(all="ignore"):
+        b, info = optimize.brentq(
+            score, bracket[0], bracket[1], xtol=1e-14, rtol=1e-12, full_output=True, disp=False
+        )
+    if not info.converged:
+        raise RuntimeError("NHPP profile likelihood solver failed to converge")
+
+    end = np.array([horizon])
+    a = total / float(family.shape(end, b)[0])
+    if likelihood == "exact":
+        log_likelihood = (
+            count * np.log(a) + float(np.sum(family.log_density(failure_times, b))) - total
+        )
+    else:
+        delta = family.shape(hi, b) - family.shape(lo, b)
+        log_likelihood = float(
+            np.sum(d * np.log(a * delta)) - total - np.sum(special.gammaln(d + 1.0))
+        )
+    diagnostics: dict[str, Any] = {
+        "method": "profile_mle",
+        "likelihood": likelihood,
+        "nfev": scans + int(info.function_calls),
+        "iterations": int(info.iterations),
+    }
+    return float(a), float(b), float(log_likelihood), diagnostics
+
+
+def _bracket_from_hint(
+    score: Callable[[float], float],
+    hint: float,
+    *,
+    factor: float = 1.5,
+    max_steps: int = 20,
+) -> tuple[tuple[float, float] | None, int]:
+    """Grow a +/- bracket of the profile score geometrically around ``hint``."""
+
+    with np.errstate(all="ignore"):
+        lo = hi = hint
+        f_lo = f_hi = score(hint)
+        calls = 1
+        for _ in range(max_steps):
+            if not np.isfinite(f_lo) or not np.isfinite(f_hi):
+                return None, calls
+            if f_lo > 0 and f_hi <= 0:
+                return (lo, hi), calls
+            if f_hi > 0:
+                lo, f_lo = hi, f_hi
+                hi *= factor
+                f_hi = score(hi)
+            else:
+                hi, f_hi = lo, f_lo
+                lo /= factor
+                f_lo = score(lo)
+            calls += 1
+    return None, calls
+
+
+def likelihood_metrics(log_likelihood: float, param_count: int, sample_size: int) -> dict[str, float]:
+    """AIC/BIC computed from a maximised log-likelihood."""
+
+    return {
+        "log_likelihood": float(log_likelihood),
+        "aic": float(2 * param_count - 2 * log_likelihood),
+        "bic": float(param_count * np.log(sample_size) - 2 * log_likelihood),
+    }
+
+
+__all__ = [
+    "FIT_METHODS",
+    "LIKELIHOODS",
+    "MeanValueFamily",
+    "curve_fit_with_counts",
+    "likelihood_metrics",
+    "profile_likelihood_fit",
+    "resolve_likelihood",
+]
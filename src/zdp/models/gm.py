@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Sequence
 
 import numpy as np
 
@@ -21,6 +22,7 @@ class GM11Model(ReliabilityModel):
     name = "GM(1,1)"
     required_series_type = FailureSeriesType.CUMULATIVE_FAILURES
     param_count = 2  # a, b
+    walk_forward_fast_path = "gm11_prefix_sums"
 
     def __init__(self, config: GMConfig | None = None) -> None:
         self.config = config or GMConfig()
@@ -28,9 +30,9 @@ class GM11Model(ReliabilityModel):
         self.b: float | None = None
 
     @staticmethod
-    def _fit_parameters(x0: np.ndarray) -> tuple[float, float]:
-        # 1-AGO cumulative sequence
-        x1 = np.cumsum(x0)
+    def _fit_parameters(x0: np.ndarray, x1: np.ndarray | None = None) -> tuple[float, float]:
+        # 1-AGO cumulative sequence (callers may pass a cached ``np.cumsum(x0)``)
+        x1 = np.cumsum(x0) if x1 is None else x1
         # mean sequence z1(k) = 0.5*(x1(k) + x1(k-1)), k=2..n
         z1 = 0.5 * (x1[1:] + x1[:-1])
         # GM(1,1): x0(k) + a * z1(k) = b, for k=2..n
@@ -42,17 +44,113 @@ class GM11Model(ReliabilityModel):
         return a, b
 
     @staticmethod
-    def _predict_cumulative(x1_1: float, a: float, b: float, n: int) -> np.ndarray:
+    def _prefix_parameters(
+        x0: np.ndarray, x1: np.ndarray | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Fit (a, b) for every prefix ``x0[:m]`` in one pass.
+
+        GM(1,1) is a two-parameter regression, so the normal equations of each
+        prefix follow from running sums of z1, z1**2, z1*x0 and x0. Entry ``m``
+        of the returned arrays holds the fit on the first ``m`` samples (NaN for
+        ``m < 3``). Near-singular prefixes fall back to :meth:`_fit_parameters`.
+        """
+
+        n = x0.size
+        a = np.full(n + 1, np.nan)
+        b = np.full(n + 1, np.nan)
+        if n < 3:
+            return a, b
+        x1 = np.cumsum(x0) if x1 is None else x1
+        z1 = 0.5 * (x1[1:] + x1[:-1])
+        y = x0[1:]
+        # Row j of the running sums covers regression rows 0..j, i.e. prefix length j + 2.
+        count = np.arange(1, n, dtype=float)
+        s_z = np.cumsum(z1)
+        s_zz = np.cumsum(z1 * z1)
+        s_y = np.cumsum(y)
+        s_zy = np.cumsum(z1 * y)
+        det = s_zz * count - s_z**2
+        with np.errstate(divide="ignore", invalid="ignore"):
+            prefix_a = (s_z * s_y - count * s_zy) / det
+            prefix_b = (s_zz * s_y - s_z * s_zy) / det
+        a[2:] = prefix_a
+        b[2:] = prefix_b
+        a[:3] = np.nan
+        b[:3] = np.nan
+        singular = ~(np.abs(det) > 1e-10 * s_zz * count)
+        for m in np.flatnonzero(singular) + 2:
+            if m >= 3:
+                a[m], b[m] = GM11Model._fit_parameters(x0[:m])
+        return a, b
+
+    @staticmethod
+    def _cumulative_at(x1_1: float, a: float, b: float, k: np.ndarray) -> np.ndarray:
         # x1(k) = (x1(1) - b/a) * exp(-a*(k-1)) + b/a
         # Ensure numerical stability when a ~ 0
         eps = 1e-12
         if abs(a) < eps:
             # When a -> 0, x1(k) ~ x1(1) + (k-1) * b
-            return x1_1 + b * np.arange(n, dtype=float)
+            return x1_1 + b * k
         const = x1_1 - b / a
-        k = np.arange(n, dtype=float)
         return const * np.exp(-a * k) + b / a
 
+    @staticmethod
+    def _predict_cumulative(x1_1: float, a: float, b: float, n: int) -> np.ndarray:
+        return GM11Model._cumulative_at(x1_1, a, b, np.arange(n, dtype=float))
+
+    def walk_forward_forecasts(
+        self,
+        dataset: FailureDataset,
+        train_stops: Sequence[int],
+        horizon: int,
+        *,
+        warm_start: bool = False,
+    ) -> tuple[list[np.ndarray | None], list[int | None]] | None:
+        if type(self) is not GM11Model or dataset.series_type != self.required_series_type:
+            return None
+        forecasts = self.prefix_forecasts(
+            dataset.cumulative_failures(),
+            train_stops,
+            horizon,
+            increments=dataset.failure_intervals(),
+            increment_sums=dataset.interval_prefix_sums()[0],
+        )
+        return forecasts, [None] * len(forecasts)
+
+    def prefix_forecasts(
+        self,
+        cumulative: np.ndarray,
+        train_stops: Sequence[int],
+        horizon: int,
+        *,
+        increments: np.ndarray | None = None,
+        increment_sums: np.ndarray | None = None,
+    ) -> list[np.ndarray | None]:
+        """Forecast ``cumulative[stop:stop + horizon]`` from each prefix ``cumulative[:stop]``.
+
+        Equivalent to fitting a fresh model on every prefix and slicing its
+        predictions, but costs O(n + len(train_stops) * horizon) in total.
+        Entries are ``None`` where :meth:`_fit` would not produce a forecast.
+        ``increments``/``increment_sums`` may supply the dataset's cached
+        ``failure_intervals()`` and their running sums.
+        """
+
+        cumulative = np.asarray(cumulative, dtype=float)
+        x0 = np.diff(np.concatenate([[0.0], cumulative])) if increments is None else increments
+        a_all, b_all = self._prefix_parameters(x0, increment_sums)
+        forecasts: list[np.ndarray | None] = []
+        for stop in train_stops:
+            a, b = a_all[stop], b_all[stop]
+            if not (np.isfinite(a) and np.isfinite(b)):
+                forecasts.append(None)
+                continue
+            # The GM(1,1) curve is monotone in k, so the running maximum the full
+            # fit applies only needs the endpoints of the training span.
+            k = np.concatenate([[0.0], np.arange(stop - 1, stop + horizon, dtype=float)])
+            values = self._cumulative_at(cumulative[0], a, b, k)
+            forecasts.append(np.maximum.accumulate(values)[2:])
+        return forecasts
+
     def _fit(
         self,
         dataset: FailureDataset,
@@ -67,15 +165,17 @@ class GM11Model(ReliabilityModel):
             predictions = cumulative.copy()
             self.a, self.b = float("nan"), float("nan")
         else:
-            # Derive x0 (increments) from cumulative
-            x0 = np.diff(np.concatenate([[0.0], cumulative]))
-            a, b = self._fit_parameters(x0)
+            # Increments x0 and their running sums come from the dataset's cache,
+            # so walk-forward prefixes do not recompute them.
+            x0 = dataset.failure_intervals()
+            a, b = self._fit_parameters(x0, dataset.interval_prefix_sums()[0])
             self.a, self.b = a, b
-            x1_pred = self._predict_cumulative(cumulative[0], a, b, n)
+            steps = n if evaluation_times is None else max(n, len(evaluation_times))
+            x1_pred = self._predict_cumulative(cumulative[0], a, b, steps)
             # GM(1,1) cumulative predictions should be non-decreasing
             predictions = np.maximum.accumulate(x1_pred)
         eval_times = evaluation_times if evaluation_times is not None else time_axis
-        metrics = self.compute_metrics(cumulative, predictions)
+        metrics = self.compute_metrics(cumulative, predictions[:n])
         return ModelResult(
             model_name=self.name,
             parameters={"a": float(self.a or float("nan")), "b": float(self.b or float("nan"))},
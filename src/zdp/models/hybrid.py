@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import List
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, List, Mapping
 
 import numpy as np
 from sklearn.pipeline import Pipeline
@@ -14,13 +16,18 @@ from scipy.signal import savgol_filter
 from zdp.data import FailureDataset, FailureSeriesType
 
 from .base import ModelResult, ReliabilityModel
+from .kernels import GramCache, resolve_rbf_gamma
 
 
 @dataclass
 class HybridConfig:
+    # "precomputed": all IMF components share one cached RBF Gram matrix.
     svr_kernel: str = "rbf"
     svr_c: float = 20.0
     svr_epsilon: float = 0.01
+    # >1 fits the IMF components and the GM residue concurrently on a thread pool
+    # (libsvm releases the GIL). Results are combined in component order.
+    max_workers: int = 1
 
 
 class EMDHybridModel(ReliabilityModel):
@@ -30,11 +37,17 @@ class EMDHybridModel(ReliabilityModel):
     def __init__(self, config: HybridConfig | None = None) -> None:
         self.config = config or HybridConfig()
         self.param_count = 6
-        self.components: List[dict[str, float]] = []
+        self.components: List[dict[str, float | str]] = []
 
     def clone(self) -> "EMDHybridModel":
         return EMDHybridModel(self.config)
 
+    def config_fingerprint(self) -> Mapping[str, Any]:
+        settings = asdict(self.config)
+        # Worker count only changes speed; results are combined in component order.
+        settings.pop("max_workers", None)
+        return settings
+
     def _fit(
         self,
         dataset: FailureDataset,
@@ -44,13 +57,36 @@ class EMDHybridModel(ReliabilityModel):
         time_axis = dataset.time_axis
         targets = dataset.cumulative_failures()
         imfs, residue = self._decompose_signal(targets)
+        # Scoped to this fit: the components share one Gram matrix, freed afterwards.
+        grams = GramCache(max_entries=1)
+        tasks: List[Callable[[], np.ndarray]] = [
+            (lambda imf=imf: self._fit_component(time_axis, imf, grams)) for imf in imfs
+        ]
+        tasks.append(lambda: self._gm_predict(residue))
+        outputs = self._run_components(tasks)
+
         predictions = np.zeros_like(targets)
-        component_info: List[dict[str, float]] = []
+        component_info: List[dict[str, float | str]] = []
         for idx, imf in enumerate(imfs):
-            component_pred = self._fit_component(time_axis, imf)
+            component_pred, seconds = outputs[idx]
             predictions += component_pred
-            component_info.append({"component": float(idx + 1), "variance": float(np.var(imf))})
-        gm_pred = self._gm_predict(residue)
+            component_info.append(
+                {
+                    "component": float(idx + 1),
+                    "kind": "imf",
+                    "variance": float(np.var(imf)),
+                    "seconds": seconds,
+                }
+            )
+        gm_pred, gm_seconds = outputs[-1]
+        component_info.append(
+            {
+                "component": float(len(imfs) + 1),
+                "kind": "gm_residue",
+                "variance": float(np.var(residue)),
+                "seconds": gm_seconds,
+            }
+        )
         blended = predictions + gm_pred
         eval_times = evaluation_times if evaluation_times is not None else time_axis
         metrics = self.compute_metrics(targets, blended)
@@ -73,7 +109,30 @@ class EMDHybridModel(ReliabilityModel):
             diagnostics=diagnostics,
         )
 
-    def _fit_component(self, time_axis: np.ndarray, component: np.ndarray) -> np.ndarray:
+    def _run_components(
+        self, tasks: List[Callable[[], np.ndarray]]
+    ) -> List[tuple[np.ndarray, float]]:
+        """Run component fits, returning ``(prediction, seconds)`` in task order."""
+
+        def timed(task: Callable[[], np.ndarray]) -> tuple[np.ndarray, float]:
+            start = time.perf_counter()
+            output = task()
+            return output, time.perf_counter() - start
+
+        workers = min(int(self.config.max_workers), len(tasks))
+        if workers <= 1:
+            return [timed(task) for task in tasks]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(timed, tasks))
+
+    def _fit_component(
+        self, time_axis: np.ndarray, component: np.ndarray, grams: GramCache
+    ) -> np.ndarray:
+        if self.config.svr_kernel == "precomputed":
+            gram = grams.gram(time_axis, resolve_rbf_gamma("scale", time_axis))
+            svr = SVR(kernel="precomputed", C=self.config.svr_c, epsilon=self.config.svr_epsilon)
+            svr.fit(gram, component)
+            return svr.predict(gram)
         pipeline = Pipeline(
             [
                 ("scale", StandardScaler()),
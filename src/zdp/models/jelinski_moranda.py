@@ -2,21 +2,264 @@
 
 from __future__ import annotations
 
+from typing import Any, Mapping, Sequence
+
 import numpy as np
 from scipy import optimize
 
 from zdp.data import FailureDataset, FailureSeriesType
 
 from .base import ModelResult, ReliabilityModel
+from .cancellation import CancelToken, check_cancelled
+
+JM_SOLVERS = ("brent", "bisection")
+
+
+def _solve_n0_linear(
+    n: int, p: float, *, cancel: CancelToken | None = None
+) -> tuple[float, dict[str, Any]]:
+    """Legacy solver: unit-step bracket walk followed by bisection."""
+
+    k = np.arange(n, dtype=float)
+
+    def mle_eq(N: float) -> float:
+        term1 = np.sum(1.0 / (N - k))
+        term2 = n / (N - p)
+        return term1 - term2
+
+    # Bisection-style solve, mirroring the typical teaching implementation.
+    ex = 1e-6
+    ey = 1e-6
+    left = (n - 1) + 1e-6
+    right = max(float(n), left + 1.0)
+
+    f_right = mle_eq(right)
+    steps = 0
+    while f_right > ey:
+        left = right
+        right = right + 1.0
+        f_right = mle_eq(right)
+        steps += 1
+        check_cancelled(cancel)
+        if steps > 200000:
+            raise RuntimeError("JM root search failed to bracket a solution within iteration limit")
+
+    iterations = 0
+    # If we've landed close enough, accept right as the root.
+    if -ey <= f_right <= ey:
+        n0 = float(right)
+    else:
+        # Now f(left) should be > ey and f(right) <= ey; bisect until convergence.
+        for _ in range(200000):
+            iterations += 1
+            check_cancelled(cancel)
+            if abs(right - left) <= ex:
+                n0 = float((right + left) / 2.0)
+                break
+            mid = (right + left) / 2.0
+            f_mid = mle_eq(mid)
+            if f_mid > ey:
+                left = mid
+            elif f_mid < -ey:
+                right = mid
+            else:
+                n0 = float(mid)
+                break
+        else:
+            raise RuntimeError("JM bisection failed to converge")
+    return n0, {"method": "bisection", "bracket_steps": steps, "iterations": iterations}
+
+
+def _solve_n0_brent(
+    n: int,
+    p: float,
+    *,
+    xtol: float = 1e-10,
+    max_bracket_steps: int = 200,
+    n0_hint: float | None = None,
+    cancel: CancelToken | None = None,
+) -> tuple[float, dict[str, Any]]:
+    """Solve the JM score equation with geometric bracketing and Brent's method.
+
+    The score equation ``sum(1/(N-k)) = n/(N-p)`` is multiplied by ``(N-p) > 0``,
+    giving ``g(N) = sum((k-p)/(N-k))``. ``g`` has the same root but avoids the
+    cancellation between two O(n/N) terms when N0 is far above n. ``g`` is
+    positive just above ``n-1`` and negative for large N whenever ``p > (n-1)/2``,
+    so doubling the distance from ``n-1`` brackets the root in O(log N0) steps.
+    With ``n0_hint`` (e.g. the previous walk-forward split's N0) the bracket
+    search starts from the hint and grows or shrinks from there instead.
+    When ``g`` is already non-positive just above ``n-1`` that boundary is
+    returned, matching the batch and legacy solvers.
+    """
+
+    k = np.arange(n, dtype=float)
+    offsets = k - p
+    origin = float(n - 1)
+
+    def score(N: float) -> float:
+        return float(np.sum(offsets / (N - k)))
+
+    floor = 1e-9
+    left = origin + floor
+    if score(left) <= 0.0:
+        # Likelihood decreases for every N > n-1 (e.g. only the last interval is
+        # non-zero, p == n-1): the MLE sits on the boundary, as in the legacy solver.
+        return left, {"method": "brent", "bracket_steps": 0, "iterations": 0, "function_calls": 1}
+    width = 1.0 if n0_hint is None else max(float(n0_hint) - origin, floor)
+    right = origin + width
+    steps = 0
+    if n0_hint is not None and score(right) <= 0.0:
+        # Root lies below the hint: halve the width until the score turns positive.
+        while width > floor:
+            right = origin + width
+            width *= 0.5
+            steps += 1
+            check_cancelled(cancel)
+            if score(origin + width) > 0.0:
+                left = origin + width
+                break
+            if steps > max_bracket_steps:
+                raise RuntimeError("JM root search failed to bracket a solution within iteration limit")
+    else:
+        while score(right) > 0.0:
+            left = right
+            width *= 2.0
+            right = origin + width
+            steps += 1
+            check_cancelled(cancel)
+            if steps > max_bracket_steps:
+                raise RuntimeError("JM root search failed to bracket a solution within iteration limit")
+
+    root, info = optimize.brentq(score, left, right, xtol=xtol, full_output=True, disp=False)
+    if not info.converged:
+        raise RuntimeError("JM Brent solver failed to converge")
+    return float(root), {
+        "method": "brent",
+        "bracket_steps": steps,
+        "iterations": int(info.iterations),
+        "function_calls": int(info.function_calls) + steps + 1,
+    }
+
+
+def _solve_n0_batch(
+    series: Sequence[np.ndarray],
+    *,
+    xtol: float = 1e-10,
+    max_bracket_steps: int = 200,
+    max_iterations: int = 400,
+    cancel: CancelToken | None = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, dict[str, Any]]:
+    """Vectorized counterpart of :func:`_solve_n0_brent` over many series.
+
+    Series are packed into a zero-padded ``(m, L)`` array with a validity mask.
+    Every row is bracketed by doubling its width from ``n-1`` and then bisected
+    on the same rescaled score ``g(N) = sum((k-p)/(N-k))`` until the bracket is
+    narrower than ``xtol`` (relative once N exceeds 1).
+
+    Returns:
+        n0, total_time, weighted_time, solvable mask, diagnostics
+    """
+
+    lengths = np.array([s.size for s in series], dtype=int)
+    width_max = int(lengths.max())
+    k = np.arange(width_max, dtype=float)
+    mask = k[None, :] < lengths[:, None]
+    padded = np.zeros((lengths.size, width_max), dtype=float)
+    padded[mask] = np.concatenate([np.asarray(s, dtype=float) for s in series])
+
+    totals = padded.sum(axis=1)
+    weighted = (padded * k[None, :]).sum(axis=1)
+    safe_totals = np.where(totals > 0, totals, 1.0)
+    p = weighted / safe_totals
+    solvable = (lengths >= 2) & (totals > 0) & (p > (lengths - 1) / 2.0)
+
+    offsets = np.where(mask, k[None, :] - p[:, None], 0.0)
+    origin = (lengths - 1).astype(float)
+
+    def score(N: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        denom = N[:, None] - k[None, :]
+        denom = np.where(mask[rows], denom, 1.0)
+        return np.sum(offsets[rows] / denom, axis=1)
+
+    left = origin + 1e-9
+    width = np.ones_like(origin)
+    steps = np.zeros(lengths.size, dtype=int)
+    active = solvable.copy()
+    for _ in range(max_bracket_steps + 1):
+        rows = np.flatnonzero(active)
+        if rows.size == 0:
+            break
+        check_cancelled(cancel)
+        positive = score(origin[rows] + width[rows], rows) > 0.0
+        grow = rows[positive]
+        left[grow] = origin[grow] + width[grow]
+        width[grow] *= 2.0
+        steps[grow] += 1
+        active[rows[~positive]] = False
+    # Rows that never bracketed within the limit have no usable root.
+    solvable &= ~active
+    right = origin + width
+
+    iterations = 0
+    active = solvable & (right - left > xtol * np.maximum(1.0, right))
+    while np.any(active) and iterations < max_iterations:
+        iterations += 1
+        check_cancelled(cancel)
+        rows = np.flatnonzero(active)
+        mid = 0.5 * (left[rows] + right[rows])
+        positive = score(mid, rows) > 0.0
+        left[rows[positive]] = mid[positive]
+        right[rows[~positive]] = mid[~positive]
+        active[rows] = right[rows] - left[rows] > xtol * np.maximum(1.0, right[rows])
+    if np.any(active):
+        raise RuntimeError("JM batch bisection failed to converge")
+
+    n0 = np.where(solvable, 0.5 * (left + right), np.nan)
+    diagnostics: dict[str, Any] = {
+        "method": "batch-bisection",
+        "bracket_steps": steps,
+        "iterations": iterations,
+    }
+    return n0, totals, weighted, solvable, diagnostics
+
+
+def _solve_phi(n: int, n0: float, total_time: float, weighted_time: float) -> float:
+    denom = n0 * total_time - weighted_time
+    if denom <= 0:
+        raise RuntimeError("JM failed to compute phi due to non-positive denominator")
+    return n / denom
+
+
+def _expected_intervals(n0: float, phi: float, count: int) -> np.ndarray:
+    indices = np.arange(1, count + 1)
+    lambdas = phi * (n0 - indices + 1)
+    lambdas = np.maximum(lambdas, 1e-12)  # clamp to avoid negatives/zeros
+    return 1.0 / lambdas
 
 
 class JelinskiMorandaModel(ReliabilityModel):
     name = "Jelinski-Moranda"
     required_series_type = FailureSeriesType.TIME_BETWEEN_FAILURES
 
-    def __init__(self) -> None:
+    def __init__(self, solver: str = "brent") -> None:
+        if solver not in JM_SOLVERS:
+            raise ValueError(f"Unsupported JM solver '{solver}'; expected one of {JM_SOLVERS}")
+        self.solver = solver
         self.n0: float | None = None
         self.phi: float | None = None
+        self._n0_hint: float | None = None
+
+    def warm_start(self, state: Mapping[str, Any] | None) -> None:
+        self._n0_hint = None if not state else float(state["N0"])
+
+    def warm_start_state(self) -> Mapping[str, Any] | None:
+        return None if self.n0 is None else {"N0": float(self.n0)}
+
+    def config_fingerprint(self) -> Mapping[str, Any]:
+        return {"solver": self.solver}
+
+    def clone(self) -> "JelinskiMorandaModel":
+        return JelinskiMorandaModel(solver=self.solver)
 
     def _fit(
         self,
@@ -29,13 +272,14 @@ class JelinskiMorandaModel(ReliabilityModel):
         if n < 2:
             raise RuntimeError("JM model requires at least 2 failures")
 
-        total_time = float(np.sum(intervals))
+        # Running sums are cached on the dataset and shared by its walk-forward prefixes.
+        total_sums, weighted_sums = dataset.interval_prefix_sums()
+        total_time = float(total_sums[-1])
         if total_time <= 0:
             raise RuntimeError("JM model requires positive time intervals")
 
         # Statistic p = sum((i-1)*x_i) / sum(x_i), i from 1..n (0-based index used here)
-        indices_0 = np.arange(n, dtype=float)
-        weighted_time = float(np.sum(indices_0 * intervals))
+        weighted_time = float(weighted_sums[-1])
         p = weighted_time / total_time
 
         # Existence condition for finite N0: p > (n-1)/2
@@ -47,72 +291,106 @@ class JelinskiMorandaModel(ReliabilityModel):
                 f"JM has no finite MLE solution for this dataset (P={p:.6f} <= (n-1)/2={threshold:.6f})."
             )
 
-        def mle_eq(N: float) -> float:
-            k = np.arange(n, dtype=float)
-            term1 = np.sum(1.0 / (N - k))
-            term2 = n / (N - p)
-            return term1 - term2
+        if self.solver == "brent":
+            self.n0, solver_diag = _solve_n0_brent(n, p, n0_hint=self._n0_hint, cancel=self.cancel_token)
+        else:
+            self.n0, solver_diag = _solve_n0_linear(n, p, cancel=self.cancel_token)
 
-        # Bisection-style solve, mirroring the typical teaching implementation.
-        ex = 1e-6
-        ey = 1e-6
-        left = (n - 1) + 1e-6
-        right = max(float(n), left + 1.0)
+        self.phi = _solve_phi(n, self.n0, total_time, weighted_time)
+        predictions = _expected_intervals(self.n0, self.phi, n)
+        return self._build_result(
+            dataset,
+            self.n0,
+            self.phi,
+            predictions,
+            self.compute_metrics(intervals, predictions),
+            diagnostics={"solver": solver_diag},
+            evaluation_times=evaluation_times,
+        )
 
-        f_right = mle_eq(right)
-        steps = 0
-        while f_right > ey:
-            left = right
-            right = right + 1.0
-            f_right = mle_eq(right)
-            steps += 1
-            if steps > 200000:
-                raise RuntimeError("JM root search failed to bracket a solution within iteration limit")
+    def fit_many(
+        self,
+        datasets: Sequence[FailureDataset],
+        *,
+        evaluation_times: Sequence[np.ndarray | None] | None = None,
+    ) -> list[ModelResult | None]:
+        """Fit many TBF series at once.
 
-        # If we've landed close enough, accept right as the root.
-        if -ey <= f_right <= ey:
-            self.n0 = float(right)
-        else:
-            # Now f(left) should be > ey and f(right) <= ey; bisect until convergence.
-            for _ in range(200000):
-                if abs(right - left) <= ex:
-                    self.n0 = float((right + left) / 2.0)
-                    break
-                mid = (right + left) / 2.0
-                f_mid = mle_eq(mid)
-                if f_mid > ey:
-                    left = mid
-                elif f_mid < -ey:
-                    right = mid
-                else:
-                    self.n0 = float(mid)
-                    break
-            else:
-                raise RuntimeError("JM bisection failed to converge")
+        The P statistic, the existence check, the geometric bracketing and a
+        bisection on the JM score equation all run over one zero-padded 2-D
+        array, and the metrics of equal-length series are computed together by
+        :meth:`compute_metrics_many`. Entries are ``None`` where :meth:`fit`
+        would raise (too few failures, non-positive total time or no finite
+        MLE); calling :meth:`fit` on that dataset reports why. Afterwards ``n0``/``phi`` hold the last
+        successful fit, as after fitting the datasets one by one.
+        """
 
-        denom = self.n0 * total_time - weighted_time
-        if denom <= 0:
-            raise RuntimeError("JM failed to compute phi due to non-positive denominator")
-        self.phi = n / denom
+        datasets = list(datasets)
+        if evaluation_times is not None and len(evaluation_times) != len(datasets):
+            raise ValueError("evaluation_times must align with datasets")
+        for dataset in datasets:
+            self._validate_dataset(dataset)
+        if not datasets:
+            return []
 
-        predictions = self._expected_intervals(n)
-        metrics = self.compute_metrics(intervals, predictions)
+        series = [dataset.failure_intervals() for dataset in datasets]
+        n0, totals, weighted, solvable, solver_diag = _solve_n0_batch(series, cancel=self.cancel_token)
+
+        fitted: list[tuple[int, float, float, np.ndarray]] = []
+        for idx, intervals in enumerate(series):
+            if not solvable[idx]:
+                continue
+            root = float(n0[idx])
+            try:
+                phi = _solve_phi(intervals.size, root, float(totals[idx]), float(weighted[idx]))
+            except RuntimeError:
+                continue
+            fitted.append((idx, root, phi, _expected_intervals(root, phi, intervals.size)))
+        metrics = self.compute_metrics_many(
+            [series[idx] for idx, *_ in fitted], [predictions for *_, predictions in fitted]
+        )
+
+        results: list[ModelResult | None] = [None] * len(datasets)
+        for (idx, fitted_n0, phi, predictions), fit_metrics in zip(fitted, metrics):
+            results[idx] = self._build_result(
+                datasets[idx],
+                fitted_n0,
+                phi,
+                predictions,
+                fit_metrics,
+                diagnostics={
+                    "solver": {**solver_diag, "bracket_steps": int(solver_diag["bracket_steps"][idx])}
+                },
+                evaluation_times=None if evaluation_times is None else evaluation_times[idx],
+            )
+            self.n0, self.phi = fitted_n0, phi
+        return results
+
+    def _build_result(
+        self,
+        dataset: FailureDataset,
+        n0: float,
+        phi: float,
+        predictions: np.ndarray,
+        metrics: Mapping[str, float],
+        *,
+        diagnostics: dict[str, Any],
+        evaluation_times: np.ndarray | None,
+    ) -> ModelResult:
         times = dataset.time_axis if evaluation_times is None else evaluation_times
         return ModelResult(
             model_name=self.name,
-            parameters={"N0": float(self.n0), "phi": float(self.phi)},
+            parameters={"N0": float(n0), "phi": float(phi)},
             times=times,
             predictions=predictions,
             metrics=metrics,
+            diagnostics=diagnostics,
         )
 
     def _expected_intervals(self, count: int) -> np.ndarray:
         if self.n0 is None or self.phi is None:
             raise RuntimeError("Model must be fitted before predicting intervals")
-        indices = np.arange(1, count + 1)
-        lambdas = self.phi * (self.n0 - indices + 1)
-        lambdas = np.maximum(lambdas, 1e-12)  # clamp to avoid negatives/zeros
-        return 1.0 / lambdas
+        return _expected_intervals(self.n0, self.phi, count)
 
     @staticmethod
     def _neg_log_likelihood(params: np.ndarray, intervals: np.ndarray) -> float:
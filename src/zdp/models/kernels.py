@@ -0,0 +1,82 @@
+"""Cached RBF Gram matrices over a dataset's time axis for precomputed-kernel SVR fits."""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+
+def resolve_rbf_gamma(gamma: str | float, time_axis: np.ndarray) -> float:
+    """Translate an SVR ``gamma`` setting into raw time units.
+
+    The regular SVR pipelines standardise the time axis first, where both
+    ``"scale"`` and ``"auto"`` resolve to 1.0 for a single feature. On the raw axis
+    that becomes ``gamma / var(time_axis)`` (with StandardScaler's unit scale for
+    a constant axis), so precomputed kernels reproduce the pipeline's kernel.
+    """
+
+    if gamma in ("scale", "auto"):
+        scaled_gamma = 1.0
+    else:
+        scaled_gamma = float(gamma)
+    variance = float(np.var(np.asarray(time_axis, dtype=float)))
+    return scaled_gamma / (variance if variance > 0 else 1.0)
+
+
+def squared_distances(left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    """``(left_i - right_j) ** 2`` for 1-D inputs."""
+
+    diff = np.asarray(left, dtype=float)[:, None] - np.asarray(right, dtype=float)[None, :]
+    return diff * diff
+
+
+def rbf_kernel(left: np.ndarray, right: np.ndarray, gamma: float) -> np.ndarray:
+    """``exp(-gamma * (left_i - right_j) ** 2)`` for 1-D inputs."""
+
+    return np.exp(-gamma * squared_distances(left, right))
+
+
+class GramCache:
+    """Small LRU of RBF Gram matrices keyed by time axis and gamma.
+
+    A request for an axis that is a prefix of a cached axis (with the same gamma)
+    is served as a read-only slice. Meant to live for one call (e.g. the
+    component fits of one hybrid fit), so matrices are freed with it.
+    """
+
+    def __init__(self, max_entries: int = 8) -> None:
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[int, float], tuple[np.ndarray, np.ndarray]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def gram(self, time_axis: np.ndarray, gamma: float) -> np.ndarray:
+        with self._lock:
+            return self._gram(np.asarray(time_axis, dtype=float), gamma)
+
+    def _gram(self, axis: np.ndarray, gamma: float) -> np.ndarray:
+        size = axis.size
+        for key, (cached_axis, matrix) in self._entries.items():
+            if key[1] == gamma and cached_axis.size >= size and np.array_equal(cached_axis[:size], axis):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return matrix[:size, :size]
+        self.misses += 1
+        matrix = rbf_kernel(axis, axis, gamma)
+        matrix.setflags(write=False)
+        self._entries[(id(matrix), gamma)] = (axis.copy(), matrix)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return matrix
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+__all__ = ["GramCache", "rbf_kernel", "resolve_rbf_gamma", "squared_distances"]
@@ -2,26 +2,72 @@
 
 from __future__ import annotations
 
+from typing import Any, Mapping
+
 import numpy as np
-from scipy import optimize
 
 from zdp.data import FailureDataset, FailureSeriesType
 
 from .base import ModelResult, ReliabilityModel
+from .fitting import (
+    FIT_METHODS,
+    LIKELIHOODS,
+    MeanValueFamily,
+    curve_fit_with_counts,
+    likelihood_metrics,
+    profile_likelihood_fit,
+)
 
 
 def _s_shaped_mean_value(t: np.ndarray, a: float, b: float) -> np.ndarray:
     return a * (1.0 - (1.0 + b * t) * np.exp(-b * t))
 
 
+def _s_shaped_jacobian(t: np.ndarray, a: float, b: float) -> np.ndarray:
+    decay = np.exp(-b * t)
+    return np.column_stack((1.0 - (1.0 + b * t) * decay, a * b * t**2 * decay))
+
+
+S_SHAPED_FAMILY = MeanValueFamily(
+    shape=lambda t, b: 1.0 - (1.0 + b * t) * np.exp(-b * t),
+    shape_db=lambda t, b: b * t**2 * np.exp(-b * t),
+    log_density=lambda t, b: 2.0 * np.log(b) + np.log(t) - b * t,
+    log_density_db=lambda t, b: 2.0 / b - t,
+)
+
+
 class SShapedModel(ReliabilityModel):
     name = "Yamada S-Shaped"
     required_series_type = FailureSeriesType.CUMULATIVE_FAILURES
     param_count = 2
 
-    def __init__(self) -> None:
+    def __init__(self, fit_method: str = "lsq", likelihood: str = "auto") -> None:
+        if fit_method not in FIT_METHODS:
+            raise ValueError(f"Unsupported fit method '{fit_method}'; expected one of {FIT_METHODS}")
+        if likelihood not in LIKELIHOODS:
+            raise ValueError(f"Unsupported likelihood '{likelihood}'; expected one of {LIKELIHOODS}")
+        self.fit_method = fit_method
+        self.likelihood = likelihood
         self.a: float | None = None
         self.b: float | None = None
+        self._warm_params: tuple[float, float] | None = None
+
+    def warm_start(self, state: Mapping[str, Any] | None) -> None:
+        self._warm_params = None
+        if state and state["a"] > 0 and state["b"] > 0:
+            # curve_fit rejects starting points on the (0, inf) bound.
+            self._warm_params = (float(state["a"]), float(state["b"]))
+
+    def warm_start_state(self) -> Mapping[str, Any] | None:
+        if self.a is None or self.b is None:
+            return None
+        return {"a": self.a, "b": self.b}
+
+    def config_fingerprint(self) -> Mapping[str, Any]:
+        return {"fit_method": self.fit_method, "likelihood": self.likelihood}
+
+    def clone(self) -> "SShapedModel":
+        return SShapedModel(fit_method=self.fit_method, likelihood=self.likelihood)
 
     def _fit(
         self,
@@ -32,24 +78,43 @@ class SShapedModel(ReliabilityModel):
         time_axis = dataset.time_axis
         cumulative = dataset.cumulative_failures()
 
-        params, _ = optimize.curve_fit(
-            _s_shaped_mean_value,
-            time_axis,
-            cumulative,
-            p0=(cumulative.max() * 1.1, 0.01),
-            bounds=(0.0, np.inf),
-            maxfev=20000,
-        )
+        log_likelihood: float | None = None
+        if self.fit_method == "mle":
+            a, b, log_likelihood, fit_diag = profile_likelihood_fit(
+                S_SHAPED_FAMILY,
+                time_axis,
+                cumulative,
+                likelihood=self.likelihood,
+                exact_times=bool(dataset.metadata.get("exact_failure_times", False)),
+                b_hint=None if self._warm_params is None else self._warm_params[1],
+            )
+            params = (a, b)
+        else:
+            params, fit_diag = curve_fit_with_counts(
+                _s_shaped_mean_value,
+                _s_shaped_jacobian,
+                time_axis,
+                cumulative,
+                p0=self._warm_params or (cumulative.max() * 1.1, 0.01),
+                bounds=(0.0, np.inf),
+                maxfev=20000,
+                cancel=self.cancel_token,
+            )
         self.a, self.b = map(float, params)
         eval_times = evaluation_times if evaluation_times is not None else time_axis
         predictions = _s_shaped_mean_value(eval_times, self.a, self.b)
-        metrics = self.compute_metrics(cumulative, _s_shaped_mean_value(time_axis, self.a, self.b))
+        metrics = dict(
+            self.compute_metrics(cumulative, _s_shaped_mean_value(time_axis, self.a, self.b))
+        )
+        if log_likelihood is not None:
+            metrics.update(likelihood_metrics(log_likelihood, self.param_count, cumulative.size))
         return ModelResult(
             model_name=self.name,
             parameters={"a": self.a, "b": self.b},
             times=eval_times,
             predictions=predictions,
             metrics=metrics,
+            diagnostics={"optimizer": fit_diag},
         )
 
 
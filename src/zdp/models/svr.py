@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Sequence
 
 import numpy as np
 from sklearn.pipeline import Pipeline
@@ -12,10 +13,14 @@ from sklearn.svm import SVR
 from zdp.data import FailureDataset, FailureSeriesType
 
 from .base import ModelResult, ReliabilityModel
+from .cancellation import check_cancelled
+from .kernels import rbf_kernel, resolve_rbf_gamma, squared_distances
 
 
 @dataclass
 class SVRConfig:
+    # "precomputed" is an RBF kernel evaluated from a Gram matrix over the time axis;
+    # walk-forward splits share one squared-distance matrix.
     kernel: str = "rbf"
     c: float = 10.0
     epsilon: float = 0.01
@@ -26,6 +31,7 @@ class SupportVectorRegressionModel(ReliabilityModel):
     name = "SVR"
     required_series_type = FailureSeriesType.CUMULATIVE_FAILURES
     param_count = 4
+    walk_forward_fast_path = "svr_shared_distances"
 
     def __init__(self, config: SVRConfig | None = None) -> None:
         self.config = config or SVRConfig()
@@ -40,6 +46,8 @@ class SupportVectorRegressionModel(ReliabilityModel):
         *,
         evaluation_times: np.ndarray | None = None,
     ) -> ModelResult:
+        if self.config.kernel == "precomputed":
+            return self._fit_precomputed(dataset, evaluation_times=evaluation_times)
         time_axis = dataset.time_axis.reshape(-1, 1)
         targets = dataset.cumulative_failures()
         pipeline = Pipeline(
@@ -74,5 +82,68 @@ class SupportVectorRegressionModel(ReliabilityModel):
             metrics=metrics,
         )
 
+    def _fit_precomputed(
+        self,
+        dataset: FailureDataset,
+        *,
+        evaluation_times: np.ndarray | None = None,
+        distances: np.ndarray | None = None,
+    ) -> ModelResult:
+        """Fit on an RBF Gram matrix; ``distances`` may hold squared distances over a longer axis."""
+
+        time_axis = dataset.time_axis
+        targets = dataset.cumulative_failures()
+        gamma = resolve_rbf_gamma(self.config.gamma, time_axis)
+        if distances is None:
+            distances = squared_distances(time_axis, time_axis)
+        size = time_axis.size
+        gram = np.exp(-gamma * distances[:size, :size])
+        svr = SVR(kernel="precomputed", C=self.config.c, epsilon=self.config.epsilon)
+        svr.fit(gram, targets)
+        eval_times = evaluation_times if evaluation_times is not None else time_axis
+        eval_times = np.asarray(eval_times, dtype=float)
+        predictions = svr.predict(rbf_kernel(eval_times, time_axis, gamma))
+        metrics = self.compute_metrics(targets, svr.predict(gram))
+        return ModelResult(
+            model_name=self.name,
+            parameters={
+                "kernel": self.config.kernel,
+                "C": self.config.c,
+                "epsilon": self.config.epsilon,
+                "gamma": float(gamma),
+            },
+            times=eval_times,
+            predictions=predictions,
+            metrics=metrics,
+        )
+
+    def walk_forward_forecasts(
+        self,
+        dataset: FailureDataset,
+        train_stops: Sequence[int],
+        horizon: int,
+        *,
+        warm_start: bool = False,
+    ) -> tuple[list[np.ndarray | None], list[int | None]] | None:
+        if self.config.kernel != "precomputed":
+            return None
+        # Squared distances are shared by every split; each split still resolves
+        # gamma from its own training prefix, exactly like a standalone fit.
+        distances = squared_distances(dataset.time_axis, dataset.time_axis)
+        forecasts: list[np.ndarray | None] = []
+        for stop in train_stops:
+            check_cancelled(self.cancel_token)
+            try:
+                result = self._fit_precomputed(
+                    dataset.slice(stop),
+                    evaluation_times=dataset.time_axis[stop : stop + horizon],
+                    distances=distances,
+                )
+            except Exception:
+                forecasts.append(None)
+                continue
+            forecasts.append(np.asarray(result.predictions, dtype=float))
+        return forecasts, [None] * len(forecasts)
+
 
 __all__ = ["SupportVectorRegressionModel", "SVRConfig"]
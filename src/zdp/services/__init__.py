@@ -1,6 +1,15 @@
 """Service layer utilities for orchestrating ZDP analyses."""
 
-from .analysis import AnalysisService, RankedModelResult, WalkForwardConfig
+from .analysis import (
+    AnalysisService,
+    FleetResult,
+    FleetSummary,
+    ModelCompletion,
+    RankedModelResult,
+    WalkForwardConfig,
+    rank_results,
+)
+from .cache import FitCache, FitMemo, default_cache_dir
 from .experiments import (
     ExperimentConfig,
     LoadedExperiment,
@@ -8,12 +17,23 @@ from .experiments import (
     export_experiment_zip,
     load_experiment_zip,
 )
+from .sinks import JsonlSink, ParquetSink, open_sink
 
 __all__ = [
 
     "AnalysisService",
+    "FleetResult",
+    "FleetSummary",
+    "ModelCompletion",
     "RankedModelResult",
+    "rank_results",
     "WalkForwardConfig",
+    "FitCache",
+    "FitMemo",
+    "default_cache_dir",
+    "JsonlSink",
+    "ParquetSink",
+    "open_sink",
     "ExperimentConfig",
     "LoadedExperiment",
     "default_experiment_config",
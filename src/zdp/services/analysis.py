@@ -2,15 +2,27 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Iterable, List, Sequence
+import asyncio
+import copy
+import functools
+import itertools
+import queue
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, Generator, Hashable, Iterable, Iterator, List, Mapping, Sequence
 
 import numpy as np
 
 from zdp.data import FailureDataset, FailureSeriesType
-from zdp.models import ModelResult, ReliabilityModel
+from zdp.models import CancelToken, FitCancelled, ModelResult, ReliabilityModel
 
+from .cache import FitCache, FitMemo, fit_cache_key
 from .intervals import normal_prediction_interval
+from .parallel import process_pool, report_started, spawn_queue, terminate_pool
+from .sinks import ResultSink, open_sink
 from .validation import WalkForwardConfig, walk_forward_validate
 
 
@@ -22,11 +34,246 @@ class RankedModelResult:
     result: ModelResult
 
 
+@dataclass
+class ModelCompletion:
+    """One finished model, as yielded by :meth:`AnalysisService.iter_run`."""
+
+    index: int  # position among the models that support the dataset
+    total: int
+    result: ModelResult
+    seconds: float
+
+
+@dataclass
+class FleetResult:
+    """Ranked results for one dataset of a fleet run (:meth:`AnalysisService.iter_run_many`)."""
+
+    key: str
+    ranked: list[RankedModelResult]
+    skipped: list[dict[str, Any]]
+
+
+@dataclass
+class FleetSummary:
+    """Counts and throughput of :meth:`AnalysisService.run_many`."""
+
+    datasets: int
+    fits: int
+    failed: int
+    seconds: float
+
+    @property
+    def fits_per_second(self) -> float:
+        return self.fits / self.seconds if self.seconds > 0 else float("inf")
+
+
+def rank_results(
+    results: Iterable[ModelResult],
+    *,
+    rank_by: str | None = None,
+    validation_enabled: bool = False,
+) -> list[RankedModelResult]:
+    """Stable-sort results by ``rank_by`` (default ``cv_rmse``/``rmse``) and assign ranks."""
+
+    metric = (rank_by or ("cv_rmse" if validation_enabled else "rmse")).lower()
+    reverse = metric in {"r2", "cv_r2"}
+
+    def _score(res: ModelResult) -> float:
+        value = res.metrics.get(metric)
+        if value is None:
+            value = res.metrics.get("rmse", float("inf"))
+        return float(value)
+
+    ordered = sorted(results, key=_score, reverse=reverse)
+    return [RankedModelResult(rank=i + 1, result=res) for i, res in enumerate(ordered)]
+
+
+def _evaluate_model(
+    model: ReliabilityModel,
+    dataset: FailureDataset,
+    evaluation_times: np.ndarray | None,
+    validation: WalkForwardConfig,
+    budget: float | None = None,
+    deadline: float | None = None,
+    parent: CancelToken | None = None,
+    memo: FitMemo | None = None,
+    task: Hashable | None = None,
+) -> tuple[ModelResult, float]:
+    """Fit one model and attach walk-forward metrics; returns ``(result, seconds)``.
+
+    Module-level so it can be shipped to process-pool workers. ``seconds`` is
+    the wall time of the whole task, measured in the worker. The ``budget``
+    clock starts here, so time spent queued for a worker does not count; with a
+    ``task`` id the start is also announced through :func:`report_started`.
+    """
+
+    start = time.perf_counter()
+    if task is not None:
+        report_started(task)
+    # Fit a shallow copy, so concurrent runs sharing registered models never see
+    # each other's cancel token or fitted state.
+    model = copy.copy(model)
+    model.cancel_token = CancelToken.with_budget(budget, deadline=deadline, parent=parent)
+    if memo is not None:
+        base = memo.fit(model, dataset, dataset.size, evaluation_times=evaluation_times)
+    else:
+        base = model.fit(dataset, evaluation_times=evaluation_times)
+    # Fits without cancellation checks (SVR, GM) can still overrun their budget.
+    model.cancel_token.check()
+    result = _with_validation(model, dataset, base, validation, memo=memo)
+    return result, time.perf_counter() - start
+
+
+def _with_validation(
+    model: ReliabilityModel,
+    dataset: FailureDataset,
+    base: ModelResult,
+    validation: WalkForwardConfig,
+    *,
+    memo: FitMemo | None = None,
+) -> ModelResult:
+    """Merge walk-forward ``cv_*`` metrics and diagnostics into a fitted result."""
+
+    diagnostics: dict[str, object] = dict(base.diagnostics or {})
+    if validation.enabled:
+        cv_metrics, cv_diag = walk_forward_validate(model, dataset, validation, memo=memo)
+        diagnostics.update(cv_diag)
+    else:
+        cv_metrics = {}
+    merged_metrics = dict(base.metrics)
+    merged_metrics.update(cv_metrics)
+    return ModelResult(
+        model_name=base.model_name,
+        parameters=base.parameters,
+        times=base.times,
+        predictions=base.predictions,
+        metrics=merged_metrics,
+        diagnostics=diagnostics or None,
+    )
+
+
+def _evaluate_group(
+    model: ReliabilityModel,
+    datasets: Sequence[FailureDataset],
+    validation: WalkForwardConfig,
+    budget: float | None = None,
+    deadline: float | None = None,
+) -> list[ModelResult | tuple[str, str]]:
+    """Fit one model on many datasets, returning a result or ``(reason, detail)`` per dataset.
+
+    Models exposing ``fit_many`` (JM, BP) fit the whole group in one vectorized
+    call; others, groups where ``fit_many`` fails and its ``None`` entries are
+    fitted one by one, so errors read exactly as from ``fit``. Each dataset gets
+    ``budget`` seconds (the vectorized call the sum) and nothing runs past
+    ``deadline``. Walk-forward validation still runs per dataset through the
+    model's fast path.
+    """
+
+    model = copy.copy(model)
+    bases: Sequence[ModelResult | None] | None = None
+    fit_many = getattr(model, "fit_many", None)
+    if callable(fit_many) and len(datasets) > 1:
+        group_budget = None if budget is None else budget * len(datasets)
+        model.cancel_token = CancelToken.with_budget(group_budget, deadline=deadline)
+        try:
+            bases = fit_many(datasets)
+        except Exception:
+            bases = None
+    outputs: list[ModelResult | tuple[str, str]] = []
+    for index, dataset in enumerate(datasets):
+        model.cancel_token = CancelToken.with_budget(budget, deadline=deadline)
+        try:
+            base = bases[index] if bases is not None else None
+            if base is None:
+                base = model.fit(dataset)
+            model.cancel_token.check()
+            outputs.append(_with_validation(model, dataset, base, validation))
+        except FitCancelled as exc:
+            outputs.append((exc.reason, f"{type(exc).__name__}: {exc}"))
+        except Exception as exc:
+            outputs.append(("error", f"{type(exc).__name__}: {exc}"))
+    return outputs
+
+
+def _attach_interval(
+    result: ModelResult, dataset: FailureDataset, prediction_interval_alpha: float | None
+) -> ModelResult:
+    """Add the in-sample prediction interval; cheap, so it is never cached."""
+
+    if prediction_interval_alpha is None:
+        return result
+    actual = (
+        dataset.cumulative_failures()
+        if dataset.series_type == FailureSeriesType.CUMULATIVE_FAILURES
+        else dataset.failure_intervals()
+    )
+    predicted = np.asarray(result.predictions, dtype=float)
+    length = int(min(actual.size, predicted.size))
+    if length < 2:
+        return result
+    lower, upper, pi_diag = normal_prediction_interval(
+        actual[:length], predicted[:length], alpha=prediction_interval_alpha
+    )
+    diagnostics = dict(result.diagnostics or {})
+    diagnostics["prediction_interval"] = {
+        "lower": lower,
+        "upper": upper,
+        **pi_diag,
+    }
+    return replace(result, diagnostics=diagnostics)
+
+
 class AnalysisService:
-    """Run a collection of models against a dataset and rank the outcomes."""
+    """Run a collection of models against a dataset and rank the outcomes.
 
-    def __init__(self, models: Iterable[ReliabilityModel] | None = None) -> None:
+    With ``max_workers > 1`` (or an explicit ``executor``) each model's fit and
+    walk-forward validation run as one task on a process pool.
+    Results are collected in registration order before the stable ranking sort,
+    so the ranking does not depend on completion order.
+
+    ``model_budget`` and ``run_budget`` (seconds) bound each model and the whole
+    run. Fits stop cooperatively at their next cancel-token check. On a pool,
+    a model still running ``kill_grace`` seconds past its own budget (timed from
+    when it reached a worker) is abandoned; if the service owns the pool, it is
+    replaced and the other unfinished models are resubmitted. Once the run budget
+    is spent, everything left is abandoned and an owned pool is terminated.
+    Every model without a result is listed in ``diagnostics["skipped"]`` with its
+    reason.
+
+    With a :class:`~zdp.services.cache.FitCache`, fits plus walk-forward metrics
+    are looked up before any work is scheduled and stored once computed;
+    prediction intervals and ranking are always recomputed. Hits are marked with
+    ``diagnostics["fit_cache"] == "hit"``.
+
+    A :class:`~zdp.services.cache.FitMemo` (kept by the caller across runs, as
+    the GUI does) plays the same role in memory. Sequential runs also memoize
+    the individual full and walk-forward prefix fits, so changing only the
+    ranking metric or interval alpha refits nothing, and changing the
+    walk-forward window refits only the new splits.
+    """
+
+    # Extra time given to cooperative cancellation before pool workers are killed.
+    kill_grace: float = 1.0
+
+    def __init__(
+        self,
+        models: Iterable[ReliabilityModel] | None = None,
+        *,
+        max_workers: int = 1,
+        executor: Executor | None = None,
+        model_budget: float | None = None,
+        run_budget: float | None = None,
+        cache: FitCache | None = None,
+        memo: FitMemo | None = None,
+    ) -> None:
         self._models: List[ReliabilityModel] = list(models or [])
+        self.max_workers = max_workers
+        self.executor = executor
+        self.model_budget = model_budget
+        self.run_budget = run_budget
+        self.cache = cache
+        self.memo = memo
+        self.diagnostics: dict[str, Any] = {"skipped": []}
 
     def register(self, *models: ReliabilityModel) -> None:
         self._models.extend(models)
@@ -43,69 +290,495 @@ class AnalysisService:
         validation: WalkForwardConfig | None = None,
         rank_by: str | None = None,
         prediction_interval_alpha: float | None = None,
+        cancel_token: CancelToken | None = None,
     ) -> list[RankedModelResult]:
-        results: list[ModelResult] = []
+        stream = self.iter_run(
+            dataset,
+            evaluation_times=evaluation_times,
+            validation=validation,
+            rank_by=rank_by,
+            prediction_interval_alpha=prediction_interval_alpha,
+            cancel_token=cancel_token,
+        )
+        while True:
+            try:
+                next(stream)
+            except StopIteration as stop:
+                return stop.value
+
+    async def arun(
+        self,
+        dataset: FailureDataset,
+        *,
+        evaluation_times: np.ndarray | None = None,
+        validation: WalkForwardConfig | None = None,
+        rank_by: str | None = None,
+        prediction_interval_alpha: float | None = None,
+        executor: Executor | None = None,
+    ) -> list[RankedModelResult]:
+        """Awaitable :meth:`run` that keeps the event loop free.
+
+        The run is driven from ``executor`` (the loop's default thread pool when
+        ``None``); fits themselves still go to the service's own pool when one is
+        configured. Every fit works on a copy of the registered model, so
+        concurrent calls on one service do not share fit state and models need
+        not support :meth:`~zdp.models.ReliabilityModel.clone`. Cancelling the awaiting task cancels the
+        run's token: fits stop at their next cancellation check and
+        :class:`asyncio.CancelledError` propagates without waiting for them.
+        ``diagnostics`` reflects the most recently finished call.
+        """
+
+        token = CancelToken()
+        service = AnalysisService(
+            self._models,
+            max_workers=self.max_workers,
+            executor=self.executor,
+            model_budget=self.model_budget,
+            run_budget=self.run_budget,
+            cache=self.cache,
+            memo=self.memo,
+        )
+        service.kill_grace = self.kill_grace
+        call = functools.partial(
+            service.run,
+            dataset,
+            evaluation_times=evaluation_times,
+            validation=validation,
+            rank_by=rank_by,
+            prediction_interval_alpha=prediction_interval_alpha,
+            cancel_token=token,
+        )
+        loop = asyncio.get_running_loop()
+        try:
+            ranked = await loop.run_in_executor(executor, call)
+        except asyncio.CancelledError:
+            token.cancel()
+            raise
+        self.diagnostics = service.diagnostics
+        return ranked
+
+    def iter_run(
+        self,
+        dataset: FailureDataset,
+        *,
+        evaluation_times: np.ndarray | None = None,
+        validation: WalkForwardConfig | None = None,
+        rank_by: str | None = None,
+        prediction_interval_alpha: float | None = None,
+        cancel_token: CancelToken | None = None,
+    ) -> Generator[ModelCompletion, None, list[RankedModelResult]]:
+        """Yield a :class:`ModelCompletion` per model as it finishes; return the ranked list.
+
+        Completions arrive in finishing order when running on a pool. The ranked
+        list is the generator's return value (``StopIteration.value``), computed
+        from registration order so it matches :meth:`run`.
+        ``cancel_token`` lets the caller stop the run early; models that did not
+        finish are reported in ``diagnostics["skipped"]``.
+        """
+
         validation = validation or WalkForwardConfig(enabled=False)
+        run_token = CancelToken.with_budget(self.run_budget, parent=cancel_token)
+        skipped: list[dict[str, Any]] = []
+        self.diagnostics = {"skipped": skipped}
+
+        models: list[ReliabilityModel] = []
         for model in self._models:
-            if not model.supports(dataset.series_type):
+            if model.supports(dataset.series_type):
+                models.append(model)
+            else:
+                expected = model.required_series_type.value if model.required_series_type else "any"
+                skipped.append(
+                    {"model": model.name, "reason": "unsupported", "detail": f"expects '{expected}' data"}
+                )
+        args = (dataset, evaluation_times, validation)
+        budget_args = (self.model_budget, run_token.deadline, cancel_token)
+        total = len(models)
+
+        def skip(model: ReliabilityModel, exc: BaseException | None, reason: str, seconds: float) -> None:
+            if isinstance(exc, FitCancelled):
+                reason = exc.reason
+            skipped.append(
+                {
+                    "model": model.name,
+                    "reason": reason,
+                    "detail": "" if exc is None else f"{type(exc).__name__}: {exc}",
+                    "seconds": seconds,
+                }
+            )
+
+        finished: dict[int, ModelResult] = {}
+        keys: dict[int, str] = {}
+
+        def finish(index: int, result: ModelResult, seconds: float) -> ModelCompletion:
+            if index in keys:
+                self._store(keys[index], result)
+            result = _attach_interval(result, dataset, prediction_interval_alpha)
+            finished[index] = result
+            return ModelCompletion(index=index, total=total, result=result, seconds=seconds)
+
+        todo: list[int] = []
+        for index, model in enumerate(models):
+            started = time.perf_counter()
+            key, cached = self._lookup(model, dataset, evaluation_times, validation)
+            if cached is None:
+                if key is not None:
+                    keys[index] = key
+                todo.append(index)
                 continue
+            yield finish(index, cached, time.perf_counter() - started)
+
+        executor = self.executor
+        owns_executor = False
+        workers = min(self.max_workers, len(todo))
+        started_queue = None
+        if executor is None and workers > 1:
+            started_queue = spawn_queue()
+            executor = process_pool(workers, started=started_queue)
+            owns_executor = True
+
+        if executor is None:
+            for index in todo:
+                model = models[index]
+                started = time.perf_counter()
+                if run_token.cancelled:
+                    skip(model, FitCancelled(run_token.reason or "cancelled"), "", 0.0)
+                    continue
+                try:
+                    result, seconds = _evaluate_model(model, *args, *budget_args, self.memo)
+                except Exception as exc:
+                    skip(model, exc, "error", time.perf_counter() - started)
+                    continue
+                yield finish(index, result, seconds)
+        else:
+            run_deadline = None if run_token.deadline is None else run_token.deadline + self.kill_grace
+            poll = run_deadline is not None or self.model_budget is not None or cancel_token is not None
+            killed = False
+            generation = 0
+            pending: dict[Future[tuple[ModelResult, float]], int] = {}
+            by_task: dict[tuple[int, int], Future[tuple[ModelResult, float]]] = {}
+            started: dict[Future[tuple[ModelResult, float]], float] = {}
+            # Abandoned after their budget but possibly still holding a worker.
+            stragglers: list[Future[tuple[ModelResult, float]]] = []
+
+            def submit(index: int) -> None:
+                task = (generation, index)
+                future = executor.submit(_evaluate_model, models[index], *args, *budget_args, task=task)
+                pending[future] = index
+                by_task[task] = future
+
+            def mark_started(now: float) -> None:
+                if started_queue is not None:
+                    # Owned pools: workers report when they pick a task up.
+                    while True:
+                        try:
+                            task, at = started_queue.get_nowait()
+                        except queue.Empty:
+                            return
+                        future = by_task.get(task)
+                        if future in pending:
+                            started.setdefault(future, at)
+                # Other executors: assume futures run in submission order on
+                # ``max_workers`` workers (an underestimate only delays kills).
+                stragglers[:] = [future for future in stragglers if not future.done()]
+                busy = len(stragglers)
+                for future in pending:
+                    if busy >= max(1, int(self.max_workers)):
+                        break
+                    if future.running():
+                        busy += 1
+                        started.setdefault(future, now)
+
             try:
-                base = model.fit(dataset, evaluation_times=evaluation_times)
-                diagnostics: dict[str, object] = dict(base.diagnostics or {})
-
-                if validation.enabled:
-                    cv_metrics, cv_diag = walk_forward_validate(model, dataset, validation)
-                    diagnostics.update(cv_diag)
-                else:
-                    cv_metrics = {}
-
-                if prediction_interval_alpha is not None:
-                    # Compute interval on in-sample alignment to the dataset.
-                    actual = (
-                        dataset.cumulative_failures()
-                        if dataset.series_type == FailureSeriesType.CUMULATIVE_FAILURES
-                        else dataset.failure_intervals()
-                    )
-                    predicted = np.asarray(base.predictions, dtype=float)
-                    length = int(min(actual.size, predicted.size))
-                    if length >= 2:
-                        lower, upper, pi_diag = normal_prediction_interval(
-                            actual[:length], predicted[:length], alpha=prediction_interval_alpha
-                        )
-                        diagnostics["prediction_interval"] = {
-                            "lower": lower,
-                            "upper": upper,
-                            **pi_diag,
-                        }
+                for index in todo:
+                    submit(index)
+                while pending:
+                    done, _ = wait(pending, timeout=0.1 if poll else None, return_when=FIRST_COMPLETED)
+                    now = time.time()
+                    mark_started(now)
+                    for future in done:
+                        index = pending.pop(future)
+                        began = started.pop(future, now)
+                        try:
+                            result, seconds = future.result()
+                        except Exception as exc:
+                            skip(models[index], exc, "error", now - began)
+                            continue
+                        yield finish(index, result, seconds)
+                    stop = None if cancel_token is None else cancel_token.reason
+                    if run_deadline is not None and now >= run_deadline:
+                        stop = "timeout"
+                    if pending and stop is not None:
+                        for future, index in pending.items():
+                            future.cancel()
+                            skip(models[index], FitCancelled(stop), "", now - started.get(future, now))
+                        pending.clear()
+                        if owns_executor:
+                            terminate_pool(executor)
+                            killed = True
+                        break
+                    if self.model_budget is None:
+                        continue
+                    limit = self.model_budget + self.kill_grace
+                    overdue = [
+                        future for future, began in started.items() if future in pending and now - began >= limit
+                    ]
+                    for future in overdue:
+                        future.cancel()
+                        skip(models[pending.pop(future)], FitCancelled("timeout"), "", now - started.pop(future))
+                        stragglers.append(future)
+                    if overdue and owns_executor:
+                        # A single worker cannot be killed: replace the pool and resubmit
+                        # the other unfinished models, which get fresh budgets.
+                        terminate_pool(executor)
+                        if not pending:
+                            killed = True
+                            break
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        executor = process_pool(workers, started=started_queue)
+                        generation += 1
+                        requeue = list(pending.values())
+                        pending.clear()
+                        by_task.clear()
+                        started.clear()
+                        stragglers.clear()
+                        for index in requeue:
+                            submit(index)
+            finally:
+                if owns_executor:
+                    executor.shutdown(wait=not killed, cancel_futures=True)
+                if started_queue is not None:
+                    started_queue.close()
 
-                merged_metrics = dict(base.metrics)
-                merged_metrics.update(cv_metrics)
-                results.append(
-                    ModelResult(
-                        model_name=base.model_name,
-                        parameters=base.parameters,
-                        times=base.times,
-                        predictions=base.predictions,
-                        metrics=merged_metrics,
-                        diagnostics=diagnostics or None,
-                    )
-                )
-            except Exception:
-                # Skip models that cannot be fitted for the given dataset.
-                continue
+        ordered = [finished[index] for index in sorted(finished)]
+        return rank_results(ordered, rank_by=rank_by, validation_enabled=validation.enabled)
 
-        metric = (rank_by or ("cv_rmse" if validation.enabled else "rmse")).lower()
-        reverse = metric in {"r2", "cv_r2"}
+    def _lookup(
+        self,
+        model: ReliabilityModel,
+        dataset: FailureDataset,
+        evaluation_times: np.ndarray | None,
+        validation: WalkForwardConfig,
+    ) -> tuple[str | None, ModelResult | None]:
+        """``(cache key, cached result)``; the key is ``None`` when nothing is cached."""
 
-        def _score(res: ModelResult) -> float:
-            value = res.metrics.get(metric)
-            if value is None:
-                value = res.metrics.get("rmse", float("inf"))
-            return float(value)
+        if self.cache is None and self.memo is None:
+            return None, None
+        key = fit_cache_key(model, dataset, evaluation_times=evaluation_times, validation=validation)
+        if key is None:
+            return None, None
+        cached = None if self.memo is None else self.memo.get(("run", key))
+        if cached is None and self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None and self.memo is not None:
+                self.memo.put(("run", key), cached)
+        if cached is None:
+            return key, None
+        diagnostics = dict(cached.diagnostics or {})
+        diagnostics["fit_cache"] = "hit"
+        return key, replace(cached, diagnostics=diagnostics)
 
-        results.sort(key=_score, reverse=reverse)
-        ranked = [RankedModelResult(rank=i + 1, result=res) for i, res in enumerate(results)]
-        return ranked
+    def _store(self, key: str, result: ModelResult) -> None:
+        if self.memo is not None:
+            self.memo.put(("run", key), result)
+        if self.cache is not None:
+            self.cache.put(key, result)
+
+    def iter_run_many(
+        self,
+        datasets: Mapping[str, FailureDataset] | Iterable[FailureDataset],
+        *,
+        validation: WalkForwardConfig | None = None,
+        rank_by: str | None = None,
+        prediction_interval_alpha: float | None = None,
+        batch_size: int = 256,
+        group_size: int = 32,
+    ) -> Iterator[FleetResult]:
+        """Run every model on many datasets, yielding one :class:`FleetResult` per dataset.
+
+        Datasets are pulled from the iterable ``batch_size`` at a time, so only one
+        batch and its results are held in memory. Within a batch each model
+        becomes tasks of up to ``group_size`` datasets, so models with a
+        vectorized ``fit_many`` (JM, BP) fit a whole group per call. With
+        ``max_workers > 1`` or an ``executor`` the tasks run on a process pool
+        (at most one worker per task of the first batch). Keys are the mapping
+        keys, or positions for plain iterables. Results come back in input order
+        with deterministic per-dataset rankings.
+
+        As in :meth:`run`, the cache and memo are consulted per dataset and model
+        before any work is scheduled, ``model_budget`` bounds each fit (a
+        vectorized group gets the sum of its members' budgets) and ``run_budget``
+        the whole fleet; fits that run out are skipped with reason ``"timeout"``.
+        Budgets are enforced cooperatively; only once the run budget plus
+        ``kill_grace`` has passed is a service-owned pool terminated.
+        """
+
+        validation = validation or WalkForwardConfig(enabled=False)
+        items: Iterable[tuple[str, FailureDataset]] = (
+            ((str(key), dataset) for key, dataset in datasets.items())
+            if isinstance(datasets, Mapping)
+            else ((str(index), dataset) for index, dataset in enumerate(datasets))
+        )
+        run_token = CancelToken.with_budget(self.run_budget)
+        hard_deadline = None if run_token.deadline is None else run_token.deadline + self.kill_grace
+        budget_args = (self.model_budget, run_token.deadline)
+        executor = self.executor
+        owns_executor = False
+        killed = False
+        try:
+            for batch in _chunked(items, batch_size):
+                outputs: dict[tuple[int, int], ModelResult | tuple[str, str]] = {}
+                keys: dict[tuple[int, int], str] = {}
+                tasks: list[tuple[int, list[int]]] = []
+                for model_index, model in enumerate(self._models):
+                    members: list[int] = []
+                    for index, (_, dataset) in enumerate(batch):
+                        if not model.supports(dataset.series_type):
+                            continue
+                        key, cached = self._lookup(model, dataset, None, validation)
+                        if cached is not None:
+                            outputs[(model_index, index)] = cached
+                            continue
+                        if key is not None:
+                            keys[(model_index, index)] = key
+                        members.append(index)
+                    tasks.extend((model_index, group) for group in _chunked(members, group_size))
+                if executor is None and self.max_workers > 1 and len(tasks) > 1:
+                    executor = process_pool(min(self.max_workers, len(tasks)))
+                    owns_executor = True
+
+                pending: list[tuple[int, list[int], Any]] = []
+                for model_index, group in tasks:
+                    model = self._models[model_index]
+                    group_datasets = [batch[index][1] for index in group]
+                    if run_token.cancelled:
+                        output: Any = [("timeout", "")] * len(group)
+                    elif executor is None:
+                        output = _evaluate_group(model, group_datasets, validation, *budget_args)
+                    else:
+                        output = executor.submit(_evaluate_group, model, group_datasets, validation, *budget_args)
+                    pending.append((model_index, group, output))
+                for model_index, group, output in pending:
+                    if isinstance(output, Future):
+                        remaining = None if hard_deadline is None else max(0.0, hard_deadline - time.time())
+                        try:
+                            output = output.result(timeout=remaining)
+                        except FutureTimeoutError:
+                            output.cancel()
+                            output = [("timeout", "")] * len(group)
+                            if owns_executor and not killed:
+                                terminate_pool(executor)
+                                killed = True
+                        except Exception as exc:
+                            reason = "timeout" if killed else "error"
+                            output = [(reason, "" if killed else f"{type(exc).__name__}: {exc}")] * len(group)
+                    for index, item in zip(group, output):
+                        outputs[(model_index, index)] = item
+                        if isinstance(item, ModelResult) and (model_index, index) in keys:
+                            self._store(keys[(model_index, index)], item)
+
+                for index, (key, dataset) in enumerate(batch):
+                    results: list[ModelResult] = []
+                    skipped: list[dict[str, Any]] = []
+                    for model_index, model in enumerate(self._models):
+                        item = outputs.get((model_index, index))
+                        if item is None:
+                            expected = model.required_series_type.value if model.required_series_type else "any"
+                            skipped.append(
+                                {"model": model.name, "reason": "unsupported", "detail": f"expects '{expected}' data"}
+                            )
+                        elif isinstance(item, tuple):
+                            skipped.append({"model": model.name, "reason": item[0], "detail": item[1]})
+                        else:
+                            results.append(_attach_interval(item, dataset, prediction_interval_alpha))
+                    ranked = rank_results(results, rank_by=rank_by, validation_enabled=validation.enabled)
+                    yield FleetResult(key=key, ranked=ranked, skipped=skipped)
+        finally:
+            if owns_executor:
+                executor.shutdown(wait=not killed, cancel_futures=True)
+
+    def run_many(
+        self,
+        datasets: Mapping[str, FailureDataset] | Iterable[FailureDataset],
+        *,
+        sink: ResultSink | str | Path | None = None,
+        validation: WalkForwardConfig | None = None,
+        rank_by: str | None = None,
+        prediction_interval_alpha: float | None = None,
+        batch_size: int = 256,
+        group_size: int = 32,
+        include_predictions: bool = False,
+    ) -> FleetSummary:
+        """Stream a fleet run to ``sink`` and return counts and fits per second.
+
+        ``sink`` is a :class:`~zdp.services.sinks.ResultSink` or a path (``.jsonl``
+        or ``.parquet``, closed when the run ends). Each row is one dataset ×
+        model with its rank (``None`` plus ``error`` for failed fits), metrics and
+        parameters, and optionally the predictions.
+        """
+
+        owns_sink = isinstance(sink, (str, Path))
+        target: ResultSink | None = open_sink(sink) if isinstance(sink, (str, Path)) else sink
+        start = time.perf_counter()
+        count = fits = failed = 0
+        try:
+            for fleet in self.iter_run_many(
+                datasets,
+                validation=validation,
+                rank_by=rank_by,
+                prediction_interval_alpha=prediction_interval_alpha,
+                batch_size=batch_size,
+                group_size=group_size,
+            ):
+                count += 1
+                fits += len(fleet.ranked)
+                errors = [entry for entry in fleet.skipped if entry["reason"] != "unsupported"]
+                failed += len(errors)
+                if target is None:
+                    continue
+                for item in fleet.ranked:
+                    row: dict[str, Any] = {
+                        "dataset": fleet.key,
+                        "model": item.result.model_name,
+                        "rank": item.rank,
+                        "error": None,
+                        "metrics": dict(item.result.metrics),
+                        "parameters": dict(item.result.parameters),
+                    }
+                    if include_predictions:
+                        row["predictions"] = np.asarray(item.result.predictions, dtype=float).tolist()
+                    target.write(row)
+                for entry in errors:
+                    target.write(
+                        {
+                            "dataset": fleet.key,
+                            "model": entry["model"],
+                            "rank": None,
+                            "error": entry["detail"] or entry["reason"],
+                            "metrics": {},
+                            "parameters": {},
+                        }
+                    )
+        finally:
+            if owns_sink and target is not None:
+                target.close()
+        return FleetSummary(datasets=count, fits=fits, failed=failed, seconds=time.perf_counter() - start)
+
+
+def _chunked(items: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    iterator = iter(items)
+    while True:
+        chunk = list(itertools.islice(iterator, max(1, int(size))))
+        if not chunk:
+            return
+        yield chunk
 
 
-__all__ = ["AnalysisService", "RankedModelResult", "WalkForwardConfig"]
+__all__ = [
+    "AnalysisService",
+    "FleetResult",
+    "FleetSummary",
+    "ModelCompletion",
+    "RankedModelResult",
+    "WalkForwardConfig",
+    "rank_results",
+]
@@ -0,0 +1,332 @@
+"""Caches of model fits: content-addressed on disk, and an in-process LRU."""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import asdict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Hashable, Mapping, Sequence
+
+import numpy as np
+
+import zdp
+from zdp.data import FailureDataset
+from zdp.fileio import atomic_write
+from zdp.models import ModelResult, ReliabilityModel
+
+if TYPE_CHECKING:
+    from .validation import WalkForwardConfig
+
+_FORMAT_VERSION = 1
+# Dataset metadata entries that change what models fit (see resolve_likelihood).
+FITTING_METADATA_KEYS = ("exact_failure_times",)
+
+
+def default_cache_dir() -> Path:
+    """``$XDG_CACHE_HOME/zdp``, falling back to ``~/.cache/zdp``."""
+
+    base = os.environ.get("XDG_CACHE_HOME")
+    return (Path(base) if base else Path.home() / ".cache") / "zdp"
+
+
+def dataset_fingerprint(dataset: FailureDataset) -> str:
+    """Hash of the series type, the exact time/value arrays and fitting metadata.
+
+    Only the :data:`FITTING_METADATA_KEYS` entries of ``metadata`` are hashed,
+    so provenance such as the source path does not split cache entries.
+    """
+
+    digest = hashlib.sha256()
+    digest.update(dataset.series_type.value.encode())
+    fitting = {key: dataset.metadata[key] for key in FITTING_METADATA_KEYS if key in dataset.metadata}
+    digest.update(json.dumps(fitting, sort_keys=True, default=repr).encode())
+    for array in (dataset.time_axis, dataset.values):
+        data = np.ascontiguousarray(array, dtype="<f8")
+        digest.update(str(data.size).encode())
+        digest.update(data.tobytes())
+    return digest.hexdigest()
+
+
+def _array_digest(values: np.ndarray | None) -> str | None:
+    if values is None:
+        return None
+    return hashlib.sha256(np.ascontiguousarray(values, dtype="<f8").tobytes()).hexdigest()
+
+
+def _model_identity(model: ReliabilityModel) -> tuple[str, str] | None:
+    fingerprint = model.config_fingerprint()
+    if fingerprint is None:
+        return None
+    model_type = type(model)
+    config = json.dumps(fingerprint, sort_keys=True, default=repr)
+    return f"{model_type.__module__}.{model_type.__qualname__}", config
+
+
+def fit_cache_key(
+    model: ReliabilityModel,
+    dataset: FailureDataset,
+    *,
+    evaluation_times: np.ndarray | None,
+    validation: WalkForwardConfig,
+) -> str | None:
+    """Key for a fit plus its walk-forward validation.
+
+    Covers the package version, the dataset fingerprint, the model class and its
+    :meth:`~zdp.models.ReliabilityModel.config_fingerprint`, the evaluation
+    times and the walk-forward settings that affect results (not ``workers``).
+    ``None`` when the model has no fingerprint and must not be cached.
+    """
+
+    identity = _model_identity(model)
+    if identity is None:
+        return None
+    model_name, config = identity
+    walk_forward = asdict(validation)
+    walk_forward.pop("workers", None)
+    payload = {
+        "format": _FORMAT_VERSION,
+        "version": zdp.__version__,
+        "dataset": dataset_fingerprint(dataset),
+        "model": model_name,
+        "config": config,
+        "evaluation_times": _array_digest(evaluation_times),
+        "walk_forward": walk_forward,
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=repr)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, np.ndarray):
+        return {"__ndarray__": value.tolist(), "dtype": value.dtype.str}
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, Mapping):
+        return {str(key): _encode(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode(item) for item in value]
+    return value
+
+
+def _decode(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "__ndarray__" in value:
+            return np.asarray(value["__ndarray__"], dtype=np.dtype(value["dtype"]))
+        return {key: _decode(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    return value
+
+
+class FitCache:
+    """Directory of ``<key>.npz`` files holding serialized :class:`ModelResult` objects.
+
+    ``times`` and ``predictions`` are stored as raw float arrays; names,
+    parameters, metrics and diagnostics go into one JSON member. Entries are
+    evicted least-recently-used first (by file mtime, refreshed on every hit)
+    once the directory grows past ``max_bytes``. Results whose diagnostics are
+    not JSON-serializable are simply not cached.
+    """
+
+    def __init__(self, directory: str | Path | None = None, *, max_bytes: int = 256 * 1024 * 1024) -> None:
+        self.directory = Path(directory) if directory is not None else default_cache_dir()
+        self.max_bytes = int(max_bytes)
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.npz"
+
+    def get(self, key: str) -> ModelResult | None:
+        path = self._path(key)
+        try:
+            with np.load(path, allow_pickle=False) as payload:
+                meta = json.loads(bytes(payload["meta"]).decode("utf-8"))
+                times = payload["times"]
+                predictions = payload["predictions"]
+            os.utime(path)
+        except (OSError, KeyError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return ModelResult(
+            model_name=meta["model_name"],
+            parameters=_decode(meta["parameters"]),
+            times=times,
+            predictions=predictions,
+            metrics=_decode(meta["metrics"]),
+            diagnostics=_decode(meta["diagnostics"]),
+        )
+
+    def put(self, key: str, result: ModelResult) -> bool:
+        """Store ``result``; returns False if it could not be serialized or written."""
+
+        try:
+            meta = json.dumps(
+                {
+                    "model_name": result.model_name,
+                    "parameters": _encode(result.parameters),
+                    "metrics": _encode(result.metrics),
+                    "diagnostics": _encode(result.diagnostics),
+                },
+                allow_nan=True,
+            ).encode("utf-8")
+        except (TypeError, ValueError):
+            return False
+        buffer = io.BytesIO()
+        np.savez_compressed(
+            buffer,
+            times=np.asarray(result.times, dtype=float),
+            predictions=np.asarray(result.predictions, dtype=float),
+            meta=np.frombuffer(meta, dtype=np.uint8),
+        )
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # Write-then-rename so concurrent readers never see a partial file.
+            atomic_write(self._path(key), lambda handle: handle.write(buffer.getvalue()))
+        except OSError:
+            return False
+        self._evict()
+        return True
+
+    def _evict(self) -> None:
+        entries = []
+        total = 0
+        try:
+            paths = list(self.directory.glob("*.npz"))
+        except OSError:
+            return
+        for path in paths:
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink(missing_ok=True)
+            except OSError:
+                continue
+            total -= size
+
+    def clear(self) -> None:
+        for path in self.directory.glob("*.npz"):
+            path.unlink(missing_ok=True)
+        self.hits = 0
+        self.misses = 0
+
+
+class FitMemo:
+    """In-process LRU of fit results for one session.
+
+    :meth:`fit` memoizes ``model.fit`` on a dataset prefix, keyed by
+    ``(model class and config, dataset fingerprint, prefix length,
+    evaluation_times)``, so walk-forward splits shared between runs are fitted
+    once. :meth:`get`/:meth:`put` hold arbitrary entries under caller-built keys
+    (the service stores whole fit-plus-validation results this way).
+    """
+
+    def __init__(self, max_entries: int = 2048) -> None:
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any | None:
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def fit(
+        self,
+        model: ReliabilityModel,
+        dataset: FailureDataset,
+        stop: int,
+        *,
+        evaluation_times: np.ndarray | None = None,
+        dataset_key: str | None = None,
+    ) -> ModelResult:
+        """``model.fit(dataset.slice(stop), evaluation_times=...)``, memoized.
+
+        Pass ``dataset_key`` (``dataset_fingerprint(dataset)``) when fitting many
+        prefixes of one dataset to hash it only once.
+        """
+
+        subset = dataset if stop >= dataset.size else dataset.slice(stop)
+        identity = _model_identity(model)
+        if identity is None:
+            return model.fit(subset, evaluation_times=evaluation_times)
+        key = (
+            "fit",
+            *identity,
+            dataset_key or dataset_fingerprint(dataset),
+            int(stop),
+            _array_digest(evaluation_times),
+        )
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        result = model.fit(subset, evaluation_times=evaluation_times)
+        self.put(key, result)
+        return result
+
+    def walk_forward_forecasts(
+        self,
+        model: ReliabilityModel,
+        dataset: FailureDataset,
+        train_stops: Sequence[int],
+        horizon: int,
+        *,
+        dataset_key: str | None = None,
+    ) -> tuple[list[np.ndarray | None], list[int | None]] | None:
+        """Memoized cold-start ``model.walk_forward_forecasts`` (``None`` results included)."""
+
+        identity = _model_identity(model)
+        if identity is None:
+            return model.walk_forward_forecasts(dataset, train_stops, horizon, warm_start=False)
+        key = (
+            "walk_forward",
+            *identity,
+            dataset_key or dataset_fingerprint(dataset),
+            tuple(int(stop) for stop in train_stops),
+            int(horizon),
+        )
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+        forecasts = model.walk_forward_forecasts(dataset, train_stops, horizon, warm_start=False)
+        self.put(key, forecasts)
+        return forecasts
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+__all__ = ["FitCache", "FitMemo", "dataset_fingerprint", "default_cache_dir", "fit_cache_key"]
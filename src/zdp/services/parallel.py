@@ -0,0 +1,224 @@
+"""Process-pool helpers shared by the analysis and validation services."""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Any, Hashable, Mapping
+
+import numpy as np
+
+from zdp.data import FailureDataset, FailureSeriesType
+
+_THREAD_ENV_VARS = (
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+)
+
+# Keeps the threadpoolctl limiter alive for the lifetime of a worker process.
+_WORKER_LIMITS: object | None = None
+# Queue given to this worker's pool by the parent (see report_started).
+_STARTED: Any = None
+# True inside workers of pools created by process_pool.
+_IN_WORKER = False
+
+
+def limit_worker_threads(threads: int = 1) -> None:
+    """Cap BLAS/OpenMP/torch threads in the current (worker) process.
+
+    Used as a pool initializer so N workers do not each spawn one BLAS thread per
+    core. Environment variables cover libraries loaded later; threadpoolctl (an
+    sklearn dependency) and torch cover the ones already loaded.
+    """
+
+    global _WORKER_LIMITS
+    threads = max(1, int(threads))
+    for name in _THREAD_ENV_VARS:
+        os.environ[name] = str(threads)
+    try:
+        from threadpoolctl import threadpool_limits
+
+        _WORKER_LIMITS = threadpool_limits(limits=threads)
+    except ImportError:  # pragma: no cover - optional dependency
+        _WORKER_LIMITS = None
+    try:
+        import torch
+
+        torch.set_num_threads(threads)
+    except ImportError:  # pragma: no cover - optional dependency
+        pass
+
+
+def _init_worker(threads: int, started: Any) -> None:
+    global _STARTED, _IN_WORKER
+    _STARTED = started
+    _IN_WORKER = True
+    limit_worker_threads(threads)
+
+
+def in_pool_worker() -> bool:
+    """Whether this process is a :func:`process_pool` worker (which should not nest pools)."""
+
+    return _IN_WORKER
+
+
+def report_started(task: Hashable) -> None:
+    """Put ``(task, time.time())`` on the pool's ``started`` queue, if it has one.
+
+    Called by tasks when a worker picks them up, so the parent can time budgets
+    from the actual start rather than from submission. A no-op elsewhere.
+    """
+
+    if _STARTED is not None:
+        _STARTED.put((task, time.time()))
+
+
+class _WorkerPool(ProcessPoolExecutor):
+    """Process pool that can kill its workers on every supported Python."""
+
+    if not hasattr(ProcessPoolExecutor, "terminate_workers"):  # Python < 3.14
+
+        def terminate_workers(self) -> None:
+            # Backport of 3.14's method; the base class tracks workers in ``_processes``.
+            for process in list((self._processes or {}).values()):
+                process.terminate()
+
+
+def process_pool(
+    max_workers: int, *, threads_per_worker: int = 1, started: Any = None
+) -> ProcessPoolExecutor:
+    """Create a spawn-based process pool whose workers run with capped thread counts.
+
+    ``spawn`` is used instead of ``fork`` because forking a process that already
+    initialised torch/OpenMP thread pools can deadlock. ``started`` is a queue
+    from :func:`spawn_queue` that receives :func:`report_started` messages. The
+    pool supports :func:`terminate_pool`.
+    """
+
+    return _WorkerPool(
+        max_workers=max(1, int(max_workers)),
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(threads_per_worker, started),
+    )
+
+
+def spawn_queue() -> Any:
+    """A queue that can be handed to :func:`process_pool` workers."""
+
+    return multiprocessing.get_context("spawn").Queue()
+
+
+def terminate_pool(executor: ProcessPoolExecutor) -> None:
+    """Kill a :func:`process_pool` pool's workers, abandoning whatever they are running."""
+
+    executor.terminate_workers()  # type: ignore[attr-defined]
+
+
+@dataclass(frozen=True)
+class SharedDatasetSpec:
+    """Picklable handle to a dataset whose arrays live in a shared-memory block."""
+
+    name: str
+    size: int
+    series_type: FailureSeriesType
+    metadata: Mapping[str, Any]
+
+
+class SharedDataset:
+    """Copy a dataset's time axis and values into one shared-memory block.
+
+    Workers rebuild a ``FailureDataset`` over views of the block with
+    :func:`attach_dataset`, so the arrays are copied once instead of being
+    pickled into every task. Use as a context manager; the block is unlinked on exit.
+    """
+
+    def __init__(self, dataset: FailureDataset) -> None:
+        size = dataset.size
+        self._shm = shared_memory.SharedMemory(create=True, size=2 * size * 8)
+        block = np.ndarray((2, size), dtype=float, buffer=self._shm.buf)
+        block[0] = dataset.time_axis
+        block[1] = dataset.values
+        del block
+        self.spec = SharedDatasetSpec(
+            name=self._shm.name,
+            size=size,
+            series_type=dataset.series_type,
+            metadata=dict(dataset.metadata),
+        )
+
+    def close(self) -> None:
+        self._shm.close()
+        self._shm.unlink()
+
+    def __enter__(self) -> "SharedDataset":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+# Worker-side cache so each task for the same block reuses one attachment.
+_ATTACHED: dict[str, tuple[shared_memory.SharedMemory, FailureDataset]] = {}
+_MAX_ATTACHED = 4
+
+
+def _open_untracked(name: str) -> shared_memory.SharedMemory:
+    # Only the creating process may unlink the block; before 3.13 attaching also
+    # registers it with the resource tracker, which would unlink it early.
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    shm = shared_memory.SharedMemory(name=name)
+    if os.name == "posix":
+        from multiprocessing import resource_tracker
+
+        # POSIX blocks are registered under their "/"-prefixed system name.
+        resource_tracker.unregister(f"/{shm.name}", "shared_memory")
+    return shm
+
+
+def attach_dataset(spec: SharedDatasetSpec) -> FailureDataset:
+    """Return a read-only dataset viewing the shared block described by ``spec``."""
+
+    cached = _ATTACHED.get(spec.name)
+    if cached is not None:
+        return cached[1]
+    shm = _open_untracked(spec.name)
+    block = np.ndarray((2, spec.size), dtype=float, buffer=shm.buf)
+    block.setflags(write=False)
+    dataset = FailureDataset(
+        time_axis=block[0],
+        values=block[1],
+        series_type=spec.series_type,
+        metadata=spec.metadata,
+    )
+    while len(_ATTACHED) >= _MAX_ATTACHED:
+        old_shm, _ = _ATTACHED.pop(next(iter(_ATTACHED)))
+        try:
+            old_shm.close()
+        except BufferError:
+            # A view is still referenced somewhere; the mapping goes with the worker.
+            pass
+    _ATTACHED[spec.name] = (shm, dataset)
+    return dataset
+
+
+__all__ = [
+    "SharedDataset",
+    "SharedDatasetSpec",
+    "attach_dataset",
+    "in_pool_worker",
+    "limit_worker_threads",
+    "process_pool",
+    "report_started",
+    "spawn_queue",
+    "terminate_pool",
+]
@@ -0,0 +1,179 @@
+"""Streaming result sinks for fleet runs (one row per dataset × model)."""
+
+from __future__ import annotations
+
+import json
+import math
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Mapping, Protocol, TextIO
+
+
+class ResultSink(Protocol):
+    """Anything that accepts flat result rows and can be closed."""
+
+    def write(self, row: Mapping[str, Any]) -> None: ...
+
+    def close(self) -> None: ...
+
+
+def _json_safe(value: Any) -> Any:
+    # JSON has no NaN/inf; write them as null like pandas' to_json does.
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    if isinstance(value, Mapping):
+        return {str(key): _json_safe(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_safe(item) for item in value]
+    if hasattr(value, "item") and not isinstance(value, (str, bytes)):
+        try:
+            return _json_safe(value.item())
+        except (TypeError, ValueError):
+            return str(value)
+    return value
+
+
+class JsonlSink:
+    """Append one JSON object per line; rows are flushed as they arrive."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._handle: TextIO = self.path.open("w", encoding="utf-8")
+
+    def write(self, row: Mapping[str, Any]) -> None:
+        self._handle.write(json.dumps(_json_safe(row), ensure_ascii=False) + "\n")
+        self._handle.flush()
+
+    def close(self) -> None:
+        self._handle.close()
+
+    def __enter__(self) -> "JsonlSink":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+class ParquetSink:
+    """Buffer rows and write them as Parquet row groups of ``row_group_size`` rows.
+
+    Nested ``metrics``/``parameters`` mappings are flattened into
+    ``metric_<name>``/``param_<name>`` columns. ``dataset``, ``model``, ``rank``
+    and ``error`` have fixed types; other columns are float64, widened to
+    string when any row holds a non-numeric value. Row groups are staged in
+    part files beside ``path`` and combined on :meth:`close` under the union
+    schema, so columns first seen in a later group are kept (earlier rows read
+    as null). Requires the optional ``pyarrow`` package.
+    """
+
+    _FIXED_TYPES = {"dataset": "string", "model": "string", "rank": "int64", "error": "string"}
+
+    def __init__(self, path: str | Path, *, row_group_size: int = 4096) -> None:
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError as exc:  # pragma: no cover - optional dependency
+            raise RuntimeError("Parquet output requires the 'pyarrow' package") from exc
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.row_group_size = max(1, int(row_group_size))
+        self._rows: list[dict[str, Any]] = []
+        self._parts: list[Path] = []
+        self._types: dict[str, str] = {}
+        self._staging: Path | None = None
+
+    @staticmethod
+    def _flatten(row: Mapping[str, Any]) -> dict[str, Any]:
+        flat: dict[str, Any] = {}
+        for key, value in row.items():
+            if key in ("metrics", "parameters") and isinstance(value, Mapping):
+                prefix = "metric_" if key == "metrics" else "param_"
+                for name, item in value.items():
+                    flat[prefix + str(name)] = item if isinstance(item, (int, float)) else str(item)
+            elif isinstance(value, (Mapping, list, tuple)):
+                flat[key] = json.dumps(_json_safe(value), ensure_ascii=False)
+            else:
+                flat[key] = value
+        return flat
+
+    def write(self, row: Mapping[str, Any]) -> None:
+        self._rows.append(self._flatten(row))
+        if len(self._rows) >= self.row_group_size:
+            self._flush()
+
+    def _column_type(self, name: str, values: list[Any]) -> str:
+        fixed = self._FIXED_TYPES.get(name)
+        if fixed is not None:
+            return fixed
+        if self._types.get(name) == "string":
+            return "string"
+        numeric = all(value is None or isinstance(value, (int, float)) for value in values)
+        return "float64" if numeric else "string"
+
+    def _flush(self) -> None:
+        if not self._rows:
+            return
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        names = list(dict.fromkeys([*self._FIXED_TYPES, *(key for row in self._rows for key in row)]))
+        columns: dict[str, Any] = {}
+        for name in names:
+            values = [row.get(name) for row in self._rows]
+            kind = self._column_type(name, values)
+            self._types[name] = kind
+            if kind == "string":
+                values = [None if value is None else str(value) for value in values]
+            elif kind == "float64":
+                values = [None if value is None else float(value) for value in values]
+            columns[name] = pa.array(values, type=pa.type_for_alias(kind))
+        if self._staging is None:
+            self._staging = Path(tempfile.mkdtemp(prefix=f".{self.path.name}.", dir=self.path.parent))
+        part = self._staging / f"{len(self._parts):06d}.parquet"
+        pq.write_table(pa.table(columns), part)
+        self._parts.append(part)
+        self._rows = []
+
+    def close(self) -> None:
+        try:
+            self._flush()
+            if not self._parts:
+                return
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            schema = pa.schema([(name, pa.type_for_alias(kind)) for name, kind in self._types.items()])
+            with pq.ParquetWriter(self.path, schema) as writer:
+                for part in self._parts:
+                    table = pq.read_table(part)
+                    arrays = [
+                        table[field.name].cast(field.type)
+                        if field.name in table.column_names
+                        else pa.nulls(table.num_rows, field.type)
+                        for field in schema
+                    ]
+                    writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+        finally:
+            if self._staging is not None:
+                shutil.rmtree(self._staging, ignore_errors=True)
+                self._staging = None
+            self._parts = []
+
+    def __enter__(self) -> "ParquetSink":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def open_sink(path: str | Path) -> JsonlSink | ParquetSink:
+    """Pick a sink from the file suffix (``.parquet``/``.pq`` or JSON lines)."""
+
+    suffix = Path(path).suffix.lower()
+    if suffix in (".parquet", ".pq"):
+        return ParquetSink(path)
+    return JsonlSink(path)
+
+
+__all__ = ["JsonlSink", "ParquetSink", "ResultSink", "open_sink"]
@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+from concurrent.futures import Executor
 from dataclasses import dataclass
 from typing import Any, Mapping
 
 import numpy as np
 
 from zdp.data import FailureDataset, FailureSeriesType
-from zdp.models import ReliabilityModel
+from zdp.models import FitCancelled, ModelResult, ReliabilityModel
+
+from .cache import FitMemo, dataset_fingerprint
+from .parallel import SharedDataset, SharedDatasetSpec, attach_dataset, in_pool_worker, process_pool
 
 
 @dataclass(frozen=True)
@@ -18,6 +22,10 @@ class WalkForwardConfig:
     enabled: bool = True
     min_train_size: int | None = None
     horizon: int = 1
+    warm_start: bool = False
+    # >1 fits splits on a process pool. Ignored with warm_start, which chains splits,
+    # and inside pool workers (e.g. the service's model pool), which already use the cores.
+    workers: int = 1
 
 
 def _actual_series(dataset: FailureDataset) -> np.ndarray:
@@ -26,10 +34,113 @@ def _actual_series(dataset: FailureDataset) -> np.ndarray:
     return dataset.failure_intervals()
 
 
+def _fit_iterations(result: ModelResult) -> int | None:
+    """Extract the solver iteration/evaluation count a model reported, if any."""
+
+    diagnostics = result.diagnostics or {}
+    for key in ("optimizer", "solver"):
+        entry = diagnostics.get(key)
+        if isinstance(entry, Mapping):
+            for count_key in ("iterations", "nfev"):
+                if count_key in entry:
+                    return int(entry[count_key])
+    return None
+
+
+def _fit_split(
+    model: ReliabilityModel,
+    dataset: FailureDataset,
+    train_stop: int,
+    horizon: int,
+    warm_state: Mapping[str, Any] | None,
+    memo: FitMemo | None = None,
+    dataset_key: str | None = None,
+) -> tuple[np.ndarray | None, int | None, Mapping[str, Any] | None]:
+    """Fit a fresh clone on ``dataset[:train_stop]`` and forecast the next ``horizon`` points.
+
+    With ``memo`` the fit is looked up by prefix length first (callers pass no
+    memo for warm-started splits, whose result depends on the previous split).
+
+    Returns:
+        (forecast or None if the split is unusable, solver iterations, warm-start state)
+    """
+
+    eval_stop = train_stop + horizon
+    split_model = model.clone()
+    split_model.cancel_token = model.cancel_token
+    if warm_state is not None:
+        split_model.warm_start(warm_state)
+    try:
+        if memo is not None:
+            res = memo.fit(
+                split_model,
+                dataset,
+                train_stop,
+                evaluation_times=dataset.time_axis[:eval_stop],
+                dataset_key=dataset_key,
+            )
+        else:
+            res = split_model.fit(dataset.slice(train_stop), evaluation_times=dataset.time_axis[:eval_stop])
+    except FitCancelled:
+        raise
+    except Exception:
+        return None, None, None
+    iterations = _fit_iterations(res)
+    state = split_model.warm_start_state()
+    preds = np.asarray(res.predictions, dtype=float)
+    if preds.size < eval_stop:
+        return None, iterations, state
+    return preds[train_stop:eval_stop], iterations, state
+
+
+def _fit_shared_split(
+    model: ReliabilityModel,
+    spec: SharedDatasetSpec,
+    train_stop: int,
+    horizon: int,
+) -> tuple[np.ndarray | None, int | None]:
+    forecast, iterations, _ = _fit_split(model, attach_dataset(spec), train_stop, horizon, None)
+    return forecast, iterations
+
+
+def _parallel_splits(
+    model: ReliabilityModel,
+    dataset: FailureDataset,
+    train_stops: list[int],
+    horizon: int,
+    executor: Executor | None,
+    workers: int,
+) -> tuple[list[np.ndarray | None], list[int | None]]:
+    """Fit independent splits concurrently; results come back in ``train_stops`` order."""
+
+    owns_executor = executor is None
+    pool = executor or process_pool(min(workers, len(train_stops)))
+    try:
+        with SharedDataset(dataset) as shared:
+            chunksize = max(1, len(train_stops) // (4 * max(1, workers)))
+            outputs = list(
+                pool.map(
+                    _fit_shared_split,
+                    [model] * len(train_stops),
+                    [shared.spec] * len(train_stops),
+                    train_stops,
+                    [horizon] * len(train_stops),
+                    chunksize=chunksize,
+                )
+            )
+    finally:
+        if owns_executor:
+            pool.shutdown(wait=True)
+    return [item[0] for item in outputs], [item[1] for item in outputs]
+
+
 def walk_forward_validate(
     model: ReliabilityModel,
     dataset: FailureDataset,
     config: WalkForwardConfig,
+    *,
+    executor: Executor | None = None,
+    memo: FitMemo | None = None,
 ) -> tuple[Mapping[str, float], Mapping[str, Any]]:
     """Run walk-forward validation.
 
@@ -40,6 +151,14 @@ def walk_forward_validate(
         - Uses an expanding training window.
         - Computes metrics on the concatenated validation targets/predictions.
         - If the model cannot produce required-length predictions for a split, that split is skipped.
+        - With ``config.warm_start`` each split is seeded from the previous split's
+          ``warm_start_state()``; per-split solver iteration counts are reported either way.
+        - Without warm starts, ``executor`` or ``config.workers > 1`` fits splits in
+          parallel against a shared-memory copy of the dataset (``workers`` is
+          treated as 1 inside a pool worker, so pools never nest). Forecasts are
+          concatenated in split order, so ``cv_*`` metrics match the sequential path.
+        - ``memo`` reuses per-split fits from earlier calls in the same process
+          (sequential, non-warm-started splits and model fast paths).
     """
 
     if not config.enabled:
@@ -59,37 +178,64 @@ def walk_forward_validate(
     min_train = int(config.min_train_size or default_min)
     min_train = max(2, min(min_train, n_total - horizon))
 
+    train_stops = list(range(min_train, n_total - horizon + 1))
+    dataset_key = dataset_fingerprint(dataset) if memo is not None else None
+    memo = None if config.warm_start else memo
+    # Models may produce all splits at once (GM prefix sums, batched BP training).
+    if memo is not None:
+        fast = memo.walk_forward_forecasts(model, dataset, train_stops, horizon, dataset_key=dataset_key)
+    else:
+        fast = model.walk_forward_forecasts(
+            dataset, train_stops, horizon, warm_start=bool(config.warm_start)
+        )
+    workers = 1 if in_pool_worker() else int(config.workers)
+    parallel = not config.warm_start and (executor is not None or workers > 1)
+    if fast is not None:
+        forecasts, split_iterations = fast
+    elif parallel and len(train_stops) > 1:
+        forecasts, split_iterations = _parallel_splits(
+            model, dataset, train_stops, horizon, executor, workers
+        )
+    else:
+        forecasts: list[np.ndarray | None] = []
+        split_iterations: list[int | None] = []
+        warm_state: Mapping[str, Any] | None = None
+        for train_stop in train_stops:
+            forecast, iterations, state = _fit_split(
+                model,
+                dataset,
+                train_stop,
+                horizon,
+                warm_state if config.warm_start else None,
+                memo=memo,
+                dataset_key=dataset_key,
+            )
+            forecasts.append(forecast)
+            split_iterations.append(iterations)
+            if config.warm_start:
+                warm_state = state or warm_state
+
     y_true_parts: list[np.ndarray] = []
     y_pred_parts: list[np.ndarray] = []
-    attempted = 0
+    attempted = len(train_stops)
     used = 0
-
-    for train_stop in range(min_train, n_total - horizon + 1):
-        attempted += 1
-        train_dataset = dataset.slice(train_stop)
-        eval_stop = train_stop + horizon
-        eval_times = dataset.time_axis[:eval_stop]
-
-        try:
-            res = model.clone().fit(train_dataset, evaluation_times=eval_times)
-        except Exception:
+    for train_stop, y_pred in zip(train_stops, forecasts):
+        if y_pred is None:
             continue
-
-        preds = np.asarray(res.predictions, dtype=float)
-        if preds.size < eval_stop:
-            continue
-
-        y_true = actual[train_stop:eval_stop]
-        y_pred = preds[train_stop:eval_stop]
+        y_true = actual[train_stop : train_stop + horizon]
         if y_true.shape != y_pred.shape:
             continue
-
         y_true_parts.append(y_true)
         y_pred_parts.append(y_pred)
         used += 1
 
     if used == 0:
-        return {}, {"cv_attempted": attempted, "cv_used": 0}
+        return {}, {
+            "cv_attempted": attempted,
+            "cv_used": 0,
+            "cv_warm_start": bool(config.warm_start),
+            "cv_split_iterations": split_iterations,
+        }
 
     y_true_all = np.concatenate(y_true_parts)
     y_pred_all = np.concatenate(y_pred_parts)
@@ -102,7 +248,11 @@ def walk_forward_validate(
         "cv_min_train": min_train,
         "cv_horizon": horizon,
         "cv_points": int(y_true_all.size),
+        "cv_warm_start": bool(config.warm_start),
+        "cv_split_iterations": split_iterations,
     }
+    if fast is not None:
+        diagnostics["cv_fast_path"] = model.walk_forward_fast_path or type(model).__name__
     return prefixed, diagnostics
 
 
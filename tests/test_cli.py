@@ -1,6 +1,7 @@
 import io
 import numpy as np
 import pandas as pd
+import pytest
 
 from zdp.cli import run_cli
 
@@ -52,3 +53,55 @@ def test_cli_returns_error_when_no_models_match(tmp_path) -> None:
     assert code == 3
     assert "No compatible models" in stderr.getvalue()
     assert stdout.getvalue() == ""
+
+
+def test_cli_sheet_is_excel_only_and_prefers_sheet_names_over_indices(tmp_path) -> None:
+    frame = pd.DataFrame({"time": np.arange(1, 6), "failures": [1, 3, 6, 10, 15]})
+    csv_path = tmp_path / "go.csv"
+    frame.to_csv(csv_path, index=False)
+
+    stderr = io.StringIO()
+    code = run_cli([str(csv_path), "--sheet", "data"], stdout=io.StringIO(), stderr=stderr)
+
+    assert code == 2
+    assert "--sheet only applies to Excel input" in stderr.getvalue()
+
+    pytest.importorskip("openpyxl")
+    xlsx_path = tmp_path / "go.xlsx"
+    with pd.ExcelWriter(xlsx_path) as writer:
+        pd.DataFrame({"remarks": ["notes"]}).to_excel(writer, sheet_name="notes", index=False)
+        frame.to_excel(writer, sheet_name="2024", index=False)
+
+    for sheet in ("2024", "1"):
+        stderr = io.StringIO()
+        code = run_cli(
+            [str(xlsx_path), "--sheet", sheet, "--model", "go"], stdout=io.StringIO(), stderr=stderr
+        )
+        assert code == 0, stderr.getvalue()
+
+
+def test_cli_exact_times_reach_the_exact_nhpp_likelihood(tmp_path) -> None:
+    from zdp.data import load_failure_data
+    from zdp.models import GoelOkumotoModel
+
+    times = np.array([3.0, 7.0, 12.0, 20.0, 26.0, 35.0, 47.0, 61.0, 80.0, 104.0])
+    path = tmp_path / "failures.csv"
+    pd.DataFrame({"time": times, "failures": np.arange(1, times.size + 1)}).to_csv(path, index=False)
+    dataset = load_failure_data(path)
+
+    def printed_parameters(*extra: str) -> str:
+        stdout = io.StringIO()
+        code = run_cli(
+            [str(path), "--model", "go", "--nhpp-fit", "mle", *extra], stdout=stdout, stderr=io.StringIO()
+        )
+        assert code == 0
+        return next(line for line in stdout.getvalue().splitlines() if "parameters:" in line)
+
+    def expected(likelihood: str) -> str:
+        fitted = GoelOkumotoModel(fit_method="mle", likelihood=likelihood).fit(dataset).parameters
+        return f"parameters: a={fitted['a']:.4f}, b={fitted['b']:.4f}"
+
+    assert expected("exact") != expected("grouped")
+    assert printed_parameters().endswith(expected("grouped"))
+    assert printed_parameters("--exact-times").endswith(expected("exact"))
+    assert printed_parameters("--nhpp-likelihood", "exact").endswith(expected("exact"))
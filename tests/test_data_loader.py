@@ -1,5 +1,6 @@
 import numpy as np
 import pandas as pd
+import pytest
 
 from zdp.data import FailureSeriesType, load_failure_data
 
@@ -34,3 +35,240 @@ def test_load_cumulative_csv_with_explicit_columns(tmp_path) -> None:
     assert np.allclose(dataset.time_axis, time)
     assert np.allclose(dataset.values, counts)
     assert np.allclose(dataset.failure_intervals(), np.diff(np.insert(counts, 0, 0)))
+
+
+def test_load_parquet_and_feather_project_resolved_columns(tmp_path) -> None:
+    pytest.importorskip("pyarrow")
+    time = np.arange(1, 6, dtype=float) * 10
+    counts = np.array([2.0, 5.0, 9.0, 14.0, 20.0])
+    raw = pd.DataFrame(
+        {"component": list("abcde"), "time": time, "noise": np.ones(5), "failures": counts}
+    )
+    for suffix in (".parquet", ".feather"):
+        path = tmp_path / f"wide{suffix}"
+        if suffix == ".parquet":
+            raw.to_parquet(path, index=False)
+        else:
+            raw.to_feather(path)
+
+        dataset = load_failure_data(path)
+
+        assert dataset.series_type == FailureSeriesType.CUMULATIVE_FAILURES
+        assert np.allclose(dataset.time_axis, time)
+        assert np.allclose(dataset.values, counts)
+        assert dataset.metadata["columns"] == ["component", "time", "noise", "failures"]
+
+
+def test_csv_is_streamed_in_chunks_into_the_resolved_columns(tmp_path, monkeypatch) -> None:
+    from zdp.data import loader
+
+    monkeypatch.setattr(loader, "CSV_CHUNK_ROWS", 3)
+    time = np.arange(1, 11, dtype=float)
+    intervals = np.array([5, 4, 3, 2, 6, 1, 7, 2, 3, 4], dtype=float)
+    raw = pd.DataFrame({"note": [f"row {i}" for i in range(10)], "time": time, "tbf": intervals})
+    path = tmp_path / "log.tsv"
+    raw.to_csv(path, index=False, sep="\t")
+
+    dataset = load_failure_data(path)
+
+    assert dataset.series_type == FailureSeriesType.TIME_BETWEEN_FAILURES
+    assert dataset.metadata["columns"] == ["note", "time", "tbf"]
+    assert np.array_equal(dataset.time_axis, time)
+    assert np.array_equal(dataset.values, intervals)
+
+
+def test_event_log_is_binned_per_component_and_records_the_spec(tmp_path) -> None:
+    from zdp.data import aggregate_failure_events, load_failure_events
+
+    raw = pd.DataFrame(
+        {
+            "reported": [
+                "2024-03-04 09:00", "2024-03-04 17:30", "2024-03-06 08:00",
+                "2024-03-05 10:00", "2024-03-11 12:00", None,
+            ],
+            "component": ["ui", "ui", "ui", "db", "db", "db"],
+        }
+    )
+    path = tmp_path / "events.csv"
+    raw.to_csv(path, index=False)
+
+    daily = load_failure_events(path, group_by="component")
+
+    assert sorted(daily) == ["db", "ui"]
+    assert np.array_equal(daily["ui"].time_axis, np.arange(1, 9))
+    assert np.array_equal(daily["ui"].values, [2, 2, 3, 3, 3, 3, 3, 3])
+    assert np.array_equal(daily["db"].values, [0, 1, 1, 1, 1, 1, 1, 2])
+    spec = daily["db"].metadata["binning"]
+    assert spec["mode"] == "daily" and spec["origin"] == "2024-03-04T00:00:00"
+    assert spec["events"] == 2 and spec["bins"] == 8 and spec["dropped"] == 1
+    assert daily["db"].metadata["group_by"] == "component"
+
+    weekly = load_failure_events(path, bins="weekly")
+    assert np.array_equal(weekly.values, [4, 5])
+    assert weekly.metadata["binning"]["dropped"] == 1
+
+    exact = aggregate_failure_events(raw["reported"][:3], bins="exact")
+    assert exact.series_type == FailureSeriesType.TIME_BETWEEN_FAILURES
+    assert np.allclose(exact.values * 24, [8.5, 38.5])
+    assert exact.metadata["exact_failure_times"] is True
+    exact_groups = load_failure_events(path, group_by="component", bins="exact")
+    assert exact_groups["db"].metadata["binning"]["origin"] == "2024-03-05T10:00:00"
+    assert exact_groups["ui"].metadata["binning"]["origin"] == "2024-03-04T09:00:00"
+
+    custom = aggregate_failure_events(np.array([0.5, 1.5, 2.5, 9.0]), bins=[0, 2, 4])
+    assert np.array_equal(custom.values, [2, 3])
+    assert custom.metadata["binning"]["dropped"] == 1
+
+
+def test_load_failure_datasets_splits_one_table_into_sorted_views(tmp_path) -> None:
+    from zdp.data import load_failure_datasets
+
+    raw = pd.DataFrame(
+        {
+            "component": ["db", "ui", "db", "ui", "db", None],
+            "note": list("abcdef"),
+            "time": [3.0, 1.0, 1.0, 2.0, 2.0, 9.0],
+            "failures": [6.0, 1.0, 2.0, 4.0, 3.0, 99.0],
+            "tbf": [1.5, 2.0, 0.5, 1.0, 1.0, 99.0],
+        }
+    )
+    path = tmp_path / "fleet.csv"
+    raw.to_csv(path, index=False)
+
+    single = load_failure_datasets(path, group_by="component", value_columns=["failures"])
+    assert list(single) == ["db", "ui"]
+    db = single["db"]
+    assert np.array_equal(db.time_axis, [1.0, 2.0, 3.0])
+    assert np.array_equal(db.values, [2.0, 3.0, 6.0])
+    assert db.series_type == FailureSeriesType.CUMULATIVE_FAILURES
+    assert db.metadata["group"] == "db" and not db.values.flags.writeable
+    assert not np.shares_memory(db.values, single["ui"].values)
+    assert np.shares_memory(db.values, single.block)
+
+    both = load_failure_datasets(path, group_by="component")
+    assert sorted(both) == [("db", "failures"), ("db", "tbf"), ("ui", "failures"), ("ui", "tbf")]
+    assert both[("ui", "tbf")].series_type == FailureSeriesType.TIME_BETWEEN_FAILURES
+    assert np.array_equal(both[("ui", "tbf")].values, [2.0, 1.0])
+
+
+def test_sidecar_is_memory_mapped_until_the_source_changes(tmp_path, monkeypatch) -> None:
+    from zdp.data import loader
+
+    path = tmp_path / "cum.csv"
+    pd.DataFrame({"time": [1, 2, 3], "failures": [2, 5, 9]}).to_csv(path, index=False)
+    cache_dir = tmp_path / "sidecars"
+
+    first = load_failure_data(path, sidecar=cache_dir)
+    assert len(list(cache_dir.iterdir())) == 2
+
+    def no_parse(*args, **kwargs):
+        raise AssertionError("sidecar should have been used")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(loader, "_read_csv_columns", no_parse)
+        again = load_failure_data(path, sidecar=cache_dir)
+    assert not again.values.flags.writeable
+    assert np.array_equal(again.values, first.values)
+    assert again.series_type == first.series_type
+    assert again.metadata == first.metadata
+
+    pd.DataFrame({"time": [1, 2, 3, 4], "failures": [2, 5, 9, 14]}).to_csv(path, index=False)
+    assert np.array_equal(load_failure_data(path, sidecar=cache_dir).values, [2, 5, 9, 14])
+
+    beside = load_failure_data(path, sidecar=True, value_column="failures")
+    assert beside.size == 4
+    assert len(list(tmp_path.glob(".cum.csv.*"))) == 2
+
+    from zdp.data import sidecar
+
+    entry_bytes = sum(item.stat().st_size for item in cache_dir.iterdir())
+    monkeypatch.setattr(sidecar, "SIDECAR_DIR_MAX_BYTES", entry_bytes * 2)
+    other = tmp_path / "other.csv"
+    pd.DataFrame({"time": [1, 2, 3, 4], "failures": [1, 2, 3, 4]}).to_csv(other, index=False)
+    load_failure_data(other, sidecar=cache_dir)
+    load_failure_data(path, sidecar=cache_dir)  # a hit makes cum.csv the most recent
+    load_failure_data(path, sidecar=cache_dir, value_column="time")
+    assert len(list(cache_dir.iterdir())) == 4
+    with monkeypatch.context() as patch:
+        patch.setattr(loader, "_read_csv_columns", no_parse)
+        assert load_failure_data(path, sidecar=cache_dir).size == 4
+
+
+def test_excel_picks_the_data_sheet_and_reads_only_resolved_columns(tmp_path, monkeypatch) -> None:
+    pytest.importorskip("openpyxl")
+    path = tmp_path / "qa.xlsx"
+    data = pd.DataFrame(
+        {"build": ["b1", "b2", "b3", "b4"], "time": [1.0, 2.0, 3.0, 4.0], "extra": [0, 0, 0, 0],
+         "failures": [1.0, 3.0, 4.0, 8.0]}
+    )
+    with pd.ExcelWriter(path) as writer:
+        pd.DataFrame({"remarks": ["see data sheet"]}).to_excel(writer, sheet_name="notes", index=False)
+        data.to_excel(writer, sheet_name="data", index=False)
+
+    from zdp.data import loader
+
+    streamed: list[list[str]] = []
+    full_reads: list[object] = []
+    stream = loader._stream_openpyxl_columns
+    parse = pd.ExcelFile.parse
+
+    def recording_stream(workbook, sheet, wanted):
+        streamed.append(list(wanted))
+        return stream(workbook, sheet, wanted)
+
+    def recording_parse(self, sheet_name=0, **kwargs):
+        if kwargs.get("nrows") is None:
+            full_reads.append(kwargs.get("usecols"))
+        return parse(self, sheet_name, **kwargs)
+
+    monkeypatch.setattr(loader, "_fast_excel_engine", lambda: None)
+    monkeypatch.setattr(loader, "_stream_openpyxl_columns", recording_stream)
+    monkeypatch.setattr(pd.ExcelFile, "parse", recording_parse)
+
+    dataset = load_failure_data(path)
+
+    assert streamed == [["failures", "time"]]
+    assert full_reads == []
+    assert dataset.metadata["sheet"] == "data"
+    assert dataset.metadata["columns"] == ["build", "time", "extra", "failures"]
+    assert np.array_equal(dataset.time_axis, data["time"])
+    assert np.array_equal(dataset.values, data["failures"])
+    assert dataset.series_type == FailureSeriesType.CUMULATIVE_FAILURES
+
+    with pytest.raises(ValueError):
+        load_failure_data(path, read_kwargs={"sheet_name": "notes"})
+
+
+def test_prefix_slices_are_read_only_views_sharing_derived_caches() -> None:
+    import pickle
+
+    from zdp.data import FailureDataset
+
+    intervals = np.array([5.0, 4.0, 3.0, 2.0, 6.0])
+    dataset = FailureDataset(
+        time_axis=np.arange(1, 6, dtype=float),
+        values=intervals,
+        series_type=FailureSeriesType.TIME_BETWEEN_FAILURES,
+    )
+    prefix = dataset.slice(3)
+
+    assert np.shares_memory(prefix.values, dataset.values)
+    assert not prefix.values.flags.writeable and intervals.flags.writeable
+    assert np.shares_memory(prefix.cumulative_failures(), dataset.cumulative_failures())
+    assert np.array_equal(prefix.cumulative_failures(), [5, 9, 12])
+    totals, weighted = prefix.interval_prefix_sums()
+    assert np.array_equal(totals, [5, 9, 12])
+    assert np.array_equal(weighted, [0, 4, 10])
+    assert prefix.with_metadata(split=3).metadata == {"split": 3}
+
+    restored = pickle.loads(pickle.dumps(prefix))
+    assert np.array_equal(restored.values, [5, 4, 3]) and restored.size == 3
+
+    intervals[0] = 100.0  # the caller's array is copied, so the dataset cannot drift
+    assert dataset.values[0] == 5.0
+    assert np.array_equal(dataset.cumulative_failures(), np.cumsum(dataset.values))
+    assert np.array_equal(dataset.interval_prefix_sums()[0], np.cumsum(dataset.values))
+    frozen = np.array([1.0, 2.0, 3.0])
+    frozen.setflags(write=False)
+    shared = FailureDataset(time_axis=frozen, values=frozen, series_type=FailureSeriesType.CUMULATIVE_FAILURES)
+    assert np.shares_memory(shared.values, frozen)
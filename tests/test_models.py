@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 import torch
 
 from zdp.data import FailureDataset, FailureSeriesType
@@ -99,3 +100,234 @@ def test_emd_hybrid_model_outputs_prediction() -> None:
 
     assert result.predictions.shape == counts.shape
     assert result.metrics["rmse"] < 2.0
+
+
+def test_jelinski_moranda_brent_solver_matches_bisection() -> None:
+    intervals = np.array([2.0, 3.0, 4.0, 5.0, 6.0, 8.0, 9.0, 12.0])
+    dataset = FailureDataset(
+        time_axis=np.arange(1, intervals.size + 1),
+        values=intervals,
+        series_type=FailureSeriesType.TIME_BETWEEN_FAILURES,
+    )
+
+    fast = JelinskiMorandaModel(solver="brent").fit(dataset)
+    legacy = JelinskiMorandaModel(solver="bisection").fit(dataset)
+
+    assert abs(fast.parameters["N0"] - legacy.parameters["N0"]) < 1e-3
+    assert abs(fast.parameters["phi"] - legacy.parameters["phi"]) < 1e-4
+    solver = fast.diagnostics["solver"]
+    assert solver["method"] == "brent"
+    assert 0 < solver["iterations"] < 100
+
+    boundary = FailureDataset(
+        time_axis=np.arange(1, 6),
+        values=np.array([0.0, 0.0, 0.0, 0.0, 5.0]),  # p == n - 1: no interior root
+        series_type=FailureSeriesType.TIME_BETWEEN_FAILURES,
+    )
+    fast = JelinskiMorandaModel(solver="brent").fit(boundary)
+    legacy = JelinskiMorandaModel(solver="bisection").fit(boundary)
+    assert abs(fast.parameters["N0"] - legacy.parameters["N0"]) < 1e-3
+    assert np.isclose(JelinskiMorandaModel().fit_many([boundary])[0].parameters["N0"], fast.parameters["N0"])
+
+
+def test_jelinski_moranda_fit_many_matches_single_fits() -> None:
+    series = [
+        np.array([2.0, 3.0, 4.0, 5.0, 6.0]),
+        np.array([1.0, 1.5, 1.2, 2.5, 3.0, 4.5, 4.0, 7.0]),
+        np.array([5.0, 4.0, 3.0]),  # deteriorating: no finite MLE
+    ]
+    datasets = [
+        FailureDataset(
+            time_axis=np.arange(1, s.size + 1),
+            values=s,
+            series_type=FailureSeriesType.TIME_BETWEEN_FAILURES,
+        )
+        for s in series
+    ]
+
+    model = JelinskiMorandaModel()
+    batch = model.fit_many(datasets)
+
+    assert batch[2] is None
+    assert model.n0 == batch[1].parameters["N0"] and model.phi == batch[1].parameters["phi"]
+    for dataset, result in zip(datasets[:2], batch[:2]):
+        single = model.clone().fit(dataset)
+        assert result is not None
+        assert np.isclose(result.parameters["N0"], single.parameters["N0"], rtol=1e-8)
+        assert np.isclose(result.parameters["phi"], single.parameters["phi"], rtol=1e-8)
+        assert np.allclose(result.predictions, single.predictions)
+        for name, value in single.metrics.items():
+            assert np.isclose(result.metrics[name], value, equal_nan=True), name
+
+    actual = [dataset.values for dataset in datasets] + [datasets[0].values[::-1]]
+    predicted = [np.full(values.size, values.mean()) for values in actual]
+    batched = model.compute_metrics_many(actual, predicted)
+    assert batched == [model.compute_metrics(a, b) for a, b in zip(actual, predicted)]
+
+
+def test_nhpp_models_use_analytic_jacobians() -> None:
+    from zdp.models.goel_okumoto import _go_jacobian, _go_mean_value
+    from zdp.models.s_shaped import _s_shaped_jacobian, _s_shaped_mean_value
+
+    t = np.linspace(1, 40, num=20)
+    params = (80.0, 0.08)
+    step = 1e-6
+    for func, jac in ((_go_mean_value, _go_jacobian), (_s_shaped_mean_value, _s_shaped_jacobian)):
+        numeric = np.column_stack(
+            (
+                (func(t, params[0] + step, params[1]) - func(t, params[0] - step, params[1])) / (2 * step),
+                (func(t, params[0], params[1] + step) - func(t, params[0], params[1] - step)) / (2 * step),
+            )
+        )
+        assert np.allclose(jac(t, *params), numeric, rtol=1e-5, atol=1e-6)
+
+    counts = _s_shaped_mean_value(t, *params)
+    dataset = FailureDataset(time_axis=t, values=counts, series_type=FailureSeriesType.CUMULATIVE_FAILURES)
+    result = SShapedModel().fit(dataset)
+    optimizer = result.diagnostics["optimizer"]
+    assert optimizer["njev"] > 0
+    assert optimizer["nfev"] > 0
+
+
+def test_goel_okumoto_mle_matches_generating_parameters() -> None:
+    time_axis = np.arange(1, 41, dtype=float)
+    a_true, b_true = 120.0, 0.06
+    counts = np.round(a_true * (1.0 - np.exp(-b_true * time_axis)))
+    dataset = FailureDataset(time_axis=time_axis, values=counts, series_type=FailureSeriesType.CUMULATIVE_FAILURES)
+
+    result = GoelOkumotoModel(fit_method="mle").fit(dataset)
+
+    assert abs(result.parameters["a"] - a_true) < 5.0
+    assert abs(result.parameters["b"] - b_true) < 0.01
+    # a is profiled out: the fitted mean passes through the final count.
+    assert np.isclose(result.predictions[-1], counts[-1])
+    log_likelihood = result.metrics["log_likelihood"]
+    assert np.isclose(result.metrics["aic"], 4 - 2 * log_likelihood)
+    assert result.diagnostics["optimizer"]["likelihood"] == "grouped"
+
+
+def test_s_shaped_mle_supports_exact_failure_times() -> None:
+    failure_times = np.array([3.0, 5.5, 7.0, 8.2, 9.1, 10.5, 11.0, 12.6, 14.0, 16.5, 19.0, 23.0, 30.0])
+    dataset = FailureDataset(
+        time_axis=failure_times,
+        values=np.arange(1, failure_times.size + 1),
+        series_type=FailureSeriesType.CUMULATIVE_FAILURES,
+        metadata={"exact_failure_times": True},
+    )
+
+    result = SShapedModel(fit_method="mle").fit(dataset)
+
+    assert result.diagnostics["optimizer"]["likelihood"] == "exact"
+    # Without the flag one failure per row is ambiguous (e.g. daily counts): grouped.
+    unflagged = SShapedModel(fit_method="mle").fit(dataset.with_metadata(exact_failure_times=False))
+    assert unflagged.diagnostics["optimizer"]["likelihood"] == "grouped"
+    assert result.parameters["a"] >= failure_times.size
+    assert result.parameters["b"] > 0
+    assert np.isfinite(result.metrics["bic"])
+
+
+def test_batched_bp_training_matches_torch_sgd() -> None:
+    from torch import nn
+
+    from zdp.models.bp_neural import train_networks_batched
+
+    inputs = [np.linspace(0, 1, 20, dtype=np.float32), np.linspace(0, 1, 12, dtype=np.float32)]
+    targets = [x**2 for x in inputs]
+    configs = [
+        BPConfig(hidden_size=8, epochs=40, learning_rate=0.05, momentum=0.9),
+        BPConfig(hidden_size=5, epochs=25, learning_rate=0.1, momentum=0.5),
+    ]
+    untrained = [BPConfig(hidden_size=c.hidden_size, epochs=0) for c in configs]
+
+    torch.manual_seed(3)
+    initial = train_networks_batched(inputs, targets, untrained)
+    torch.manual_seed(3)
+    trained = train_networks_batched(inputs, targets, configs)
+
+    for idx, config in enumerate(configs):
+        network = initial[idx].network
+        optimizer = torch.optim.SGD(network.parameters(), lr=config.learning_rate, momentum=config.momentum)
+        x = torch.tensor(inputs[idx]).view(-1, 1)
+        y = torch.tensor(targets[idx]).view(-1, 1)
+        reference = []
+        for _ in range(config.epochs):
+            optimizer.zero_grad()
+            loss = nn.MSELoss()(network(x), y)
+            loss.backward()
+            optimizer.step()
+            reference.append(loss.item())
+        assert trained[idx].epochs_run == config.epochs
+        assert np.allclose(trained[idx].loss_curve, reference, atol=1e-5)
+        for expected, actual in zip(network.parameters(), trained[idx].network.parameters()):
+            assert torch.allclose(expected, actual, atol=1e-5)
+
+
+def test_bp_early_stopping_records_epochs_and_reason() -> None:
+    torch.manual_seed(0)
+    time_axis = np.linspace(0, 1, num=40)
+    counts = 15 * time_axis + 5
+    dataset = FailureDataset(time_axis=time_axis, values=counts, series_type=FailureSeriesType.CUMULATIVE_FAILURES)
+    config = BPConfig(
+        hidden_size=6, epochs=5000, learning_rate=0.08, momentum=0.7, patience=3, min_delta=1e-4, check_every=20
+    )
+
+    result = BPNeuralNetworkModel(config).fit(dataset)
+    optimizer = result.diagnostics["optimizer"]
+    assert optimizer["stop_reason"] == "plateau"
+    assert optimizer["iterations"] < config.epochs
+
+    batched = BPNeuralNetworkModel(config).fit_many([dataset, dataset.slice(30)])
+    for item in batched:
+        assert item.diagnostics["optimizer"]["stop_reason"] == "plateau"
+        assert item.diagnostics["optimizer"]["iterations"] < config.epochs
+
+
+def test_precomputed_svr_matches_rbf_pipeline_and_shares_gram_matrix() -> None:
+    from zdp.models.kernels import GramCache
+
+    time_axis = np.linspace(0, 5, num=30)
+    counts = 3 * time_axis**2 + 2
+    dataset = FailureDataset(time_axis=time_axis, values=counts, series_type=FailureSeriesType.CUMULATIVE_FAILURES)
+
+    rbf = SupportVectorRegressionModel(SVRConfig(kernel="rbf", c=200.0, epsilon=0.001)).fit(dataset)
+    pre = SupportVectorRegressionModel(SVRConfig(kernel="precomputed", c=200.0, epsilon=0.001)).fit(dataset)
+    assert np.allclose(rbf.predictions, pre.predictions, atol=1e-8)
+
+    hybrid = EMDHybridModel(HybridConfig(svr_kernel="rbf")).fit(dataset)
+    hybrid_pre = EMDHybridModel(HybridConfig(svr_kernel="precomputed")).fit(dataset)
+    assert np.allclose(hybrid.predictions, hybrid_pre.predictions, atol=1e-8)
+
+    model = SupportVectorRegressionModel(SVRConfig(kernel="precomputed", c=200.0, epsilon=0.001))
+    forecasts, _ = model.walk_forward_forecasts(dataset, [12, 20], 2)
+    for stop, forecast in zip([12, 20], forecasts):
+        single = model.clone().fit(dataset.slice(stop), evaluation_times=time_axis[stop : stop + 2])
+        assert np.array_equal(forecast, single.predictions)
+
+    from zdp.models import CancelToken, FitCancelled
+
+    model.cancel_token = CancelToken()
+    model.cancel_token.cancel()
+    with pytest.raises(FitCancelled):
+        model.walk_forward_forecasts(dataset, [12, 20], 2)
+
+    cache = GramCache()
+    full = cache.gram(time_axis, 0.5)
+    prefix = cache.gram(time_axis[:20], 0.5)
+    assert cache.misses == 1 and cache.hits == 1
+    assert np.shares_memory(full, prefix)
+    assert not prefix.flags.writeable
+
+
+def test_hybrid_parallel_components_match_sequential_fit() -> None:
+    time_axis = np.linspace(0, 10, num=60)
+    counts = 10 + 2 * np.sin(time_axis) + 0.3 * time_axis
+    dataset = FailureDataset(time_axis=time_axis, values=counts, series_type=FailureSeriesType.CUMULATIVE_FAILURES)
+
+    sequential = EMDHybridModel(HybridConfig(max_workers=1)).fit(dataset)
+    parallel = EMDHybridModel(HybridConfig(max_workers=4)).fit(dataset)
+    assert np.array_equal(sequential.predictions, parallel.predictions)
+
+    components = parallel.diagnostics["components"]
+    assert components[-1]["kind"] == "gm_residue"
+    assert len(components) == sequential.parameters["imfs"] + 1
+    assert all(entry["seconds"] >= 0.0 for entry in components)
@@ -1,7 +1,9 @@
+import asyncio
 import io
 
 import numpy as np
 import pandas as pd
+import pytest
 
 from zdp.cli import run_cli
 from zdp.data import FailureDataset, FailureSeriesType
@@ -111,3 +113,438 @@ def test_cli_can_export_and_replay_experiment_zip(tmp_path) -> None:
     assert code2 == 0
     assert "CV_RMSE" in stdout2.getvalue()
     assert stderr2.getvalue() == ""
+
+
+def test_walk_forward_warm_start_matches_cold_start_and_reports_iterations() -> None:
+    from zdp.models import SShapedModel
+    from zdp.services.validation import walk_forward_validate
+
+    time_axis = np.arange(1, 41, dtype=float)
+    counts = 80.0 * (1.0 - (1.0 + 0.1 * time_axis) * np.exp(-0.1 * time_axis))
+    counts = counts + 0.3 * np.sin(time_axis)
+    dataset = FailureDataset(time_axis=time_axis, values=counts, series_type=FailureSeriesType.CUMULATIVE_FAILURES)
+
+    cold_metrics, cold_diag = walk_forward_validate(
+        SShapedModel(), dataset, WalkForwardConfig(min_train_size=20)
+    )
+    warm_metrics, warm_diag = walk_forward_validate(
+        SShapedModel(), dataset, WalkForwardConfig(min_train_size=20, warm_start=True)
+    )
+
+    assert warm_diag["cv_warm_start"] is True
+    assert len(warm_diag["cv_split_iterations"]) == warm_diag["cv_attempted"]
+    assert all(count is not None for count in warm_diag["cv_split_iterations"])
+    assert sum(warm_diag["cv_split_iterations"]) <= sum(cold_diag["cv_split_iterations"])
+    assert np.isclose(warm_metrics["cv_rmse"], cold_metrics["cv_rmse"], rtol=1e-4)
+
+
+def test_gm_walk_forward_fast_path_matches_per_split_fits() -> None:
+    from zdp.models import GM11Model
+    from zdp.services.validation import walk_forward_validate
+
+    time_axis = np.arange(1, 31, dtype=float)
+    counts = np.cumsum(10.0 * np.exp(-time_axis / 12.0) + 0.5 * np.cos(time_axis))
+    dataset = FailureDataset(time_axis=time_axis, values=counts, series_type=FailureSeriesType.CUMULATIVE_FAILURES)
+    config = WalkForwardConfig(min_train_size=8, horizon=2)
+
+    metrics, diag = walk_forward_validate(GM11Model(), dataset, config)
+
+    assert diag["cv_fast_path"] == "gm11_prefix_sums"
+    assert diag["cv_used"] == diag["cv_attempted"]
+    expected = []
+    for stop in range(8, counts.size - 1):
+        res = GM11Model().fit(dataset.slice(stop), evaluation_times=time_axis[: stop + 2])
+        expected.append(res.predictions[stop : stop + 2])
+    truth = np.concatenate([counts[stop : stop + 2] for stop in range(8, counts.size - 1)])
+    rmse = float(np.sqrt(np.mean((truth - np.concatenate(expected)) ** 2)))
+    assert np.isclose(metrics["cv_rmse"], rmse, rtol=1e-9)
+
+
+def test_analysis_service_process_pool_matches_sequential_ranking() -> None:
+    from zdp.models import GM11Model, SShapedModel
+
+    time_axis = np.arange(1, 21, dtype=float)
+    counts = 40.0 * (1.0 - np.exp(-0.08 * time_axis))
+    dataset = FailureDataset(time_axis=time_axis, values=counts, series_type=FailureSeriesType.CUMULATIVE_FAILURES)
+    models = [GoelOkumotoModel(), SShapedModel(), GM11Model()]
+    validation = WalkForwardConfig(enabled=True, min_train_size=12, horizon=1)
+
+    sequential = AnalysisService(models).run(dataset, validation=validation, prediction_interval_alpha=0.05)
+    parallel = AnalysisService(models, max_workers=2).run(dataset, validation=validation, prediction_interval_alpha=0.05)
+
+    assert [item.result.model_name for item in parallel] == [item.result.model_name for item in sequential]
+    for left, right in zip(sequential, parallel):
+        assert left.result.metrics == right.result.metrics
+        assert np.array_equal(left.result.predictions, right.result.predictions)
+
+
+def test_parallel_walk_forward_splits_are_bit_identical() -> None:
+    from zdp.services.validation import walk_forward_validate
+
+    time_axis = np.arange(1, 25, dtype=float)
+    counts = 40.0 * (1.0 - np.exp(-0.08 * time_axis)) + 0.3 * np.sin(time_axis)
+    dataset = FailureDataset(time_axis=time_axis, values=counts, series_type=FailureSeriesType.CUMULATIVE_FAILURES)
+    model = GoelOkumotoModel()
+
+    seq_metrics, seq_diag = walk_forward_validate(model, dataset, WalkForwardConfig(min_train_size=12, horizon=2))
+    par_metrics, par_diag = walk_forward_validate(
+        model, dataset, WalkForwardConfig(min_train_size=12, horizon=2, workers=2)
+    )
+
+    assert seq_diag["cv_used"] > 0
+    assert par_metrics == seq_metrics
+    assert par_diag["cv_split_iterations"] == seq_diag["cv_split_iterations"]
+
+
+def test_walk_forward_does_not_nest_pools_inside_pool_workers(monkeypatch) -> None:
+    from zdp.services import parallel, validation
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("split pool started inside a pool worker")
+
+    monkeypatch.setattr(parallel, "_IN_WORKER", True)
+    monkeypatch.setattr(validation, "_parallel_splits", no_pool)
+    time_axis = np.arange(1, 16, dtype=float)
+    counts = 40.0 * (1.0 - np.exp(-0.08 * time_axis))
+    dataset = FailureDataset(time_axis=time_axis, values=counts, series_type=FailureSeriesType.CUMULATIVE_FAILURES)
+
+    metrics, _ = validation.walk_forward_validate(GoelOkumotoModel(), dataset, WalkForwardConfig(workers=4))
+
+    assert np.isfinite(metrics["cv_rmse"])
+
+
+def test_iter_run_streams_completions_then_returns_ranked_list() -> None:
+    from zdp.models import GM11Model
+    from zdp.services import ModelCompletion
+
+    time_axis = np.arange(1, 16, dtype=float)
+    counts = 40.0 * (1.0 - np.exp(-0.08 * time_axis))
+    dataset = FailureDataset(time_axis=time_axis, values=counts, series_type=FailureSeriesType.CUMULATIVE_FAILURES)
+    service = AnalysisService([GoelOkumotoModel(), GM11Model()])
+
+    stream = service.iter_run(dataset)
+    completions = []
+    while True:
+        try:
+            completions.append(next(stream))
+        except StopIteration as stop:
+            final = stop.value
+            break
+    assert all(isinstance(item, ModelCompletion) for item in completions)
+    assert [item.index for item in completions] == [0, 1]
+    assert all(item.seconds > 0 for item in completions)
+    assert all("elapsed_seconds" not in (item.result.diagnostics or {}) for item in completions)
+    assert [r.result.model_name for r in final] == [r.result.model_name for r in service.run(dataset)]
+
+
+class _LabelledModel(GoelOkumotoModel):
+    """GO variant with a required constructor argument, so the default clone() fails."""
+
+    def __init__(self, label: str) -> None:
+        super().__init__()
+        self.name = label
+
+
+def test_arun_matches_run_and_cancels_with_the_task() -> None:
+    from zdp.models import BPConfig, BPNeuralNetworkModel, JelinskiMorandaModel
+
+    time_axis = np.arange(1, 16, dtype=float)
+    counts = 40.0 * (1.0 - np.exp(-0.08 * time_axis))
+    dataset = FailureDataset(time_axis=time_axis, values=counts, series_type=FailureSeriesType.CUMULATIVE_FAILURES)
+    service = AnalysisService([GoelOkumotoModel(), JelinskiMorandaModel(), _LabelledModel("GO (plugin)")])
+    expected = service.run(dataset)
+
+    async def concurrent() -> list:
+        return await asyncio.gather(service.arun(dataset), service.arun(dataset))
+
+    for ranked in asyncio.run(concurrent()):
+        assert [item.result.model_name for item in ranked] == [item.result.model_name for item in expected]
+        np.testing.assert_equal([item.result.metrics for item in ranked], [item.result.metrics for item in expected])
+
+    slow = AnalysisService([BPNeuralNetworkModel(BPConfig(epochs=10_000_000))])
+
+    async def cancelled() -> None:
+        task = asyncio.create_task(slow.arun(dataset))
+        await asyncio.sleep(0.2)
+        task.cancel()
+        await task
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(cancelled())
+
+
+class _SleepyModel(GoelOkumotoModel):
+    """GO variant whose fit blocks without ever checking its cancel token."""
+
+    name = "Sleepy"
+
+    def _fit(self, dataset, *, evaluation_times=None):
+        import time
+
+        time.sleep(60)
+        return super()._fit(dataset, evaluation_times=evaluation_times)
+
+
+def test_model_budget_skips_slow_models_with_reason() -> None:
+    from zdp.models import BPConfig, BPNeuralNetworkModel
+
+    time_axis = np.arange(1, 16, dtype=float)
+    counts = 40.0 * (1.0 - np.exp(-0.08 * time_axis))
+    dataset = FailureDataset(time_axis=time_axis, values=counts, series_type=FailureSeriesType.CUMULATIVE_FAILURES)
+    slow_bp = BPNeuralNetworkModel(BPConfig(epochs=10_000_000))
+    service = AnalysisService([slow_bp, GoelOkumotoModel()], model_budget=0.3)
+
+    ranked = service.run(dataset)
+
+    assert [item.result.model_name for item in ranked] == [GoelOkumotoModel.name]
+    (entry,) = service.diagnostics["skipped"]
+    assert entry["model"] == BPNeuralNetworkModel.name
+    assert entry["reason"] == "timeout"
+    assert entry["seconds"] < 5
+    assert slow_bp.cancel_token is None
+
+
+def test_run_budget_kills_uncooperative_pool_workers() -> None:
+    import time
+
+    time_axis = np.arange(1, 16, dtype=float)
+    counts = 40.0 * (1.0 - np.exp(-0.08 * time_axis))
+    dataset = FailureDataset(time_axis=time_axis, values=counts, series_type=FailureSeriesType.CUMULATIVE_FAILURES)
+    service = AnalysisService([_SleepyModel(), _SleepyModel()], max_workers=2, run_budget=0.5)
+
+    start = time.perf_counter()
+    assert service.run(dataset) == []
+    assert time.perf_counter() - start < 30
+    reasons = [entry["reason"] for entry in service.diagnostics["skipped"]]
+    assert reasons == ["timeout", "timeout"]
+
+
+def test_model_budget_on_a_pool_is_timed_per_model_from_its_start() -> None:
+    time_axis = np.arange(1, 16, dtype=float)
+    counts = 40.0 * (1.0 - np.exp(-0.08 * time_axis))
+    dataset = FailureDataset(time_axis=time_axis, values=counts, series_type=FailureSeriesType.CUMULATIVE_FAILURES)
+    sleepy = _SleepyModel()
+    service = AnalysisService([sleepy, GoelOkumotoModel(), _SleepyModel()], max_workers=2, model_budget=0.5)
+
+    ranked = service.run(dataset)
+
+    assert [item.result.model_name for item in ranked] == [GoelOkumotoModel.name]
+    entries = service.diagnostics["skipped"]
+    assert [entry["reason"] for entry in entries] == ["timeout", "timeout"]
+    assert all(1.5 <= entry["seconds"] < 10 for entry in entries)
+    assert sleepy.cancel_token is None
+
+
+def test_fit_cache_round_trips_results_and_recomputes_intervals(tmp_path, monkeypatch) -> None:
+    from zdp.models import BPConfig, BPNeuralNetworkModel, JelinskiMorandaModel
+    from zdp.services import FitCache
+
+    time_axis = np.arange(1, 16, dtype=float)
+    counts = 40.0 * (1.0 - np.exp(-0.08 * time_axis))
+    dataset = FailureDataset(time_axis=time_axis, values=counts, series_type=FailureSeriesType.CUMULATIVE_FAILURES)
+    validation = WalkForwardConfig(enabled=True, min_train_size=10, horizon=1)
+    cache = FitCache(tmp_path)
+    models = [GoelOkumotoModel(), BPNeuralNetworkModel(BPConfig(epochs=50)), JelinskiMorandaModel()]
+
+    first = AnalysisService(models, cache=cache).run(dataset, validation=validation)
+    assert (cache.hits, cache.misses) == (0, 2)
+
+    second = AnalysisService(models, cache=cache).run(dataset, validation=validation, prediction_interval_alpha=0.1)
+    assert (cache.hits, cache.misses) == (2, 2)
+    for left, right in zip(first, second):
+        assert left.result.model_name == right.result.model_name
+        np.testing.assert_equal(dict(left.result.metrics), dict(right.result.metrics))
+        assert np.array_equal(left.result.predictions, right.result.predictions)
+        assert right.result.diagnostics["fit_cache"] == "hit"
+        assert right.result.diagnostics["prediction_interval"]["alpha"] == 0.1
+
+    AnalysisService([GoelOkumotoModel(fit_method="mle")], cache=cache).run(dataset, validation=validation)
+    assert cache.misses == 3
+
+    small = FitCache(tmp_path, max_bytes=1)
+    small.put("x", first[0].result)
+    assert list(tmp_path.glob("*.npz")) == []
+
+    blocked = tmp_path / "not-a-dir"
+    blocked.write_text("")
+    assert FitCache(blocked).put("x", first[0].result) is False
+    assert AnalysisService(models[:1], cache=FitCache(blocked)).run(dataset)
+
+    def fail_replace(*args) -> None:
+        raise PermissionError("read-only")
+
+    monkeypatch.setattr("os.replace", fail_replace)
+    assert cache.put("y", first[0].result) is False
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+def test_fit_cache_keys_follow_plugin_settings_and_ignore_worker_counts() -> None:
+    from zdp.models import EMDHybridModel, HybridConfig, ReliabilityModel
+    from zdp.services.cache import fit_cache_key
+
+    class PluginModel(ReliabilityModel):
+        def __init__(self, smoothing: float = 0.5) -> None:
+            self.smoothing = smoothing
+
+        def _fit(self, dataset, *, evaluation_times=None):
+            raise NotImplementedError
+
+    dataset = FailureDataset(
+        time_axis=np.arange(1, 11, dtype=float),
+        values=np.arange(1, 11, dtype=float),
+        series_type=FailureSeriesType.CUMULATIVE_FAILURES,
+    )
+    validation = WalkForwardConfig(enabled=False)
+
+    def key(model):
+        return fit_cache_key(model, dataset, evaluation_times=None, validation=validation)
+
+    assert key(PluginModel(0.5)) == key(PluginModel(0.5)) != key(PluginModel(0.9))
+    opaque = PluginModel()
+    opaque.weights = np.ones(3)
+    assert key(opaque) is None
+    assert key(EMDHybridModel(HybridConfig(max_workers=1))) == key(EMDHybridModel(HybridConfig(max_workers=4)))
+
+    from zdp.services import FitMemo
+
+    go = GoelOkumotoModel(fit_method="mle")
+    exact = dataset.with_metadata(exact_failure_times=True)
+    moved = dataset.with_metadata(path="elsewhere.csv")
+    assert key(go) == fit_cache_key(go, moved, evaluation_times=None, validation=validation)
+    assert key(go) != fit_cache_key(go, exact, evaluation_times=None, validation=validation)
+    events = FailureDataset(
+        time_axis=np.array([3.0, 7.0, 12.0, 20.0, 26.0, 35.0, 47.0, 61.0, 80.0, 104.0]),
+        values=np.arange(1, 11, dtype=float),
+        series_type=FailureSeriesType.CUMULATIVE_FAILURES,
+    )
+    memo = FitMemo()
+    grouped_fit = memo.fit(go, events, events.size)
+    exact_fit = memo.fit(go, events.with_metadata(exact_failure_times=True), events.size)
+    assert grouped_fit.parameters != exact_fit.parameters
+
+
+def test_fit_memo_reuses_fits_across_postprocessing_changes() -> None:
+    from zdp.services import FitMemo
+
+    calls = {"count": 0}
+
+    class CountingGO(GoelOkumotoModel):
+        def clone(self):
+            return CountingGO()
+
+        def _fit(self, dataset, *, evaluation_times=None):
+            calls["count"] += 1
+            return super()._fit(dataset, evaluation_times=evaluation_times)
+
+    time_axis = np.arange(1, 16, dtype=float)
+    counts = 40.0 * (1.0 - np.exp(-0.08 * time_axis))
+    dataset = FailureDataset(time_axis=time_axis, values=counts, series_type=FailureSeriesType.CUMULATIVE_FAILURES)
+    memo = FitMemo()
+    validation = WalkForwardConfig(enabled=True, min_train_size=10, horizon=1)
+
+    first = AnalysisService([CountingGO()], memo=memo).run(dataset, validation=validation)
+    fits = calls["count"]
+    assert fits == 1 + 5
+
+    again = AnalysisService([CountingGO()], memo=memo).run(
+        dataset, validation=validation, rank_by="cv_mae", prediction_interval_alpha=0.2
+    )
+    assert calls["count"] == fits
+    assert again[0].result.metrics["cv_rmse"] == first[0].result.metrics["cv_rmse"]
+    assert "prediction_interval" in again[0].result.diagnostics
+
+    AnalysisService([CountingGO()], memo=memo).run(
+        dataset, validation=WalkForwardConfig(enabled=True, min_train_size=8, horizon=1)
+    )
+    assert calls["count"] == fits + 2
+
+
+def test_run_many_streams_fleet_results_to_jsonl_and_parquet(tmp_path) -> None:
+    import json
+
+    from zdp.models import GM11Model, JelinskiMorandaModel
+
+    rng = np.random.default_rng(3)
+    fleet = {}
+    for idx in range(7):
+        time_axis = np.arange(1, 16, dtype=float)
+        counts = (30.0 + idx) * (1.0 - np.exp(-0.08 * time_axis)) + rng.normal(0, 0.2, time_axis.size)
+        fleet[f"unit-{idx}"] = FailureDataset(
+            time_axis=time_axis, values=np.maximum.accumulate(counts), series_type=FailureSeriesType.CUMULATIVE_FAILURES
+        )
+    fleet["tbf"] = FailureDataset(
+        time_axis=np.arange(1, 7, dtype=float),
+        values=np.array([2.0, 3.0, 4.0, 5.0, 6.0, 7.0]),
+        series_type=FailureSeriesType.TIME_BETWEEN_FAILURES,
+    )
+    service = AnalysisService([GoelOkumotoModel(), GM11Model(), JelinskiMorandaModel()])
+
+    summary = service.run_many(fleet, sink=tmp_path / "fleet.jsonl", batch_size=3, group_size=2)
+
+    assert summary.datasets == 8
+    assert summary.fits == 7 * 2 + 1
+    assert summary.fits_per_second > 0
+    rows = [json.loads(line) for line in (tmp_path / "fleet.jsonl").read_text().splitlines()]
+    assert len(rows) == summary.fits + summary.failed
+    single = service.run(fleet["unit-4"])
+    unit_rows = sorted((row for row in rows if row["dataset"] == "unit-4"), key=lambda row: row["rank"])
+    assert [row["model"] for row in unit_rows] == [item.result.model_name for item in single]
+
+    service.run_many(fleet, sink=tmp_path / "fleet.parquet")
+    frame = pd.read_parquet(tmp_path / "fleet.parquet")
+    assert len(frame) == summary.fits + summary.failed
+    assert "metric_rmse" in frame.columns
+
+
+def test_parquet_sink_keeps_types_and_columns_across_row_groups(tmp_path) -> None:
+    from zdp.services.sinks import ParquetSink
+
+    def row(name: str, model: str, *, error=None, metrics=None, parameters=None) -> dict:
+        rank = None if error else 1
+        return {"dataset": name, "model": model, "rank": rank, "error": error,
+                "metrics": metrics or {}, "parameters": parameters or {}}
+
+    with ParquetSink(tmp_path / "rows.parquet", row_group_size=2) as sink:
+        sink.write(row("d0", "GO", metrics={"rmse": 0.5}, parameters={"a": 1}))
+        sink.write(row("d1", "GO", metrics={"rmse": 0.4}, parameters={"a": 1}))
+        sink.write(row("d2", "JM", error="RuntimeError: boom"))
+        sink.write(row("d3", "BP", metrics={"rmse": 0.1, "aic": 3.0}, parameters={"a": "tanh"}))
+    assert not [path for path in tmp_path.iterdir() if path.name != "rows.parquet"]
+
+    frame = pd.read_parquet(tmp_path / "rows.parquet")
+    assert list(frame["dataset"]) == ["d0", "d1", "d2", "d3"]
+    assert frame["error"].iloc[2] == "RuntimeError: boom"
+    assert pd.isna(frame["rank"].iloc[2])
+    assert np.isnan(frame["metric_aic"].iloc[0]) and frame["metric_aic"].iloc[3] == 3.0
+    assert frame["param_a"].iloc[3] == "tanh" and pd.isna(frame["param_a"].iloc[2])
+    assert float(frame["param_a"].iloc[0]) == 1.0
+
+
+def test_iter_run_many_honours_cache_budgets_and_explains_skips(tmp_path) -> None:
+    from zdp.models import BPConfig, BPNeuralNetworkModel, JelinskiMorandaModel
+    from zdp.services import FitCache
+
+    time_axis = np.arange(1, 16, dtype=float)
+    fleet = {
+        f"unit-{idx}": FailureDataset(
+            time_axis=time_axis,
+            values=(30.0 + idx) * (1.0 - np.exp(-0.08 * time_axis)),
+            series_type=FailureSeriesType.CUMULATIVE_FAILURES,
+        )
+        for idx in range(3)
+    }
+    cache = FitCache(tmp_path)
+    models = [GoelOkumotoModel(), JelinskiMorandaModel(), BPNeuralNetworkModel(BPConfig(epochs=10_000_000))]
+    service = AnalysisService(models, model_budget=0.2, cache=cache)
+
+    first = list(service.iter_run_many(fleet))
+
+    for fleet_result in first:
+        assert [item.result.model_name for item in fleet_result.ranked] == [GoelOkumotoModel.name]
+        reasons = {entry["model"]: (entry["reason"], entry["detail"]) for entry in fleet_result.skipped}
+        assert reasons[JelinskiMorandaModel.name] == ("unsupported", "expects 'time_between_failures' data")
+        assert reasons[BPNeuralNetworkModel.name][0] == "timeout"
+
+    second = list(service.iter_run_many(fleet))
+    assert cache.hits == 3
+    assert all(item.ranked[0].result.diagnostics["fit_cache"] == "hit" for item in second)